@@ -0,0 +1,247 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Serialise typed columns of values without creating individual cells.
+
+The type of a column is inferred once from its dtype (NumPy arrays and
+pandas Series) and every value is then converted directly into the text
+for the XML stream.
+"""
+
+import datetime
+from math import isinf
+
+from openpyxl.compat import NUMERIC_TYPES
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE, TIME_FORMATS
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import WINDOWS_EPOCH
+from openpyxl.utils.exceptions import IllegalCharacterError
+from openpyxl.xml.functions import Element, SubElement, whitespace
+
+from ._writer import _shared_string, write_cell
+
+
+def _column_kind(values):
+    """
+    Return the Excel type for an array-like based on its dtype or None
+    if the values must be inspected individually
+    """
+    dtype = getattr(values, "dtype", None)
+    kind = getattr(dtype, "kind", None)
+    if kind is None:
+        return
+    elif kind in "iuf":
+        return "n"
+    elif kind == "b":
+        return "b"
+    elif kind == "M":
+        if getattr(dtype, "tz", None) is not None:
+            raise TypeError("Excel does not support timezones in datetimes. "
+                            "The tzinfo in the datetime/time object must be set to None.")
+        return "d"
+    elif kind == "m":
+        return "td"
+    elif kind in ("U", "S"):
+        return "s"
+
+
+def _to_numpy(values, kind=None):
+    """
+    Convert pandas objects to NumPy arrays with None or NaN for missing values
+    """
+    to_numpy = getattr(values, "to_numpy", None)
+    if to_numpy is None:
+        return values
+
+    import numpy
+    if kind in ("d", "td"):
+        return to_numpy()
+    elif kind == "n":
+        if isinstance(values.dtype, numpy.dtype):
+            return to_numpy()
+        return to_numpy(dtype="float64", na_value=float("nan"))
+    return to_numpy(dtype=object, na_value=None)
+
+
+def _serials(values, epoch):
+    """
+    Convert datetime64 values to Excel serials
+    """
+    import numpy
+    values = _to_numpy(values, "d").astype("datetime64[ms]")
+    serials = (values - numpy.datetime64(epoch, "ms")) / numpy.timedelta64(1, "D")
+    if epoch == WINDOWS_EPOCH:
+        # adjust for < 1900-03-01
+        days = numpy.floor(serials)
+        serials = numpy.where((days > 0) & (days <= 60), serials - 1, serials)
+    return serials.tolist()
+
+
+def _durations(values):
+    import numpy
+    values = _to_numpy(values, "td").astype("timedelta64[ms]")
+    return (values / numpy.timedelta64(1, "D")).tolist()
+
+
+def _numbers(values, data_type):
+    """
+    Write numbers in full: str() gives the shortest text which converts back
+    to the same float
+    """
+    for value in values:
+        if value is None or value != value or isinf(value): # NaN
+            yield
+        else:
+            yield data_type, str(value)
+
+
+def _booleans(values):
+    for value in values:
+        if value is None:
+            yield
+        else:
+            yield "b", "1" if value else "0"
+
+
+def _strings(wb, values):
+    for value in values:
+        if value is None or value == "":
+            yield
+            continue
+        if not isinstance(value, str):
+            value = str(value)
+        value = value[:32767]
+        if ILLEGAL_CHARACTERS_RE.search(value):
+            raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+        idx = _shared_string(wb, value)
+        if idx is None:
+            yield "inlineStr", value
+        else:
+            yield "s", f"{idx}"
+
+
+def _cells(ws, values, number_format=None):
+    """
+    Fallback for columns with mixed types
+    """
+    for value in values:
+        if value is None:
+            yield
+            continue
+        cell = WriteOnlyCell(ws, value)
+        if number_format is not None:
+            cell.number_format = number_format
+        yield cell
+
+
+def _style_id(ws, number_format):
+    cell = WriteOnlyCell(ws)
+    cell.number_format = number_format
+    return cell.style_id
+
+
+def _is_strings(values):
+    return all(isinstance(v, str) or v is None for v in values)
+
+
+def _is_numbers(values):
+    return all(
+        v is None or (isinstance(v, NUMERIC_TYPES) and not isinstance(v, bool))
+        for v in values
+    )
+
+
+def column_encoder(ws, values, number_format=None):
+    """
+    Return the style id for a column and a generator of (type, text) pairs
+    for its values. Missing values are returned as None. Columns whose type
+    cannot be determined generate cells instead.
+    """
+    wb = ws.parent
+    kind = _column_kind(values)
+
+    if kind == "d":
+        if wb.iso_dates:
+            kind = None
+            values = _to_numpy(values, "d").astype("datetime64[us]").astype(object)
+        else:
+            number_format = number_format or TIME_FORMATS[datetime.datetime]
+    elif kind == "td":
+        number_format = number_format or TIME_FORMATS[datetime.timedelta]
+
+    if kind in (None, "b"):
+        values = list(_to_numpy(values))
+        if kind == "b":
+            pass
+        elif _is_strings(values):
+            kind = "s"
+        elif _is_numbers(values):
+            kind = "n"
+        else:
+            return 0, _cells(ws, values, number_format)
+    elif kind in ("n", "s"):
+        values = _to_numpy(values, kind).tolist()
+
+    style_id = 0
+    if number_format is not None:
+        style_id = _style_id(ws, number_format)
+
+    if kind == "n":
+        return style_id, _numbers(values, "n")
+    elif kind == "b":
+        return style_id, _booleans(values)
+    elif kind == "d":
+        return style_id, _numbers(_serials(values, wb.epoch), "n")
+    elif kind == "td":
+        return style_id, _numbers(_durations(values), "n")
+    return style_id, _strings(wb, values)
+
+
+def write_columns(xf, ws, columns, number_formats=()):
+    """
+    Write the rows formed by a sequence of columns of equal length to the
+    stream after the last row of the worksheet. The last row and column are
+    updated as each row is written.
+    """
+    number_formats = list(number_formats or ())
+    number_formats.extend([None] * (len(columns) - len(number_formats)))
+
+    styles = []
+    encoders = []
+    for values, fmt in zip(columns, number_formats):
+        style_id, encoder = column_encoder(ws, values, fmt)
+        styles.append(f"{style_id}" if style_id else None)
+        encoders.append(encoder)
+
+    max_col = len(columns)
+    letters = [get_column_letter(idx) for idx in range(1, max_col + 1)]
+    dims = ws.row_dimensions
+
+    for row in zip(*encoders):
+        row_idx = ws._max_row + 1
+        attrs = {'r': f"{row_idx}"}
+        attrs.update(dims.get(row_idx, {}))
+        with xf.element("row", attrs):
+            for col_idx, item in enumerate(row):
+                if item is None:
+                    continue
+                if not isinstance(item, tuple):
+                    item.row = row_idx
+                    item.column = col_idx + 1
+                    write_cell(xf, ws, item, item.has_style)
+                    continue
+                data_type, text = item
+                attrs = {'r': f"{letters[col_idx]}{row_idx}", 't': data_type}
+                if styles[col_idx]:
+                    attrs['s'] = styles[col_idx]
+                el = Element("c", attrs)
+                if data_type == "inlineStr":
+                    node = SubElement(SubElement(el, "is"), "t")
+                    node.text = text
+                    whitespace(node)
+                else:
+                    SubElement(el, "v").text = text
+                xf.write(el)
+        ws._max_row = row_idx
+        ws._max_col = max(ws._max_col, max_col)
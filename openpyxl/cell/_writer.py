@@ -6,9 +6,39 @@ from openpyxl import LXML
 from openpyxl.utils.datetime import to_excel, to_ISO8601
 from datetime import timedelta
 
-from openpyxl.worksheet.formula import DataTableFormula, ArrayFormula
+from openpyxl.worksheet.formula import DataTableFormula, ArrayFormula, SharedFormula
 from openpyxl.cell.rich_text import CellRichText
 
+
+def _shared_string(wb, value):
+    """
+    Return the index of a string in the workbook's shared string table or
+    None if the string should be written inline
+    """
+    if wb.inline_strings:
+        return
+    table = wb.shared_strings
+    limit = wb.max_shared_strings
+    if limit is not None and len(table) >= limit and value not in table:
+        return
+    return table.add(value)
+
+
+def _shared_formula(worksheet, cell, formula):
+    """
+    Return the attributes and text of a formula shared with other cells.
+    The formula is only written as shared if the first cell of the range
+    still has it, otherwise the cell gets its own formula.
+    """
+    if formula.ref:
+        first = worksheet._cells.get((formula.row, formula.column))
+        if first is not None and first._value is formula:
+            if first.row == cell.row and first.column == cell.column:
+                return dict(formula), formula.text
+            return {'t': "shared", 'si': formula.si}, None
+    return {}, formula.formula(cell.row, cell.column)
+
+
 def _set_attributes(cell, styled=None):
     """
     Set coordinate and datatype
@@ -18,13 +48,18 @@ def _set_attributes(cell, styled=None):
     if styled:
         attrs['s'] = f"{cell.style_id}"
 
+    value = cell._value
+
     if cell.data_type == "s":
         attrs['t'] = "inlineStr"
+        if value and isinstance(value, str):
+            idx = _shared_string(cell.parent.parent, value)
+            if idx is not None:
+                attrs['t'] = "s"
+                value = idx
     elif cell.data_type != 'f':
         attrs['t'] = cell.data_type
 
-    value = cell._value
-
     if cell.data_type == "d":
         if hasattr(value, "tzinfo") and value.tzinfo is not None:
             raise TypeError("Excel does not support timezones in datetimes. "
@@ -37,6 +72,7 @@ def _set_attributes(cell, styled=None):
             value = to_excel(value, cell.parent.parent.epoch)
 
     if cell.hyperlink:
+        cell.hyperlink.ref = coordinate # the cell may have been moved
         cell.parent._hyperlinks.append(cell.hyperlink)
 
     return value, attrs
@@ -62,12 +98,15 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
             attrib = dict(value)
             value = None
 
+        elif isinstance(value, SharedFormula):
+            attrib, value = _shared_formula(worksheet, cell, value)
+
         formula = SubElement(el, 'f', attrib)
         if value is not None and not attrib.get('t') == "dataTable":
             formula.text = value[1:]
             value = None
 
-    if cell.data_type == 's':
+    if attributes.get('t') == "inlineStr":
         if isinstance(value, CellRichText):
             el.append(value.to_tree())
         else:
@@ -105,12 +144,15 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                 attrib = dict(value)
                 value = None
 
+            elif isinstance(value, SharedFormula):
+                attrib, value = _shared_formula(worksheet, cell, value)
+
             with xf.element('f', attrib):
                 if value is not None and not attrib.get('t') == "dataTable":
                     xf.write(value[1:])
                     value = None
 
-        if cell.data_type == 's':
+        if attributes.get('t') == "inlineStr":
             if isinstance(value, CellRichText):
                 el = value.to_tree()
                 xf.write(el)
@@ -26,7 +26,7 @@ from openpyxl.utils import get_column_letter
 from openpyxl.styles import numbers, is_date_format
 from openpyxl.styles.styleable import StyleableObject
 from openpyxl.worksheet.hyperlink import Hyperlink
-from openpyxl.worksheet.formula import DataTableFormula, ArrayFormula
+from openpyxl.worksheet.formula import DataTableFormula, ArrayFormula, SharedFormula
 from openpyxl.cell.rich_text import CellRichText
 
 # constants
@@ -210,7 +210,10 @@ class Cell(StyleableObject):
         :type: depends on the value (string, float, int or
             :class:`datetime.datetime`)
         """
-        return self._value
+        value = self._value
+        if value.__class__ is SharedFormula:
+            return value.formula(self.row, self.column)
+        return value
 
     @value.setter
     def value(self, value):
@@ -219,8 +222,9 @@ class Cell(StyleableObject):
 
     @property
     def internal_value(self):
-        """Always returns the value for excel."""
-        return self._value
+        """Always returns the value for excel. Shared formulae are returned
+        translated for the cell."""
+        return self.value
 
     @property
     def hyperlink(self):
@@ -46,7 +46,7 @@ def write_cell_implementation(request, etree_write_cell, lxml_write_cell):
                              (1234567890, """<c t="n" r="A1"><v>1234567890</v></c>"""),
                              ("=sum(1+1)", """<c r="A1"><f>sum(1+1)</f><v></v></c>"""),
                              (True, """<c t="b" r="A1"><v>1</v></c>"""),
-                             ("Hello", """<c t="inlineStr" r="A1"><is><t>Hello</t></is></c>"""),
+                             ("Hello", """<c t="s" r="A1"><v>0</v></c>"""),
                              ("", """<c r="A1" t="inlineStr"></c>"""),
                              (None, """<c r="A1" t="n"></c>"""),
                          ])
@@ -159,7 +159,7 @@ def test_write_hyperlink(worksheet, write_cell_implementation):
 
 @pytest.mark.parametrize("value, result, attrs",
                          [
-                             ("test", "test", {'r': 'A1', 't': 'inlineStr'}),
+                             ("test", 0, {'r': 'A1', 't': 's'}),
                              ("=SUM(A1:A2)", "=SUM(A1:A2)", {'r': 'A1'}),
                              (datetime.date(2018, 8, 25), 43337, {'r':'A1', 't':'n'}),
                          ]
@@ -174,9 +174,57 @@ def test_attributes(worksheet, value, result, attrs):
     assert(_set_attributes(cell)) == (result, attrs)
 
 
+def test_inline_strings(worksheet, write_cell_implementation):
+    write_cell = write_cell_implementation
+    ws = worksheet
+    ws.parent.inline_strings = True
+    cell = ws['A1']
+    cell.value = "Hello"
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, cell)
+
+    expected = """<c t="inlineStr" r="A1"><is><t>Hello</t></is></c>"""
+    xml = out.getvalue()
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+    assert ws.parent.shared_strings == []
+
+
+def test_shared_strings(worksheet):
+    from .._writer import _set_attributes
+
+    ws = worksheet
+    ws['A1'] = "Hello"
+    ws['A2'] = "World"
+    ws['A3'] = "Hello"
+
+    assert [_set_attributes(c)[0] for c in ws['A']] == [0, 1, 0]
+    assert ws.parent.shared_strings == ["Hello", "World"]
+
+
+def test_max_shared_strings(worksheet):
+    from .._writer import _set_attributes
+
+    ws = worksheet
+    ws.parent.max_shared_strings = 1
+    ws['A1'] = "Hello"
+    ws['A2'] = "World"
+    ws['A3'] = "Hello"
+
+    assert [_set_attributes(c) for c in ws['A']] == [
+        (0, {'r': 'A1', 't': 's'}),
+        ("World", {'r': 'A2', 't': 'inlineStr'}),
+        (0, {'r': 'A3', 't': 's'}),
+    ]
+    assert ws.parent.shared_strings == ["Hello"]
+
+
 def test_whitespace(worksheet, write_cell_implementation):
     write_cell = write_cell_implementation
     ws = worksheet
+    ws.parent.inline_strings = True
     cell = ws['A1']
     cell.value = "  whitespace   "
 
@@ -195,7 +243,7 @@ def test_whitespace(worksheet, write_cell_implementation):
     assert diff is None, diff
 
 
-from openpyxl.worksheet.formula import DataTableFormula, ArrayFormula
+from openpyxl.worksheet.formula import DataTableFormula, ArrayFormula, SharedFormula
 
 def test_table_formula(worksheet, write_cell_implementation):
     write_cell = write_cell_implementation
@@ -239,6 +287,49 @@ def test_array_formula(worksheet, write_cell_implementation):
     assert diff is None, diff
 
 
+@pytest.mark.parametrize("coordinate, expected",
+                         [
+                             ("C2", """<c r="C2"><f t="shared" ref="C2:C4" si="0">A2*2</f><v/></c>"""),
+                             ("C3", """<c r="C3"><f t="shared" si="0"/><v/></c>"""),
+                         ]
+                         )
+def test_shared_formula(worksheet, write_cell_implementation, coordinate, expected):
+    write_cell = write_cell_implementation
+    ws = worksheet
+    formula = SharedFormula(ref="C2:C4", si="0", text="=A2*2", row=2, column=3)
+    for row in range(2, 5):
+        cell = ws.cell(row=row, column=3)
+        cell._value = formula
+        cell.data_type = "f"
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, ws[coordinate])
+
+    xml = out.getvalue()
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+def test_shared_formula_changed(worksheet, write_cell_implementation):
+    write_cell = write_cell_implementation
+    ws = worksheet
+    formula = SharedFormula(ref="C2:C4", si="0", text="=A2*2", row=2, column=3)
+    cell = ws["C3"]
+    cell._value = formula
+    cell.data_type = "f"
+    ws["C2"] = 5
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, cell)
+
+    expected = """<c r="C3"><f>A3*2</f><v/></c>"""
+    xml = out.getvalue()
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
 def test_rich_text(worksheet, write_cell_implementation):
     write_cell = write_cell_implementation
     ws = worksheet
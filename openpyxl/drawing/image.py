@@ -18,16 +18,58 @@ def _import_image(img):
     return img
 
 
+# signatures of image formats which can be identified without decoding them
+SIGNATURES = [
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"\xff\xd8\xff", "jpeg"),
+    (0, b"GIF87a", "gif"),
+    (0, b"GIF89a", "gif"),
+    (0, b"BM", "bmp"),
+    (0, b"II*\x00", "tiff"),
+    (0, b"MM\x00*", "tiff"),
+    (0, b"\xd7\xcd\xc6\x9a", "wmf"),
+    (40, b" EMF", "emf"),
+]
+
+
+def _image_format(data):
+    """
+    Identify the format of an image from its first bytes
+    """
+    for offset, signature, fmt in SIGNATURES:
+        if data[offset:offset + len(signature)] == signature:
+            return fmt
+
+
 class Image:
-    """Image in a spreadsheet"""
+    """
+    Image in a spreadsheet
+
+    `img` is the path to an image, a file-like object or a PIL image. If it
+    is bytes the image is written as it is and is only decoded if its size
+    is needed.
+    """
 
     _id = 1
     _path = "/xl/media/image{0}.{1}"
     anchor = "A1"
+    _blob = None
+    _width = None
+    _height = None
 
     def __init__(self, img):
 
         self.ref = img
+        if isinstance(img, bytes):
+            self._blob = img
+            fmt = _image_format(img)
+            if fmt is None:
+                image = _import_image(BytesIO(img))
+                fmt = image.format.lower()
+                self.width, self.height = image.size
+            self.format = fmt
+            return
+
         mark_to_close = isinstance(img, str)
         image = _import_image(img)
         self.width, self.height = image.size
@@ -41,10 +83,42 @@ class Image:
             image.close()
 
 
+    def _read_size(self):
+        image = _import_image(BytesIO(self._blob))
+        self._width, self._height = image.size
+
+
+    @property
+    def width(self):
+        if self._width is None and self._blob is not None:
+            self._read_size()
+        return self._width
+
+
+    @width.setter
+    def width(self, value):
+        self._width = value
+
+
+    @property
+    def height(self):
+        if self._height is None and self._blob is not None:
+            self._read_size()
+        return self._height
+
+
+    @height.setter
+    def height(self, value):
+        self._height = value
+
+
     def _data(self):
         """
         Return image data, convert to supported types if necessary
         """
+        if self._blob is not None:
+            return self._blob
+
         img = _import_image(self.ref)
         # don't convert these file formats
         if self.format in ['gif', 'jpeg', 'png']:
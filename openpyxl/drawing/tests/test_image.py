@@ -58,3 +58,40 @@ class TestImage:
         datadir.chdir()
         img = Image("plain.tif")
         assert img._data()[:10] == b'\x89PNG\r\n\x1a\n\x00\x00'
+
+
+    @pytest.mark.pil_required
+    def test_bytes(self, Image, datadir):
+        datadir.chdir()
+        with open("plain.png", "rb") as src:
+            data = src.read()
+        img = Image(data)
+        assert img.format == "png"
+        assert img._width is None
+        assert (img.width, img.height) == (118, 118)
+        assert img._data() is data
+
+
+    @pytest.mark.pil_required
+    def test_bytes_unknown_format(self, Image, datadir):
+        from ..image import PILImage
+        from io import BytesIO
+        out = BytesIO()
+        PILImage.new("RGB", (4, 3)).save(out, format="PCX")
+        img = Image(out.getvalue())
+        assert img.format == "pcx"
+        assert (img.width, img.height) == (4, 3)
+
+
+@pytest.mark.parametrize("data, expected",
+                         [
+                             (b"\x89PNG\r\n\x1a\n\x00", "png"),
+                             (b"\xff\xd8\xff\xe0", "jpeg"),
+                             (b"GIF89a", "gif"),
+                             (b"\x01" * 40 + b" EMF", "emf"),
+                             (b"plain text", None),
+                         ]
+                         )
+def test_image_format(data, expected):
+    from ..image import _image_format
+    assert _image_format(data) == expected
@@ -6,19 +6,19 @@ from openpyxl.descriptors import (
     Bool,
     Sequence,
     Alias,
-    Convertible,
 )
 from openpyxl.descriptors.serialisable import Serialisable
 
 from .rule import Rule
 
-from openpyxl.worksheet.cell_range import MultiCellRange
+from openpyxl.worksheet.cell_range import Sqref
+from openpyxl.worksheet._range_index import RangeLookup
 
 class ConditionalFormatting(Serialisable):
 
     tagname = "conditionalFormatting"
 
-    sqref = Convertible(expected_type=MultiCellRange)
+    sqref = Sqref()
     cells = Alias("sqref")
     pivot = Bool(allow_none=True)
     cfRule = Sequence(expected_type=Rule)
@@ -59,6 +59,8 @@ class ConditionalFormattingList:
     def __init__(self):
         self._cf_rules = OrderedDict()
         self.max_priority = 0
+        self._changes = 0
+        self._lookup = RangeLookup()
 
 
     def add(self, range_string, cfRule):
@@ -77,6 +79,41 @@ class ConditionalFormattingList:
             rule.priority = self.max_priority
 
         self._cf_rules.setdefault(cf, []).append(rule)
+        self._changes += 1
+
+
+    def _ranges(self):
+        for cf in self._cf_rules:
+            cf.sqref._watch(self)
+        return [(cf, [r.bounds for r in cf.sqref]) for cf in self._cf_rules]
+
+
+    def _touch(self):
+        self._changes += 1
+
+
+    def _state(self):
+        return self._changes
+
+
+    def rules_for(self, cell):
+        """
+        Get the rules which apply to a cell or cell coordinate in order of
+        priority
+        """
+        rules = []
+        for cf in self._lookup.at(cell, self._ranges, self._state()):
+            rules.extend(self._cf_rules[cf])
+        return sorted(rules, key=lambda rule: rule.priority)
+
+
+    def for_range(self, cell_range):
+        """
+        Get the formatting which applies to at least one cell of a range as
+        (formatting, rules) pairs
+        """
+        found = self._lookup.overlapping(cell_range, self._ranges, self._state())
+        return [(cf, self._cf_rules[cf]) for cf in found]
 
 
     def __bool__(self):
@@ -105,6 +142,7 @@ class ConditionalFormattingList:
     def __delitem__(self, key):
         key = ConditionalFormatting(sqref=key)
         del self._cf_rules[key]
+        self._changes += 1
 
 
     def __setitem__(self, key, rule):
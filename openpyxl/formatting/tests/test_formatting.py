@@ -200,3 +200,60 @@ class TestConditionalFormatting:
     def test_contains(self, ConditionalFormatting):
         c2 = ConditionalFormatting("A1:A5 B1:B5")
         assert "B2" in c2
+
+
+class TestConditionalFormattingList:
+
+
+    def test_rules_for(self):
+        cfs = ConditionalFormattingList()
+        first = Rule(type="expression", formula=["TRUE"])
+        second = Rule(type="expression", formula=["FALSE"])
+        cfs.add("A1:A10 C1", second)
+        cfs.add("A5:B5", first)
+        first.priority, second.priority = 1, 2
+        assert cfs.rules_for("A5") == [first, second]
+        assert cfs.rules_for("C1") == [second]
+        assert cfs.rules_for("B1") == []
+
+
+    def test_rules_for_after_change(self):
+        cfs = ConditionalFormattingList()
+        rule = Rule(type="expression", formula=["TRUE"])
+        cfs.add("A1", rule)
+        assert cfs.rules_for("B2") == []
+        cfs.add("B1:B2", rule)
+        assert cfs.rules_for("B2") == [rule]
+        del cfs["B1:B2"]
+        assert cfs.rules_for("B2") == []
+
+
+    def test_lookup_cost(self, monkeypatch):
+        from openpyxl.worksheet.cell_range import MultiCellRange
+        cfs = ConditionalFormattingList()
+        rule = Rule(type="expression", formula=["TRUE"])
+        for idx in range(1, 1001):
+            cfs.add(f"A{idx}", rule)
+        assert cfs.rules_for("A5") == [rule]
+
+        calls = []
+        def counted(name):
+            method = getattr(MultiCellRange, name)
+            def wrapper(self, *args):
+                calls.append(name)
+                return method(self, *args)
+            return wrapper
+        for name in ("__iter__", "__str__", "_track"):
+            monkeypatch.setattr(MultiCellRange, name, counted(name))
+        assert cfs.rules_for("A500") == [rule]
+        assert len(calls) <= 1 # the key of the format found
+
+
+    def test_for_range(self):
+        cfs = ConditionalFormattingList()
+        rule = Rule(type="expression", formula=["TRUE"])
+        cfs.add("A1:A10", rule)
+        cfs.add("D1", rule)
+        found = cfs.for_range("A5:C20")
+        assert [(str(cf.sqref), rules) for cf, rules in found] == [("A1:A10", [rule])]
+        assert found[0][0].cfRule == []
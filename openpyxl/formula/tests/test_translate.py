@@ -237,3 +237,66 @@ class TestTranslator:
         trans = Translator("='Summary slices'!C3", "A1")
         result = trans.translate_formula(row_delta=2, col_delta=3)
         assert result == "='Summary slices'!F5"
+
+
+@pytest.fixture
+def ReferenceShift():
+    from .. import translate
+    return translate.ReferenceShift
+
+
+class TestReferenceShift:
+
+    @pytest.mark.parametrize("idx, amount, span, expected", [
+        (3, 2, (1, 2), (1, 2)),
+        (3, 2, (1, 3), (1, 5)),
+        (3, 2, (3, 4), (5, 6)),
+        (3, -2, (1, 2), (1, 2)),
+        (3, -2, (3, 4), None),
+        (3, -2, (2, 6), (2, 4)),
+        (3, -2, (4, 6), (3, 4)),
+        (3, -2, (6, 8), (4, 6)),
+    ])
+    def test_shift_span(self, ReferenceShift, idx, amount, span, expected):
+        shift = ReferenceShift("Sheet", "row", idx, amount)
+        assert shift.shift_span(*span) == expected
+
+
+    @pytest.mark.parametrize("row_or_col, amount, ref, expected", [
+        ("row", 1, "A1", "A1"),
+        ("row", 1, "$B$2", "$B$3"),
+        ("row", 1, "A1:B2", "A1:B3"),
+        ("row", 1, "2:$4", "3:$5"),
+        ("row", 1, "B:C", "B:C"),
+        ("row", -1, "C2", None),
+        ("row", -1, "C2:C5", "C2:C4"),
+        ("column", 2, "B1:C1", "D1:E1"),
+        ("column", 2, "$A:B", "$A:D"),
+        ("column", -1, "B:B", None),
+        ("column", 1, "named", "named"),
+        ("column", 1, "ZZZ2023", "ZZZ2023"),
+    ])
+    def test_shift_range(self, ReferenceShift, row_or_col, amount, ref, expected):
+        shift = ReferenceShift("Sheet", row_or_col, 2, amount)
+        assert shift.shift_range(ref) == expected
+
+
+    @pytest.mark.parametrize("formula, title, expected", [
+        ("=SUM(A1:A3)+B2", "Sheet", "=SUM(A1:A4)+B3"),
+        ("=SUM(A1:A3)+B2", "Other", "=SUM(A1:A3)+B2"),
+        ("=Sheet!B2*Other!B2", "Other", "=Sheet!B3*Other!B2"),
+        ("='Sheet'!$B$2&\"B2\"", None, "='Sheet'!$B$3&\"B2\""),
+        ("=sheet!B2+LOG10(B2)", None, "=sheet!B3+LOG10(B2)"),
+        ("=SUM(Table1[Col])+A2", "Sheet", "=SUM(Table1[Col])+A3"),
+        ("text B2", "Sheet", "text B2"),
+    ])
+    def test_translate_formula(self, ReferenceShift, formula, title, expected):
+        shift = ReferenceShift("Sheet", "row", 2, 1)
+        assert shift.translate_formula(formula, title) == expected
+
+
+    def test_deleted_reference(self, ReferenceShift):
+        shift = ReferenceShift("Sheet", "column", 2, -1)
+        formula = "=B1+'Sheet'!C1&\"x\""
+        assert shift.translate_formula(formula, "Sheet") == "=#REF!+'Sheet'!B1&\"x\""
+        assert shift.translate_formula("=B1+C1", "Sheet") == "=#REF!+B1"
@@ -164,3 +164,208 @@ class Translator:
             else:
                 out.append(token.value)
         return "".join(out)
+
+
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+
+
+def _unquote_sheetname(sheetname):
+    if sheetname.startswith("'") and sheetname.endswith("'"):
+        sheetname = sheetname[1:-1].replace("''", "'")
+    return sheetname
+
+
+# references in formulae without strings, quoted sheet names, structured
+# references or arrays, which can be found without tokenizing them
+SIMPLE_REF_RE = re.compile(r"""
+(?<![\w.$!:])
+(?:(?P<sheet>[^\W\d][\w.]*)!)?
+(?P<ref>
+\$?[A-Za-z]{1,3}\$?[1-9][0-9]{0,6}(?::\$?[A-Za-z]{1,3}\$?[1-9][0-9]{0,6})?
+|\$?[A-Za-z]{1,3}:\$?[A-Za-z]{1,3}
+|\$?[1-9][0-9]{0,6}:\$?[1-9][0-9]{0,6}
+)
+(?![\w(!.:])
+""", re.VERBOSE)
+
+COMPLEX_CHARS = frozenset("\"'[{")
+
+CELL_PARTS_RE = re.compile(r"(\$?)([A-Za-z]{1,3})(\$?)([1-9][0-9]{0,6})$")
+
+
+def _beyond_columns(col):
+    return len(col) == 3 and col.upper() > "XFD"
+
+
+class ReferenceShift:
+
+    """
+    Updates references when rows or columns are inserted into or deleted
+    from a worksheet.
+
+    Unlike translating a formula, absolute references are also changed.
+    References to deleted cells become #REF! and ranges which include
+    inserted or deleted rows or columns are resized.
+
+    `title`: the title of the worksheet which is changed
+    `row_or_col`: "row" or "column"
+    `idx`: the first row or column which is inserted or deleted
+    `amount`: the number of rows or columns inserted, or deleted if negative
+
+    """
+
+    def __init__(self, title, row_or_col, idx, amount):
+        self.title = title.lower()
+        self.rows = row_or_col == "row"
+        self.idx = idx
+        self.amount = amount
+        self.limit = MAX_ROW if self.rows else MAX_COLUMN
+
+
+    def shift_span(self, lo, hi):
+        """
+        New first and last index of a span of rows or columns, or None if
+        the span was deleted
+        """
+        idx, amount = self.idx, self.amount
+        if amount > 0:
+            if lo >= idx:
+                lo += amount
+            if hi >= idx:
+                hi = min(hi + amount, self.limit)
+            if lo > self.limit:
+                return
+            return lo, hi
+
+        end = idx - amount - 1 # last deleted
+        if lo >= idx and hi <= end:
+            return
+        if lo > end:
+            lo += amount
+        elif lo >= idx:
+            lo = idx
+        if hi > end:
+            hi += amount
+        elif hi >= idx:
+            hi = idx - 1
+        return lo, hi
+
+
+    def shift_bounds(self, min_col, min_row, max_col, max_row):
+        """
+        New bounds of a range of cells, or None if it was deleted
+        """
+        if self.rows:
+            span = self.shift_span(min_row, max_row)
+            if span is not None:
+                return min_col, span[0], max_col, span[1]
+        else:
+            span = self.shift_span(min_col, max_col)
+            if span is not None:
+                return span[0], min_row, span[1], max_row
+
+
+    @staticmethod
+    def _row(part, value):
+        return f"{'$' * part.startswith('$')}{value}"
+
+
+    @staticmethod
+    def _col(part, value):
+        return f"{'$' * part.startswith('$')}{get_column_letter(value)}"
+
+
+    def shift_range(self, range_str):
+        """
+        Shift an A1-style reference without a worksheet name. Returns None
+        if all the cells were deleted. Named ranges are not changed.
+        """
+        match = Translator.ROW_RANGE_RE.match(range_str) # e.g. `3:4`
+        if match is not None:
+            if not self.rows:
+                return range_str
+            first, last = match.groups()
+            span = self.shift_span(int(first.lstrip("$")), int(last.lstrip("$")))
+            if span is not None:
+                return f"{self._row(first, span[0])}:{self._row(last, span[1])}"
+            return
+
+        match = Translator.COL_RANGE_RE.match(range_str) # e.g. `A:BC`
+        if match is not None:
+            if self.rows:
+                return range_str
+            first, last = match.groups()
+            span = self.shift_span(column_index_from_string(first.lstrip("$")),
+                                   column_index_from_string(last.lstrip("$")))
+            if span is not None:
+                return f"{self._col(first, span[0])}:{self._col(last, span[1])}"
+            return
+
+        pieces = range_str.split(":")
+        if len(pieces) > 2:
+            return range_str
+        matches = [CELL_PARTS_RE.match(piece) for piece in pieces]
+        if None in matches: # named range
+            return range_str
+
+        (cabs1, col1, rabs1, row1) = matches[0].groups()
+        (cabs2, col2, rabs2, row2) = matches[-1].groups()
+        if _beyond_columns(col1) or _beyond_columns(col2):
+            return range_str # a name such as "TAX2023"
+        if self.rows:
+            span = self.shift_span(int(row1), int(row2))
+            if span is None:
+                return
+            refs = [f"{cabs1}{col1}{rabs1}{span[0]}", f"{cabs2}{col2}{rabs2}{span[1]}"]
+        else:
+            span = self.shift_span(column_index_from_string(col1),
+                                   column_index_from_string(col2))
+            if span is None:
+                return
+            refs = [f"{cabs1}{get_column_letter(span[0])}{rabs1}{row1}",
+                    f"{cabs2}{get_column_letter(span[1])}{rabs2}{row2}"]
+        return ":".join(refs[:len(pieces)])
+
+
+    def refers_to(self, sheetname):
+        return _unquote_sheetname(sheetname).lower() == self.title
+
+
+    def translate_formula(self, formula, title=None):
+        """
+        Shift the references of a formula. References without a worksheet
+        name refer to the worksheet `title`.
+        """
+        local = title is not None and title.lower() == self.title
+        if formula.startswith("=") and COMPLEX_CHARS.isdisjoint(formula):
+            return self._translate_simple(formula, local)
+
+        tokens = Tokenizer(formula).items
+        if not tokens or tokens[0].type == Token.LITERAL:
+            return formula
+        out = ['=']
+        for token in tokens:
+            value = token.value
+            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+                ws_part, range_str = Translator.strip_ws_name(value)
+                if ws_part and self.refers_to(ws_part[:-1]) or not ws_part and local:
+                    shifted = self.shift_range(range_str)
+                    value = ws_part + ("#REF!" if shifted is None else shifted)
+            out.append(value)
+        return "".join(out)
+
+
+    def _translate_simple(self, formula, local):
+        def shift(match):
+            sheet = match.group("sheet")
+            if sheet is None and not local or sheet is not None and not self.refers_to(sheet):
+                return match.group(0)
+            shifted = self.shift_range(match.group("ref"))
+            if shifted is None:
+                shifted = "#REF!"
+            if sheet is not None:
+                return f"{sheet}!{shifted}"
+            return shifted
+
+        return SIMPLE_REF_RE.sub(shift, formula)
@@ -0,0 +1,133 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Parts of a package which are not read but copied unchanged, together with
+the parts they are related to, when the workbook is saved.
+
+Copies are put in a "raw" folder next to the original part so that they
+cannot clash with the parts written by openpyxl.
+"""
+
+import posixpath
+
+from openpyxl.xml.functions import tostring
+
+from .manifest import FileExtension, Override
+from .relationship import get_dependents, get_rels_path
+
+
+class RawSource:
+    """
+    The archive raw parts are copied from, with the content types of its
+    parts and file extensions and the ids of its pivot caches keyed by the
+    path of their definitions.
+    """
+
+    def __init__(self, archive, manifest, caches=None):
+        self.archive = archive
+        self.types = {o.PartName: o.ContentType for o in manifest.Override}
+        self.defaults = {d.Extension.lower(): d.ContentType for d in manifest.Default}
+        self.caches = caches or {}
+
+
+    def __contains__(self, path):
+        return path in self.archive.NameToInfo
+
+
+class RawPart:
+    """
+    A part related to a worksheet which was not read.
+
+    `kind` is "drawing", "comments" or "pivot". `id` is the id of the
+    relationship when the worksheet is written.
+    """
+
+    def __init__(self, source, rel, kind, id):
+        self.source = source
+        self.rel = rel
+        self.kind = kind
+        self.id = id
+
+
+class RawCopier:
+    """
+    Copy raw parts to an archive. Parts are only copied once even if several
+    parts are related to them.
+    """
+
+    def __init__(self, archive, manifest):
+        self.archive = archive
+        self.manifest = manifest
+        self.copied = {}
+        self.names = set()
+        self.pivot_caches = [] # (cacheId, path)
+
+
+    def copy(self, part):
+        """
+        Copy a part and return the path of the copy
+        """
+        return self._copy(part.source, part.rel.target)
+
+
+    def _copy(self, source, path):
+        key = (source, path)
+        if key in self.copied:
+            return self.copied[key]
+        if path not in source:
+            # broken relationship
+            self.copied[key] = path
+            return path
+
+        name = self._name(path)
+        self.copied[key] = name
+
+        rels_path = get_rels_path(path)
+        if rels_path in source:
+            rels = get_dependents(source.archive, rels_path)
+            for r in rels:
+                if r.TargetMode != "External":
+                    r.Target = "/" + self._copy(source, r.Target)
+            self.archive.writestr(get_rels_path(name), tostring(rels.to_tree()))
+
+        from openpyxl.writer._archive import copy_member
+        copy_member(source.archive, path, self.archive, name)
+
+        content_type = source.types.get("/" + path)
+        if content_type is not None:
+            self.manifest.Override.append(Override("/" + name, content_type))
+        else:
+            self._add_default(source, name)
+        if path in source.caches:
+            self.pivot_caches.append((source.caches[path], name))
+        return name
+
+
+    def _add_default(self, source, name):
+        """
+        Use the content type of the extension of a part in the source
+        """
+        ext = posixpath.splitext(name)[1][1:]
+        content_type = source.defaults.get(ext.lower())
+        if content_type is None:
+            return
+        defaults = {d.Extension.lower() for d in self.manifest.Default}
+        if ext.lower() not in defaults:
+            self.manifest.Default.append(FileExtension(ext, content_type))
+
+
+    def _name(self, path):
+        """
+        Name of the copy of a part
+        """
+        folder, filename = posixpath.split(path)
+        if posixpath.basename(folder) != "raw":
+            folder = posixpath.join(folder, "raw")
+        name = posixpath.join(folder, filename)
+        stem, ext = posixpath.splitext(name)
+        counter = 1
+        while name in self.names:
+            counter += 1
+            name = f"{stem}{counter}{ext}"
+        self.names.add(name)
+        return name
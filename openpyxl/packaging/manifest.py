@@ -102,7 +102,8 @@ class Manifest(Serialisable):
         Skip parts without extensions
         """
         exts = {os.path.splitext(part.PartName)[-1] for part in self.Override}
-        return [(ext[1:], mimetypes.types_map[True][ext]) for ext in sorted(exts) if ext]
+        return [(ext[1:], mimetypes.types_map[True][ext]) for ext in sorted(exts)
+                if ext in mimetypes.types_map[True]]
 
 
     def to_tree(self):
@@ -170,9 +171,10 @@ class Manifest(Serialisable):
         """
         Make sure that the mime type for all file extensions is registered
         """
+        defaults = {t.Extension.lower() for t in self.Default}
         for fn in filenames:
             ext = os.path.splitext(fn)[-1]
-            if not ext:
+            if not ext or ext[1:].lower() in defaults:
                 continue
             mime = mimetypes.types_map[True][ext]
             fe = FileExtension(ext[1:], mime)
@@ -32,6 +32,7 @@ from openpyxl.packaging.relationship import (
     get_rels_path
 )
 
+from .record import RecordSource
 from .table import (
     PivotArea,
     Reference,
@@ -826,7 +827,7 @@ class CacheDefinition(Serialisable):
     rel_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/pivotCacheDefinition"
     _id = 1
     _path = "/xl/pivotCache/pivotCacheDefinition{0}.xml"
-    records = None
+    _records = None
 
     tagname = "pivotCacheDefinition"
 
@@ -931,6 +932,36 @@ class CacheDefinition(Serialisable):
         return node
 
 
+    @property
+    def records(self):
+        """
+        The `RecordList` of the cache. Records read from a workbook are only
+        parsed the first time they are used.
+        """
+        if isinstance(self._records, RecordSource):
+            self._records = self._records.parse()
+        return self._records
+
+
+    @records.setter
+    def records(self, value):
+        self._records = value
+
+
+    def iter_records(self):
+        """
+        Return the records of the cache as tuples of values, without parsing
+        them all at once if they have not been used.
+        """
+        records = self._records
+        if records is None:
+            return iter(())
+        elif isinstance(records, RecordSource):
+            return iter(records)
+        return (tuple(f if isinstance(f, Error) else getattr(f, "v", None)
+                      for f in r._fields) for r in records.r)
+
+
     @property
     def path(self):
         return self._path.format(self._id)
@@ -950,15 +981,16 @@ class CacheDefinition(Serialisable):
         """
         Write the relevant child objects and add links
         """
-        if self.records is None:
+        records = self._records
+        if records is None:
             return
 
         rels = RelationshipList()
-        r = Relationship(Type=self.records.rel_type, Target=self.records.path)
+        r = Relationship(Type=records.rel_type, Target=records.path)
         rels.append(r)
         self.id = r.id
-        self.records._id = self._id
-        self.records._write(archive, manifest)
+        records._id = self._id
+        records._write(archive, manifest)
 
         path = get_rels_path(self.path)
         xml = tostring(rels.to_tree())
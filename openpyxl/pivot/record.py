@@ -1,5 +1,10 @@
 # Copyright (c) 2010-2024 openpyxl
 
+import datetime
+import zlib
+from xml.etree.ElementTree import XMLPullParser
+from zipfile import ZipInfo, ZIP_DEFLATED, ZIP_STORED
+
 from openpyxl.descriptors.serialisable import Serialisable
 from openpyxl.descriptors import (
     Typed,
@@ -16,8 +21,14 @@ from openpyxl.descriptors.nested import (
     NestedBool,
 )
 
+from openpyxl.utils.datetime import from_ISO8601
 from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import tostring
+from openpyxl.xml.functions import (
+    Element,
+    SubElement,
+    fromstring,
+    xmlfile,
+)
 
 from .fields import (
     Boolean,
@@ -100,12 +111,183 @@ class RecordList(Serialisable):
 
     def _write(self, archive, manifest):
         """
-        Write to zipfile and update manifest
+        Write to zipfile and update manifest. Records are serialised one at
+        a time.
         """
-        xml = tostring(self.to_tree())
-        archive.writestr(self.path[1:], xml)
+        with archive.open(self.path[1:], "w", force_zip64=True) as out:
+            with xmlfile(out) as xf:
+                with xf.element(self.tagname, xmlns=SHEET_MAIN_NS, count=str(self.count)):
+                    for r in self.r:
+                        xf.write(r.to_tree())
         manifest.append(self)
 
 
     def _write_rels(self, archive, manifest):
         pass
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _parse_value(tag, value):
+    if tag == "x":
+        return int(value)
+    elif tag == "n":
+        return float(value)
+    elif tag == "s":
+        return value
+    elif tag == "m":
+        return None
+    elif tag == "b":
+        return value in ("1", "true")
+    elif tag == "d":
+        return from_ISO8601(value)
+    elif tag == "e":
+        return Error(v=value)
+
+
+def read_records(chunks):
+    """
+    Parse the records of a pivot cache from an iterable of chunks of XML
+    without creating `Record` objects.
+
+    Yield a tuple of values for each record: None for missing values, floats
+    for numbers, ints for indices of the shared items of fields, and
+    booleans, strings, datetimes or `Error` objects. The formatting of
+    values is ignored.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    root = None
+    depth = 0
+    in_record = False
+    record = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, el in parser.read_events():
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = el
+                elif depth == 2:
+                    in_record = el.tag.rpartition("}")[2] == "r"
+                continue
+            depth -= 1
+            if not in_record:
+                continue
+            if depth == 2:
+                tag = el.tag.rpartition("}")[2]
+                record.append(_parse_value(tag, el.get("v")))
+            elif depth == 1:
+                yield tuple(record)
+                record = []
+                in_record = False
+                root.clear()
+    parser.close()
+
+
+def _value_tree(value):
+    if value is None:
+        return "m", None
+    elif isinstance(value, bool):
+        return "b", value and "1" or "0"
+    elif isinstance(value, int):
+        return "x", str(value)
+    elif isinstance(value, float):
+        return "n", repr(value)
+    elif isinstance(value, datetime.datetime):
+        return "d", value.isoformat()
+    elif isinstance(value, Error):
+        return "e", value.v
+    return "s", str(value)
+
+
+def write_records(out, records, count=None):
+    """
+    Write the records of a pivot cache to a file-like object one at a time.
+    Records are tuples of values as returned by `read_records`.
+    """
+    attrs = {}
+    if count is not None:
+        attrs["count"] = str(count)
+    with xmlfile(out) as xf:
+        with xf.element(RecordList.tagname, attrs, xmlns=SHEET_MAIN_NS):
+            for values in records:
+                r = Element("r")
+                for value in values:
+                    tag, v = _value_tree(value)
+                    el = SubElement(r, tag)
+                    if v is not None:
+                        el.set("v", v)
+                xf.write(r)
+
+
+class RecordSource:
+    """
+    The records of a pivot cache as they are stored in the source archive.
+    They are kept compressed and are only parsed when they are used. If
+    they are not used they are copied unchanged when the workbook is saved.
+    """
+
+    mime_type = RecordList.mime_type
+    rel_type = RecordList.rel_type
+    _id = 1
+    _path = RecordList._path
+
+    def __init__(self, archive, name):
+        from openpyxl.writer._archive import read_compressed
+
+        zinfo = archive.getinfo(name)
+        if zinfo.flag_bits & 0x1 or zinfo.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            # encrypted or unusual compression
+            data = archive.read(name)
+            zinfo = ZipInfo(name, zinfo.date_time)
+            zinfo.CRC = zlib.crc32(data)
+            zinfo.file_size = len(data)
+        else:
+            zinfo, data = read_compressed(archive, name)
+        self.zinfo = zinfo
+        self.data = data
+
+
+    @property
+    def path(self):
+        return self._path.format(self._id)
+
+
+    def chunks(self):
+        """
+        The decompressed XML
+        """
+        data = self.data
+        inflate = None
+        if self.zinfo.compress_type == ZIP_DEFLATED:
+            inflate = zlib.decompressobj(-15)
+        for idx in range(0, len(data), CHUNK_SIZE):
+            chunk = data[idx:idx + CHUNK_SIZE]
+            if inflate is not None:
+                chunk = inflate.decompress(chunk)
+            yield chunk
+        if inflate is not None:
+            yield inflate.flush()
+
+
+    def __iter__(self):
+        return read_records(self.chunks())
+
+
+    def parse(self):
+        """
+        Return a `RecordList`
+        """
+        xml = b"".join(self.chunks())
+        return RecordList.from_tree(fromstring(xml))
+
+
+    def _write(self, archive, manifest):
+        """
+        Copy to zipfile and update manifest
+        """
+        from openpyxl.writer._archive import add_compressed
+
+        add_compressed(archive, self.path[1:], self.zinfo, self.data)
+        manifest.append(self)
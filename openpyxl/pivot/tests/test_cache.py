@@ -209,6 +209,22 @@ class TestPivotCacheDefinition:
         assert manifest.find(DummyCache.mime_type)
 
 
+    def test_lazy_records(self, DummyCache, datadir):
+        from ..record import RecordSource, RecordList
+        datadir.chdir()
+        src = BytesIO()
+        with ZipFile(src, "w") as archive:
+            archive.write("pivotCacheRecords.xml", "records.xml")
+        with ZipFile(src) as archive:
+            DummyCache.records = RecordSource(archive, "records.xml")
+
+        records = list(DummyCache.iter_records())
+        assert isinstance(DummyCache._records, RecordSource)
+        assert DummyCache.records.count == 17
+        assert isinstance(DummyCache._records, RecordList)
+        assert list(DummyCache.iter_records()) == records
+
+
 
 @pytest.fixture
 def CacheHierarchy():
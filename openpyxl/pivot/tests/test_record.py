@@ -109,4 +109,59 @@ class TestRecordList:
         manifest.append(records)
 
         assert archive.namelist() == [records.path[1:]]
+        assert archive.getinfo(records.path[1:]).extract_version >= 45
         assert manifest.find(records.mime_type)
+
+
+def test_read_records(datadir):
+    from ..record import read_records
+    datadir.chdir()
+    with open("pivotCacheRecords.xml", "rb") as src:
+        records = list(read_records(iter(lambda: src.read(100), b"")))
+    assert len(records) == 17
+    assert records[0] == (1.0, 0, "2014-03-24", 0, 25.0, 0)
+
+
+def test_write_records():
+    from datetime import datetime
+    from ..fields import Error
+    from ..record import read_records, write_records
+
+    records = [
+        (1.5, 2, "a", None),
+        (True, datetime(2024, 1, 2), Error(v="#N/A"), False),
+    ]
+    out = BytesIO()
+    write_records(out, records, count=2)
+    xml = out.getvalue()
+    expected = """
+    <pivotCacheRecords xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="2">
+      <r><n v="1.5"/><x v="2"/><s v="a"/><m/></r>
+      <r><b v="1"/><d v="2024-01-02T00:00:00"/><e v="#N/A"/><b v="0"/></r>
+    </pivotCacheRecords>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+    assert list(read_records([xml])) == records
+
+
+@pytest.mark.parametrize("compression", [0, 8])
+def test_record_source(datadir, compression):
+    from ..record import RecordSource
+    datadir.chdir()
+    src = BytesIO()
+    with ZipFile(src, "w", compression=compression) as archive:
+        archive.write("pivotCacheRecords.xml", "records.xml")
+
+    with ZipFile(src) as archive:
+        records = RecordSource(archive, "records.xml")
+    assert len(list(records)) == 17
+    assert records.parse().count == 17
+
+    out = BytesIO()
+    manifest = Manifest()
+    with ZipFile(out, "w") as archive:
+        records._write(archive, manifest)
+    with ZipFile(out) as archive, open("pivotCacheRecords.xml", "rb") as expected:
+        assert archive.read(records.path[1:]) == expected.read()
+    assert manifest.find(records.mime_type)
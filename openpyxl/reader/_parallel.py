@@ -0,0 +1,224 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Parse worksheets in a pool of worker processes.
+
+Each worker opens the archive itself and returns the parser, without its
+source, together with the cells as compact tuples. The cells are then bound
+to the worksheet in the parent process.
+
+Single worksheets in read-only mode can also be split into shards of rows
+which are parsed by the workers and returned in order. The workers read the
+shards from the file the rows were indexed in rather than from the archive.
+"""
+
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import os
+import warnings
+from zipfile import ZipFile
+
+from openpyxl.cell import Cell
+from openpyxl.worksheet._reader import WorkSheetParser, WorksheetReader
+from openpyxl.worksheet._compact import CompactCellStore
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet, fill_rows
+from openpyxl.worksheet._row_index import RowStream, map_file
+
+
+_worker = {}
+
+
+def _init_worker(filename, shared_strings, data_only, epoch,
+                 date_formats, timedelta_formats, rich_text):
+    """
+    Called once in each worker process
+    """
+    if filename is not None:
+        _worker['archive'] = ZipFile(filename)
+    _worker['options'] = (shared_strings, data_only, epoch,
+                          date_formats, timedelta_formats, rich_text)
+
+
+def parse_worksheet(path):
+    """
+    Parse a worksheet from the archive. Warnings are returned so that they
+    can be issued in the parent process.
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with _worker['archive'].open(path) as src:
+            parser = WorkSheetParser(src, *_worker['options'])
+            parser.expand_shared_formulae = False
+            cells = [
+                (c['row'], c['column'], c['value'], c['data_type'], c['style_id'])
+                for _, row in parser.parse() for c in row
+            ]
+
+    parser.source = None
+    parser.shared_strings = None
+    parser.date_formats = parser.timedelta_formats = None
+    messages = [(str(w.message), w.category) for w in caught]
+    return parser, cells, messages
+
+
+class ParsedWorksheetReader(WorksheetReader):
+    """
+    Bind a worksheet that has already been parsed in a worker process
+    """
+
+    def __init__(self, ws, parser, cells):
+        self.ws = ws
+        self.parser = parser
+        self.cells = cells
+        self.tables = []
+
+
+    def bind_cells(self):
+        ws = self.ws
+        styles = ws.parent._cell_styles
+        if isinstance(ws._cells, CompactCellStore):
+            for cell in self.cells:
+                ws._cells.bind(*cell)
+        else:
+            for row, column, value, data_type, style_id in self.cells:
+                c = Cell(ws, row=row, column=column, style_array=styles[style_id])
+                c._value = value
+                c.data_type = data_type
+                ws._cells[(row, column)] = c
+        self.cells = None
+
+        if ws._cells:
+            ws._current_row = ws.max_row
+        ws._shared_formulae = bool(self.parser.shared_formulae)
+
+
+class WorksheetPool:
+    """
+    Submit worksheets to a pool of processes and bind the results
+    """
+
+    def __init__(self, reader, paths, workers):
+        wb = reader.wb
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(reader.archive.filename, reader.shared_strings,
+                      reader.data_only, wb.epoch, wb._date_formats,
+                      wb._timedelta_formats, reader.rich_text),
+        )
+        self.futures = {path: self.executor.submit(parse_worksheet, path) for path in paths}
+
+
+    def reader(self, ws, path):
+        """
+        Return a reader for the worksheet once it has been parsed
+        """
+        parser, cells, messages = self.futures.pop(path).result()
+        for message, category in messages:
+            warnings.warn(message, category)
+        return ParsedWorksheetReader(ws, parser, cells)
+
+
+    def close(self):
+        for future in self.futures.values():
+            future.cancel()
+        self.executor.shutdown()
+
+
+def parse_shard(filename, head, tail, shard, row, formulae, max_row, max_col):
+    """
+    Parse the rows of a shard of a worksheet in the file of the row index
+    and return their values
+    """
+    first, last, start, end = shard
+    size = None
+    if last is None:
+        last = max_row
+    else:
+        # the next shard starts after the last row
+        size = last + 1 - first
+    empty_row = []
+    if max_col is not None:
+        empty_row = (None,) * max_col
+
+    def get_row(row):
+        # values do not need the worksheet
+        return ReadOnlyWorksheet._get_row(None, row, 1, max_col, True)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with open(filename, "rb") as spill:
+            data = map_file(spill)
+            parts = [(0, head), (start, end), (tail, len(data))]
+            with RowStream(data, parts) as src:
+                parser = WorkSheetParser(src, *_worker['options'])
+                parser.row_counter = row
+                parser.shared_formulae = formulae
+                rows = list(fill_rows(parser.parse(), first, last, empty_row, get_row))
+                if size is not None:
+                    rows.extend([empty_row] * (size - len(rows)))
+            if data:
+                data.close()
+
+    messages = [(str(w.message), w.category) for w in caught]
+    return rows, messages
+
+
+def read_shards(ws, workers=None, num_shards=None):
+    """
+    Yield the values of the rows of a read-only worksheet in batches, one
+    per shard, in order. Shards are parsed in a pool of processes if there
+    is more than one worker.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if num_shards is None:
+        num_shards = 4 * workers
+
+    wb = ws.parent
+    if workers < 2:
+        for k in range(num_shards):
+            yield list(ws.iter_rows_sharded(k, num_shards, values_only=True))
+        return
+
+    index = ws._get_row_index()
+    shards = index.shards(num_shards)
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(None, ws._shared_strings, wb.data_only, wb.epoch,
+                  wb._date_formats, wb._timedelta_formats, False),
+    )
+    pending = deque()
+    try:
+        for shard in shards:
+            if shard is None:
+                future = Future()
+                future.set_result(([], []))
+            else:
+                start = shard[2]
+                # number of the row before the first row in the shard
+                idx = bisect_left(index.offsets, start)
+                row = index.rows[idx] - 1 if idx < len(index.rows) else 0
+                future = executor.submit(parse_shard, index.filename, index.head,
+                                         index.tail, shard, row,
+                                         index.formulae_before(start),
+                                         ws.max_row, ws.max_column)
+            pending.append(future)
+            if len(pending) > 2 * workers:
+                yield _shard_result(pending.popleft())
+        while pending:
+            yield _shard_result(pending.popleft())
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown()
+
+
+def _shard_result(future):
+    rows, messages = future.result()
+    for message, category in messages:
+        warnings.warn(message, category)
+    return rows
@@ -2,7 +2,6 @@
 # Copyright (c) 2010-2024 openpyxl
 
 
-from io import BytesIO
 from warnings import warn
 
 from openpyxl.xml.functions import fromstring
@@ -13,7 +12,7 @@ from openpyxl.packaging.relationship import (
     get_dependents,
 )
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
-from openpyxl.drawing.image import Image, PILImage
+from openpyxl.drawing.image import Image
 from openpyxl.chart.chartspace import ChartSpace
 from openpyxl.chart.reader import read_chart
 
@@ -50,15 +49,13 @@ def find_images(archive, path):
         charts.append(chart)
 
     images = []
-    if not PILImage: # Pillow not installed, drop images
-        return charts, images
-
     for rel in drawing._blip_rels:
         dep = deps.get(rel.embed)
         if dep.Type == IMAGE_NS:
+            # images are kept as they are and only decoded if needed
             try:
-                image = Image(BytesIO(archive.read(dep.target)))
-            except OSError:
+                image = Image(archive.read(dep.target))
+            except (OSError, ImportError):
                 msg = "The image {0} will be removed because it cannot be read".format(dep.target)
                 warn(msg)
                 continue
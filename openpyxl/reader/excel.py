@@ -23,6 +23,7 @@ from openpyxl.xml.constants import (
     ARC_CORE,
     ARC_CUSTOM,
     ARC_CONTENT_TYPES,
+    ARC_ROOT_RELS,
     ARC_WORKBOOK,
     ARC_THEME,
     COMMENTS_NS,
@@ -42,6 +43,7 @@ from openpyxl.styles.stylesheet import apply_stylesheet
 from openpyxl.packaging.core import DocumentProperties
 from openpyxl.packaging.custom import CustomPropertyList
 from openpyxl.packaging.manifest import Manifest, Override
+from openpyxl.packaging._raw import RawPart, RawSource
 
 from openpyxl.packaging.relationship import (
     RelationshipList,
@@ -51,17 +53,49 @@ from openpyxl.packaging.relationship import (
 
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet._reader import WorksheetReader
+from openpyxl.worksheet._lazy import LazyWorksheet
+from openpyxl.worksheet.filters import AutoFilter
 from openpyxl.chartsheet import Chartsheet
 from openpyxl.worksheet.table import Table
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 
 from openpyxl.xml.functions import fromstring
+from openpyxl.writer._archive import copy_member
+from openpyxl.writer.excel import ARC_VBA
 
 from .drawings import find_images
 
 
 SUPPORTED_FORMATS = ('.xlsx', '.xlsm', '.xltx', '.xltm')
 
+# parts of worksheets which can be skipped
+OPTIONAL_PARTS = frozenset(['charts', 'comments', 'images', 'pivots'])
+REQUIRED_PARTS = frozenset(['cells', 'styles'])
+
+
+def _check_format(filename):
+    """
+    Raise an InvalidFileException if the extension of a filename is not in
+    SUPPORTED_FORMATS
+    """
+    file_format = os.path.splitext(filename)[-1].lower()
+    if file_format not in SUPPORTED_FORMATS:
+        if file_format == '.xls':
+            msg = ('openpyxl does not support the old .xls file format, '
+                   'please use xlrd to read this file, or convert it to '
+                   'the more recent .xlsx file format.')
+        elif file_format == '.xlsb':
+            msg = ('openpyxl does not support binary format .xlsb, '
+                   'please convert this file to .xlsx format if you want '
+                   'to open it with openpyxl')
+        else:
+            msg = ('openpyxl does not support %s file format, '
+                   'please check you can open '
+                   'it with Excel first. '
+                   'Supported formats are: %s') % (file_format,
+                                                   ','.join(SUPPORTED_FORMATS))
+        raise InvalidFileException(msg)
+
 
 def _validate_archive(filename):
     """
@@ -70,32 +104,110 @@ def _validate_archive(filename):
     for supported formats by checking the given file-extension. If the
     file-extension is not in SUPPORTED_FORMATS an InvalidFileException
     will raised. Otherwise the filename (resp. file-like object) will
-    forwarded to zipfile.ZipFile returning a ZipFile-Instance.
+    forwarded to zipfile.ZipFile returning a ZipFile-Instance. Streams
+    which cannot seek are read into memory first.
     """
     is_file_like = hasattr(filename, 'read')
     if not is_file_like:
-        file_format = os.path.splitext(filename)[-1].lower()
-        if file_format not in SUPPORTED_FORMATS:
-            if file_format == '.xls':
-                msg = ('openpyxl does not support the old .xls file format, '
-                       'please use xlrd to read this file, or convert it to '
-                       'the more recent .xlsx file format.')
-            elif file_format == '.xlsb':
-                msg = ('openpyxl does not support binary format .xlsb, '
-                       'please convert this file to .xlsx format if you want '
-                       'to open it with openpyxl')
-            else:
-                msg = ('openpyxl does not support %s file format, '
-                       'please check you can open '
-                       'it with Excel first. '
-                       'Supported formats are: %s') % (file_format,
-                                                       ','.join(SUPPORTED_FORMATS))
-            raise InvalidFileException(msg)
+        _check_format(filename)
+    elif not (hasattr(filename, 'seekable') and filename.seekable()):
+        filename = BytesIO(filename.read())
 
     archive = ZipFile(filename, 'r')
     return archive
 
 
+class SourceFile:
+    """
+    File which a workbook keeps reading from after it has been loaded.
+    It is read into memory before it is overwritten.
+    """
+
+    def __init__(self, filename):
+        self.name = os.fspath(filename)
+        self.fp = open(filename, "rb")
+
+
+    def read(self, size=-1):
+        return self.fp.read(size)
+
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self.fp.seek(offset, whence)
+
+
+    def tell(self):
+        return self.fp.tell()
+
+
+    def seekable(self):
+        return True
+
+
+    def close(self):
+        self.fp.close()
+
+
+    def detach(self, filename):
+        """
+        Read the file into memory if `filename` is the same file
+        """
+        if isinstance(self.fp, BytesIO) or self.fp.closed:
+            return
+        try:
+            same = os.path.samefile(self.name, filename)
+        except (OSError, TypeError, ValueError):
+            return
+        if same:
+            fp = self.fp
+            pos = fp.tell()
+            fp.seek(0)
+            self.fp = BytesIO(fp.read())
+            self.fp.seek(pos)
+            fp.close()
+
+
+def _unique_strings(strings):
+    """
+    Shared strings can be written unchanged if they are unique and have no
+    formatting
+    """
+    return (all(type(s) is str for s in strings)
+            and len(set(strings)) == len(strings))
+
+
+def _skipped_parts(include=None, skip=()):
+    """
+    Parts of worksheets which will not be read
+    """
+    skip = frozenset(skip)
+    names = skip
+    if include is not None:
+        include = frozenset(include)
+        names = names | include
+        skip = skip | (OPTIONAL_PARTS - include)
+    unknown = names - OPTIONAL_PARTS - REQUIRED_PARTS
+    if unknown:
+        raise ValueError(f"Unknown parts {', '.join(sorted(unknown))}")
+    required = skip & REQUIRED_PARTS
+    if required:
+        raise ValueError(f"{', '.join(sorted(required))} cannot be skipped")
+    return skip
+
+
+def _keep_vba_part(name):
+    """
+    Parts which are needed to preserve VBA: the macros and controls, any
+    VML drawings, the manifest and the package relationships
+    """
+    if name.endswith("/"):
+        # directory
+        return False
+    return (ARC_VBA.match(name) is not None
+            or name.endswith(".vml")
+            or name in (ARC_CONTENT_TYPES, ARC_ROOT_RELS))
+
+
 def _find_workbook_part(package):
     workbook_types = [XLTM, XLTX, XLSM, XLSX]
     for ct in workbook_types:
@@ -119,7 +231,19 @@ class ExcelReader:
     """
 
     def __init__(self, fn, read_only=False, keep_vba=KEEP_VBA,
-                 data_only=False, keep_links=True, rich_text=False):
+                 data_only=False, keep_links=True, rich_text=False, workers=None,
+                 lazy=False, row_index=False, sheets=None, include=None, skip=(),
+                 compact_cells=False):
+        self.lazy = lazy and not read_only
+        self.sheets = None if sheets is None else set(sheets)
+        self.skip = _skipped_parts(include, skip)
+        # the archive is needed after reading if parts are read later or copied
+        self.deferred = not read_only and bool(
+            self.lazy or self.sheets is not None or self.skip)
+        self.source = None
+        if self.deferred and not hasattr(fn, 'read'):
+            _check_format(fn)
+            fn = self.source = SourceFile(fn)
         self.archive = _validate_archive(fn)
         self.valid_files = self.archive.namelist()
         self.read_only = read_only
@@ -127,7 +251,11 @@ class ExcelReader:
         self.data_only = data_only
         self.keep_links = keep_links
         self.rich_text = rich_text
+        self.workers = workers
+        self.row_index = row_index
+        self.compact_cells = compact_cells
         self.shared_strings = []
+        self.raw_source = None
 
 
     def read_manifest(self):
@@ -155,17 +283,22 @@ class ExcelReader:
         wb._sheets = []
         wb._data_only = self.data_only
         wb._read_only = self.read_only
+        wb.compact_cells = self.compact_cells
         wb.template = wb_part.ContentType in (XLTX, XLTM)
 
-        # If are going to preserve the vba then attach a copy of the archive to the
-        # workbook so that is available for the save.
+        # If are going to preserve the vba then attach a copy of the parts
+        # that are needed to the workbook so that they are available for the
+        # save. The parts are copied without being decompressed.
         if self.keep_vba:
             wb.vba_archive = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
             for name in self.valid_files:
-                wb.vba_archive.writestr(name, self.archive.read(name))
+                if _keep_vba_part(name):
+                    copy_member(self.archive, name, wb.vba_archive)
 
         if self.read_only:
             wb._archive = self.archive
+        elif self.source is not None:
+            wb._source = self.source
 
         self.wb = wb
 
@@ -209,8 +342,54 @@ class ExcelReader:
                 cs.add_chart(c)
 
 
+    def _get_pool(self):
+        """
+        Start parsing worksheets in parallel if requested and possible.
+        Worker processes need to be able to open the archive themselves.
+        """
+        if self.read_only or self.lazy or not self.workers or self.workers < 2:
+            return
+        if not isinstance(self.archive.filename, str):
+            return
+
+        paths = [rel.target for sheet, rel in self.parser.find_sheets()
+                 if rel.target in self.valid_files and "chartsheet" not in rel.Type
+                 and not self._defer(sheet)]
+        if len(paths) < 2:
+            return
+
+        from ._parallel import WorksheetPool
+        return WorksheetPool(self, paths, self.workers)
+
+
+    def _defer(self, sheet):
+        """
+        Whether a worksheet is only read when it is first used
+        """
+        return self.lazy or self.sheets is not None and sheet.name not in self.sheets
+
+
     def read_worksheets(self):
-        comment_warning = """Cell '{0}':{1} is part of a merged range but has a comment which will be removed because merged cells cannot contain any data."""
+        pool = self._get_pool()
+        try:
+            self._read_worksheets(pool)
+        finally:
+            if pool is not None:
+                pool.close()
+
+
+    def _read_worksheets(self, pool=None):
+        # worksheets can only be copied if shared strings will be unchanged
+        copyable = self.deferred and _unique_strings(self.shared_strings)
+
+        if self.skip and not self.read_only:
+            caches = {}
+            if "pivots" in self.skip:
+                rels = self.parser.rels
+                caches = {rels.get(c.id).target:c.cacheId for c in self.parser.caches
+                          if c.id in rels}
+            self.raw_source = RawSource(self.archive, self.package, caches)
+
         for sheet, rel in self.parser.find_sheets():
             if rel.target not in self.valid_files:
                 continue
@@ -225,10 +404,19 @@ class ExcelReader:
                 rels = get_dependents(self.archive, rels_path)
 
             if self.read_only:
-                ws = ReadOnlyWorksheet(self.wb, sheet.name, rel.target, self.shared_strings)
+                ws = ReadOnlyWorksheet(self.wb, sheet.name, rel.target,
+                                       self.shared_strings, self.row_index)
                 ws.sheet_state = sheet.state
                 self.wb._sheets.append(ws)
                 continue
+            elif self._defer(sheet):
+                self.read_lazy_worksheet(sheet, rel, rels, copyable)
+                continue
+            elif pool is not None:
+                ws = self.wb.create_sheet(sheet.name)
+                ws._rels = rels
+                ws_parser = pool.reader(ws, rel.target)
+                ws_parser.bind_all()
             else:
                 fh = self.archive.open(rel.target)
                 ws = self.wb.create_sheet(sheet.name)
@@ -237,40 +425,79 @@ class ExcelReader:
                 ws_parser.bind_all()
                 fh.close()
 
-            # assign any comments to cells
-            for r in rels.find(COMMENTS_NS):
-                src = self.archive.read(r.target)
-                comment_sheet = CommentSheet.from_tree(fromstring(src))
-                for ref, comment in comment_sheet.comments:
-                    try:
-                        ws[ref].comment = comment
-                    except AttributeError:
-                        c = ws[ref]
-                        if isinstance(c, MergedCell):
-                            warnings.warn(comment_warning.format(ws.title, c.coordinate))
-                            continue
-
-            # preserve link to VML file if VBA
-            if self.wb.vba_archive and ws.legacy_drawing:
-                ws.legacy_drawing = rels.get(ws.legacy_drawing).target
-            else:
-                ws.legacy_drawing = None
-
-            for t in ws_parser.tables:
-                src = self.archive.read(t)
-                xml = fromstring(src)
-                table = Table.from_tree(xml)
-                ws.add_table(table)
-
-            drawings = rels.find(SpreadsheetDrawing._rel_type)
-            for rel in drawings:
-                charts, images = find_images(self.archive, rel.target)
-                for c in charts:
-                    ws.add_chart(c, c.anchor)
-                for im in images:
-                    ws.add_image(im, im.anchor)
-
-            pivot_rel = rels.find(TableDefinition.rel_type)
+            self.bind_related(ws, ws_parser, rels)
+            ws.sheet_state = sheet.state
+
+        if self.sheets is not None:
+            missing = self.sheets - set(self.wb.sheetnames)
+            if missing:
+                raise KeyError(f"Worksheets {', '.join(sorted(missing))} do not exist")
+
+
+    def bind_related(self, ws, ws_parser, rels):
+        """
+        Add the parts related to a worksheet: comments, tables, drawings and
+        pivot tables. Parts which are skipped are kept so that they can be
+        copied when the workbook is saved.
+        """
+        comment_warning = """Cell '{0}':{1} is part of a merged range but has a comment which will be removed because merged cells cannot contain any data."""
+
+        raw = []
+
+        def keep(kind, rel):
+            part = RawPart(self.raw_source, rel, kind, f"raw{len(raw) + 1}")
+            raw.append(part)
+
+        # assign any comments to cells
+        for r in rels.find(COMMENTS_NS):
+            if "comments" in self.skip:
+                keep("comments", r)
+                continue
+            src = self.archive.read(r.target)
+            comment_sheet = CommentSheet.from_tree(fromstring(src))
+            for ref, comment in comment_sheet.comments:
+                try:
+                    ws[ref].comment = comment
+                except AttributeError:
+                    c = ws[ref]
+                    if isinstance(c, MergedCell):
+                        warnings.warn(comment_warning.format(ws.title, c.coordinate))
+                        continue
+
+        # preserve link to VML file if VBA
+        if ws.legacy_drawing and "comments" in self.skip:
+            rel = rels.to_dict().get(ws.legacy_drawing)
+            if rel is not None:
+                keep("comments", rel)
+            ws.legacy_drawing = None
+        elif self.wb.vba_archive and ws.legacy_drawing:
+            ws.legacy_drawing = rels.get(ws.legacy_drawing).target
+        else:
+            ws.legacy_drawing = None
+
+        for t in ws_parser.tables:
+            src = self.archive.read(t)
+            xml = fromstring(src)
+            table = Table.from_tree(xml)
+            ws.add_table(table)
+
+        drawings = rels.find(SpreadsheetDrawing._rel_type)
+        for rel in drawings:
+            if self.skip & {"charts", "images"}:
+                # charts and images share drawings
+                keep("drawing", rel)
+                continue
+            charts, images = find_images(self.archive, rel.target)
+            for c in charts:
+                ws.add_chart(c, c.anchor)
+            for im in images:
+                ws.add_image(im, im.anchor)
+
+        pivot_rel = rels.find(TableDefinition.rel_type)
+        if "pivots" in self.skip:
+            for r in pivot_rel:
+                keep("pivot", r)
+        else:
             pivot_caches = self.parser.pivot_caches
             for r in pivot_rel:
                 pivot_path = r.Target
@@ -280,7 +507,42 @@ class ExcelReader:
                 pivot.cache = pivot_caches[pivot.cacheId]
                 ws.add_pivot(pivot)
 
-            ws.sheet_state = sheet.state
+        if raw:
+            ws._raw_parts = raw
+
+
+    def read_lazy_worksheet(self, sheet, rel, rels, copyable=False):
+        """
+        Add a placeholder which reads the worksheet when it is first used.
+        Worksheets which only link to external hyperlinks can be copied
+        unchanged when the workbook is saved.
+        """
+        def loader(ws):
+            ws._rels = rels
+            with self.archive.open(rel.target) as fh:
+                ws_parser = WorksheetReader(ws, fh, self.shared_strings, self.data_only, self.rich_text)
+                ws_parser.bind_all()
+            self.bind_related(ws, ws_parser, rels)
+
+        source = None
+        if copyable and all(r.TargetMode == "External" and r.Type.endswith("/hyperlink")
+                                           for r in rels):
+            rels_path = get_rels_path(rel.target)
+            if rels_path not in self.valid_files:
+                rels_path = None
+            source = (self.archive, rel.target, rels_path, self.shared_strings)
+
+        ws = LazyWorksheet(self.wb, sheet.name, loader, source)
+        ws.sheet_state = sheet.state
+
+        # the defined name of a filter is written from the worksheet
+        names = self.parser.defined_names.by_sheet().get(len(self.wb._sheets), {})
+        flt = names.get("_xlnm._FilterDatabase")
+        if flt is not None:
+            for _, cells in flt.destinations:
+                ws.auto_filter = AutoFilter(ref=cells.replace("$", ""))
+
+        self.wb._add_sheet(ws)
 
 
     def read(self):
@@ -303,7 +565,7 @@ class ExcelReader:
             self.read_worksheets()
             action = "assign names"
             self.parser.assign_names()
-            if not self.read_only:
+            if not (self.read_only or self.deferred):
                 self.archive.close()
         except ValueError as e:
             raise ValueError(
@@ -314,7 +576,9 @@ class ExcelReader:
 
 
 def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=True, rich_text=False):
+                  data_only=False, keep_links=True, rich_text=False, workers=None,
+                  lazy=False, row_index=False, sheets=None, include=None,
+                  skip=(), compact_cells=False):
     """Open the given filename and return the workbook
 
     :param filename: the path to open or a file-like object
@@ -335,6 +599,27 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
     :param rich_text: if set to True openpyxl will preserve any rich text formatting in cells. The default is False
     :type rich_text: bool
 
+    :param workers: number of processes used to parse worksheets in parallel. Only used for files on disk in the standard mode. The default is None, which parses worksheets one after another
+    :type workers: int
+
+    :param lazy: read worksheets when they are first used. Worksheets that are not used are copied unchanged when the workbook is saved. The default is False
+    :type lazy: bool
+
+    :param row_index: index the rows of worksheets in read-only mode the first time they are read so that later reads can start at the rows needed. Worksheets are decompressed to temporary files for this. The default is False
+    :type row_index: bool
+
+    :param sheets: titles of the worksheets to read. Other worksheets are only read when they are first used, or copied unchanged when the workbook is saved. The default is None, which reads all worksheets
+    :type sheets: list of strings
+
+    :param include: parts of worksheets to read: "cells", "styles", "charts", "comments", "images" and "pivots". Cells and styles are always read. The default is None, which reads all parts
+    :type include: list of strings
+
+    :param skip: parts of worksheets not to read: "charts", "comments", "images" or "pivots". Parts which are not read are copied unchanged when the workbook is saved. Charts and images share drawings so skipping either skips both
+    :type skip: list of strings
+
+    :param compact_cells: keep the values, types and styles of cells in arrays instead of cell objects, which are only created when they are used. This uses much less memory for large worksheets. The default is False
+    :type compact_cells: bool
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
@@ -344,6 +629,7 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
 
     """
     reader = ExcelReader(filename, read_only, keep_vba,
-                         data_only, keep_links, rich_text)
+                         data_only, keep_links, rich_text, workers, lazy,
+                         row_index, sheets, include, skip, compact_cells)
     reader.read()
     return reader.wb
@@ -23,6 +23,9 @@ def test_read_drawing(datadir):
     from ..drawings import find_images
     images = find_images(archive, path)[1]
     assert len(images) == 3
+    # images are not decoded
+    assert images[0]._width is None
+    assert images[0]._data() == archive.read("xl/media/image1.png")
 
 
 def test_unsupport_drawing(datadir):
@@ -10,6 +10,7 @@ from openpyxl.packaging.relationship import Relationship
 from openpyxl.utils.exceptions import InvalidFileException
 from openpyxl.xml.functions import fromstring
 from openpyxl.xml.constants import (
+    ARC_CONTENT_TYPES,
     ARC_WORKBOOK,
     XLSM,
     XLSX,
@@ -142,7 +143,29 @@ def test_load_workbook_with_vba(datadir, load_workbook):
     with open(test_file, 'rb') as f:
         wb2 = load_workbook(BytesIO(f.read()), keep_vba=True)
     assert wb1.vba_archive.namelist() == wb2.vba_archive.namelist()
-    assert wb1.vba_archive.namelist() == ZipFile(test_file, 'r').namelist()
+    assert wb1.vba_archive.namelist() == [
+        '[Content_Types].xml',
+        '_rels/.rels',
+        'xl/drawings/vmlDrawing2.vml',
+        'xl/drawings/vmlDrawing1.vml',
+        'xl/ctrlProps/ctrlProp1.xml',
+    ]
+
+
+def test_vba_parts_not_recompressed(datadir, load_workbook, tmpdir):
+    from openpyxl.writer._archive import read_compressed
+    datadir.chdir()
+
+    source = ZipFile("legacy_drawing.xlsm")
+    wb = load_workbook("legacy_drawing.xlsm", keep_vba=True)
+    name = "xl/ctrlProps/ctrlProp1.xml"
+    expected = read_compressed(source, name)[1]
+    assert read_compressed(wb.vba_archive, name)[1] == expected
+
+    tmpdir.chdir()
+    wb.save("legacy_drawing.xlsm")
+    with ZipFile("legacy_drawing.xlsm") as archive:
+        assert read_compressed(archive, name)[1] == expected
 
 
 def test_no_external_links(datadir, load_workbook):
@@ -245,3 +268,263 @@ class TestExcelReader:
 
         reader.read_chartsheet(sheet, rel)
         assert reader.wb['chart'].title == "chart"
+
+
+    def test_read_worksheets_parallel(self, tmpdir):
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
+        tmpdir.chdir()
+        wb = Workbook()
+        for idx in range(3):
+            ws = wb.create_sheet(f"Sheet{idx}")
+            for row in range(1, 10):
+                ws.append([row * idx, f"{row}", "=A1+1"])
+            ws["B2"].font = Font(bold=True)
+            ws.merge_cells("E1:F2")
+        wb.save("parallel.xlsx")
+
+        serial = ExcelReader("parallel.xlsx")
+        serial.read()
+
+        parallel = ExcelReader("parallel.xlsx", workers=2)
+        parallel.read()
+
+        assert serial.wb.sheetnames == parallel.wb.sheetnames
+        for ws1, ws2 in zip(serial.wb, parallel.wb):
+            assert list(ws1.values) == list(ws2.values)
+            assert ws1["B2"].font.b == ws2["B2"].font.b
+            assert ws1.merged_cells.ranges == ws2.merged_cells.ranges
+
+
+    def test_parallel_needs_filename(self, tmpdir):
+        from openpyxl import Workbook
+
+        tmpdir.chdir()
+        wb = Workbook()
+        wb.create_sheet()
+        wb.save("parallel.xlsx")
+
+        with open("parallel.xlsx", "rb") as src:
+            reader = ExcelReader(BytesIO(src.read()), workers=2)
+        reader.read_manifest()
+        reader.read_workbook()
+        assert reader._get_pool() is None
+
+
+    def test_read_worksheets_lazy(self, tmpdir):
+        from zipfile import ZipFile
+        from openpyxl import Workbook
+        from openpyxl.comments import Comment
+        from openpyxl.worksheet._lazy import LazyWorksheet
+
+        tmpdir.chdir()
+        wb = Workbook()
+        wb.active.append(["a", "b"])
+        ws = wb.create_sheet("Filtered")
+        ws.append(["c", "a"])
+        ws.auto_filter.ref = "A1:B1"
+        ws = wb.create_sheet("Commented")
+        ws["A1"].comment = Comment("note", "author")
+        wb.save("lazy.xlsx")
+
+        reader = ExcelReader("lazy.xlsx", lazy=True)
+        reader.read()
+        wb = reader.wb
+        assert [type(ws) for ws in wb._sheets] == [LazyWorksheet] * 3
+        assert wb["Filtered"].auto_filter.ref == "A1:B1"
+
+        wb.active["A2"] = "new"
+        assert type(wb.active) is not LazyWorksheet
+        wb.save("lazy.xlsx")
+
+        with ZipFile("lazy.xlsx") as archive:
+            assert b"_FilterDatabase" in archive.read("xl/workbook.xml")
+
+        reader = ExcelReader("lazy.xlsx")
+        reader.read()
+        wb = reader.wb
+        assert list(wb["Sheet"].values) == [("a", "b"), ("new", None)]
+        assert list(wb["Filtered"].values) == [("c", "a")]
+        assert wb["Filtered"].auto_filter.ref == "A1:B1"
+        assert wb["Commented"]["A1"].comment.text == "note"
+
+
+    def test_lazy_source(self, tmpdir):
+        from openpyxl import Workbook
+        from ..excel import SourceFile
+
+        tmpdir.chdir()
+        wb = Workbook()
+        wb.active.append(["a", "b"])
+        wb.save("lazy.xlsx")
+
+        reader = ExcelReader("lazy.xlsx", lazy=True)
+        reader.read()
+        wb = reader.wb
+        assert type(wb._source) is SourceFile
+        assert not isinstance(wb._source.fp, BytesIO)
+        wb.save("copy.xlsx")
+        assert not isinstance(wb._source.fp, BytesIO)
+        wb.save("lazy.xlsx")
+        assert isinstance(wb._source.fp, BytesIO)
+        wb.save("lazy.xlsx")
+
+        reader = ExcelReader("lazy.xlsx")
+        reader.read()
+        assert list(reader.wb.active.values) == [("a", "b")]
+
+        with open("copy.xlsx", "rb") as src:
+            reader = ExcelReader(src, lazy=True)
+            assert reader.archive.fp is src
+        assert reader.source is None
+
+
+    def test_non_seekable_stream(self, datadir):
+
+        class Stream:
+
+            def __init__(self, data):
+                self.src = BytesIO(data)
+
+            def read(self, size=-1):
+                return self.src.read(size)
+
+            def seekable(self):
+                return False
+
+        datadir.chdir()
+        with open("complex-styles.xlsx", "rb") as src:
+            stream = Stream(src.read())
+        reader = ExcelReader(stream, lazy=True)
+        reader.read()
+        assert reader.wb.sheetnames == ["Sheet1"]
+
+
+    @pytest.mark.parametrize("include, skip, expected",
+                             [
+                                 (None, (), set()),
+                                 (None, ["pivots"], {"pivots"}),
+                                 (("cells", "styles"), (),
+                                  {"charts", "comments", "images", "pivots"}),
+                                 (("cells", "charts", "images"), ["pivots"],
+                                  {"comments", "pivots"}),
+                             ]
+                             )
+    def test_skipped_parts(self, include, skip, expected):
+        from ..excel import _skipped_parts
+        assert _skipped_parts(include, skip) == expected
+
+
+    @pytest.mark.parametrize("include, skip",
+                             [
+                                 (None, ["cells"]),
+                                 (None, ["shapes"]),
+                                 (["values"], ()),
+                             ]
+                             )
+    def test_invalid_skipped_parts(self, include, skip):
+        from ..excel import _skipped_parts
+        with pytest.raises(ValueError):
+            _skipped_parts(include, skip)
+
+
+    def test_read_worksheets_selected(self, tmpdir):
+        from openpyxl import Workbook
+        from openpyxl.worksheet._lazy import LazyWorksheet
+
+        tmpdir.chdir()
+        wb = Workbook()
+        wb.active.append(["a", "b"])
+        wb.create_sheet("Data").append([1, 2])
+        wb.save("selected.xlsx")
+
+        reader = ExcelReader("selected.xlsx", sheets=["Data"])
+        reader.read()
+        wb = reader.wb
+        assert type(wb["Sheet"]) is LazyWorksheet
+        assert type(wb["Data"]) is not LazyWorksheet
+        assert list(wb["Sheet"].values) == [("a", "b")]
+
+        with pytest.raises(KeyError):
+            ExcelReader("selected.xlsx", sheets=["Missing"]).read()
+
+
+    def test_skip_pivots(self, datadir, tmpdir):
+        datadir.chdir()
+        reader = ExcelReader("pivot.xlsx", skip=["pivots"])
+        reader.read()
+        ws = reader.wb["ptsheet"]
+        assert ws._pivots == []
+        assert [p.kind for p in ws._raw_parts] == ["pivot"]
+
+        tmpdir.chdir()
+        reader.wb.save("pivot.xlsx")
+        reader = ExcelReader("pivot.xlsx")
+        reader.read()
+        pivot = reader.wb["ptsheet"]._pivots[0]
+        assert pivot.cacheId == 68
+        assert pivot.cache.records is not None
+
+
+    @pytest.mark.pil_required
+    def test_skip_images(self, datadir, tmpdir):
+        datadir.chdir()
+        reader = ExcelReader("sample_with_images.xlsx", skip=["images"])
+        reader.read()
+        ws = reader.wb.active
+        assert ws._images == []
+
+        tmpdir.chdir()
+        reader.wb.save("images.xlsx")
+        with ZipFile("images.xlsx") as archive:
+            assert "xl/drawings/raw/drawing1.xml" in archive.namelist()
+        reader = ExcelReader("images.xlsx")
+        reader.read()
+        assert len(reader.wb.active._images) == 3
+
+
+    @pytest.mark.parametrize("include, skip",
+                             [
+                                 (None, ["images"]),
+                                 (["cells"], ()),
+                             ]
+                             )
+    def test_skip_unregistered_images(self, datadir, tmpdir, include, skip):
+        datadir.chdir()
+        reader = ExcelReader("sample_with_unsupported_image_format.xlsx",
+                             include=include, skip=skip)
+        reader.read()
+
+        tmpdir.chdir()
+        reader.wb.save("images.xlsx")
+        with ZipFile("images.xlsx") as archive:
+            assert "xl/media/raw/image1.wmf" in archive.namelist()
+            manifest = Manifest.from_tree(fromstring(archive.read(ARC_CONTENT_TYPES)))
+        assert ("wmf", "image/wmf") in [(d.Extension, d.ContentType) for d in manifest.Default]
+
+
+    def test_skip_comments(self, tmpdir):
+        from openpyxl import Workbook
+        from openpyxl.comments import Comment
+
+        tmpdir.chdir()
+        wb = Workbook()
+        wb.active["A1"].comment = Comment("note", "author")
+        wb.create_sheet("Other")["A1"].comment = Comment("other", "author")
+        wb.save("comments.xlsx")
+
+        reader = ExcelReader("comments.xlsx", include=["cells", "styles"])
+        reader.read()
+        wb = reader.wb
+        assert wb.active["A1"].comment is None
+        wb["Other"]["B1"].comment = Comment("new", "author")
+        with pytest.warns(UserWarning):
+            wb.save("comments.xlsx")
+
+        reader = ExcelReader("comments.xlsx")
+        reader.read()
+        wb = reader.wb
+        assert wb.active["A1"].comment.text == "note"
+        assert wb["Other"]["A1"].comment is None
+        assert wb["Other"]["B1"].comment.text == "new"
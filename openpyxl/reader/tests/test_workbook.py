@@ -193,3 +193,16 @@ class TestWorkbookParser:
         parser.assign_names()
 
         assert recwarn.pop().category == UserWarning
+
+
+    def test_pivot_caches(self, datadir, WorkbookParser):
+        from openpyxl.pivot.record import RecordSource
+        datadir.chdir()
+        archive = ZipFile("pivot.xlsx")
+
+        parser = WorkbookParser(archive, ARC_WORKBOOK)
+        parser.parse()
+        caches = parser.pivot_caches
+        assert list(caches) == [68]
+        assert isinstance(caches[68]._records, RecordSource)
+        assert parser.pivot_caches is caches
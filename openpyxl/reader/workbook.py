@@ -14,7 +14,7 @@ from openpyxl.workbook import Workbook
 from openpyxl.workbook.defined_name import DefinedNameList
 from openpyxl.workbook.external_link.external import read_external_link
 from openpyxl.pivot.cache import CacheDefinition
-from openpyxl.pivot.record import RecordList
+from openpyxl.pivot.record import RecordList, RecordSource
 from openpyxl.worksheet.print_settings import PrintTitles, PrintArea
 
 from openpyxl.utils.datetime import CALENDAR_MAC_1904
@@ -23,6 +23,7 @@ from openpyxl.utils.datetime import CALENDAR_MAC_1904
 class WorkbookParser:
 
     _rels = None
+    _pivot_caches = None
 
     def __init__(self, archive, workbook_part_name, keep_links=True):
         self.archive = archive
@@ -121,13 +122,20 @@ class WorkbookParser:
     @property
     def pivot_caches(self):
         """
-        Get PivotCache objects
+        Get PivotCache objects. They are read the first time they are needed
+        but their records are only parsed when they are used.
         """
-        d = {}
-        for c in self.caches:
-            cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
-            if cache.deps:
-                records = get_rel(self.archive, cache.deps, cache.id, RecordList)
-                cache.records = records
-            d[c.cacheId] = cache
-        return d
+        if self._pivot_caches is None:
+            d = {}
+            for c in self.caches:
+                cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
+                if cache.deps:
+                    if cache.id is not None:
+                        rel = cache.deps.get(cache.id)
+                    else:
+                        rel = next(cache.deps.find(RecordList.rel_type), None)
+                    if rel is not None:
+                        cache.records = RecordSource(self.archive, rel.target)
+                d[c.cacheId] = cache
+            self._pivot_caches = d
+        return self._pivot_caches
@@ -1,6 +1,7 @@
 # Copyright (c) 2010-2024 openpyxl
 
 from array import array
+from weakref import WeakValueDictionary
 
 from openpyxl.descriptors.serialisable import Serialisable
 from openpyxl.descriptors import (
@@ -65,6 +66,67 @@ class StyleArray(array):
         return StyleArray((self))
 
 
+class SharedStyleArray(StyleArray):
+    """
+    Immutable StyleArray shared by all the objects with the same style.
+    Objects are given a new one when their style changes.
+    """
+
+    __slots__ = ('_index',) # position in the cell styles of a workbook
+
+    def __new__(cls, args=[0]*9):
+        self = super().__new__(cls, args)
+        self._index = None
+        return self
+
+
+    def __setitem__(self, key, value):
+        raise TypeError("Shared styles cannot be changed")
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class BoundStyleArray(StyleArray):
+    """
+    Mutable copy of the shared style of an object.
+    Changing it gives the object a new shared style.
+    """
+
+    __slots__ = ('_owner',)
+
+    def __new__(cls, owner, args=[0]*9):
+        self = super().__new__(cls, args)
+        self._owner = owner
+        return self
+
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._owner._style_array = shared_style(self)
+
+
+_shared_styles = WeakValueDictionary()
+
+
+def shared_style(style):
+    """
+    Return the shared StyleArray with the same values as `style`
+    """
+    if type(style) is SharedStyleArray:
+        return style
+    key = tuple(style)
+    shared = _shared_styles.get(key)
+    if shared is None:
+        shared = _shared_styles[key] = SharedStyleArray(key)
+    return shared
+
+
 class CellStyle(Serialisable):
 
     tagname = "xf"
@@ -1,18 +1,56 @@
 # Copyright (c) 2010-2024 openpyxl
 
-from copy import copy
-
 from .numbers import (
     BUILTIN_FORMATS,
     BUILTIN_FORMATS_MAX_SIZE,
     BUILTIN_FORMATS_REVERSE,
 )
 from .proxy import StyleProxy
-from .cell_style import StyleArray
+from .cell_style import (
+    StyleArray,
+    SharedStyleArray,
+    BoundStyleArray,
+    shared_style,
+)
 from .named_styles import NamedStyle
 from .builtins import styles
 
 
+DEFAULT_STYLE = shared_style(StyleArray())
+
+
+def _get_style(instance):
+    style = instance._style
+    if style is None:
+        return DEFAULT_STYLE
+    return style
+
+
+def _set_style(instance, key, value):
+    """
+    Styles are shared so a new one is used whenever a style is changed
+    """
+    style = StyleArray(_get_style(instance))
+    setattr(style, key, value)
+    instance._style = shared_style(style)
+
+
+def style_index(styles, style):
+    """
+    Return the position of a style in the cell styles of a workbook
+    """
+    if type(style) is not SharedStyleArray:
+        return styles.add(style)
+    # the position of shared styles is kept to avoid hashing them
+    idx = style._index
+    if idx is not None and idx < len(styles) and styles[idx] is style:
+        return idx
+    idx = styles.add(style)
+    if styles[idx] is style:
+        style._index = idx
+    return idx
+
+
 class StyleDescriptor:
 
     def __init__(self, collection, key):
@@ -21,16 +59,12 @@ class StyleDescriptor:
 
     def __set__(self, instance, value):
         coll = getattr(instance.parent.parent, self.collection)
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        setattr(instance._style, self.key, coll.add(value))
+        _set_style(instance, self.key, coll.add(value))
 
 
     def __get__(self, instance, cls):
         coll = getattr(instance.parent.parent, self.collection)
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        idx =  getattr(instance._style, self.key)
+        idx =  getattr(_get_style(instance), self.key)
         return StyleProxy(coll[idx])
 
 
@@ -45,16 +79,11 @@ class NumberFormatDescriptor:
             idx = BUILTIN_FORMATS_REVERSE[value]
         else:
             idx = coll.add(value) + BUILTIN_FORMATS_MAX_SIZE
-
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        setattr(instance._style, self.key, idx)
+        _set_style(instance, self.key, idx)
 
 
     def __get__(self, instance, cls):
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        idx = getattr(instance._style, self.key)
+        idx = getattr(_get_style(instance), self.key)
         if idx < BUILTIN_FORMATS_MAX_SIZE:
             return BUILTIN_FORMATS.get(idx, "General")
         coll = getattr(instance.parent.parent, self.collection)
@@ -68,8 +97,6 @@ class NamedStyleDescriptor:
 
 
     def __set__(self, instance, value):
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
         coll = getattr(instance.parent.parent, self.collection)
         if isinstance(value, NamedStyle):
             style = value
@@ -84,13 +111,11 @@ class NamedStyleDescriptor:
                 raise ValueError("{0} is not a known style".format(value))
         else:
             style = coll[value]
-        instance._style = copy(style.as_tuple())
+        instance._style = shared_style(style.as_tuple())
 
 
     def __get__(self, instance, cls):
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        idx = getattr(instance._style, self.key)
+        idx = getattr(_get_style(instance), self.key)
         coll = getattr(instance.parent.parent, self.collection)
         return coll.names[idx]
 
@@ -101,15 +126,11 @@ class StyleArrayDescriptor:
         self.key = key
 
     def __set__(self, instance, value):
-        if instance._style is None:
-            instance._style = StyleArray()
-        setattr(instance._style, self.key, value)
+        _set_style(instance, self.key, value)
 
 
     def __get__(self, instance, cls):
-        if instance._style is None:
-            return False
-        return bool(getattr(instance._style, self.key))
+        return bool(getattr(_get_style(instance), self.key))
 
 
 class StyleableObject:
@@ -127,25 +148,45 @@ class StyleableObject:
     quotePrefix = StyleArrayDescriptor('quotePrefix')
     pivotButton = StyleArrayDescriptor('pivotButton')
 
-    __slots__ = ('parent', '_style')
+    __slots__ = ('parent', '_style_array')
 
     def __init__(self, sheet, style_array=None):
         self.parent = sheet
         if style_array is not None:
-            style_array = StyleArray(style_array)
-        self._style = style_array
+            style_array = shared_style(style_array)
+        self._style_array = style_array
+
+
+    @property
+    def _style(self):
+        """
+        Objects with the same style share it: changes to the array returned
+        are only applied to this object.
+        """
+        style = self._style_array
+        if style is not None:
+            return BoundStyleArray(self, style)
+
+
+    @_style.setter
+    def _style(self, value):
+        if value is not None:
+            value = shared_style(value)
+        self._style_array = value
 
 
     @property
     def style_id(self):
-        if self._style is None:
-            self._style = StyleArray()
-        return self.parent.parent._cell_styles.add(self._style)
+        style = self._style_array
+        if style is None:
+            style = self._style_array = DEFAULT_STYLE
+        return style_index(self.parent.parent._cell_styles, style)
 
 
     @property
     def has_style(self):
-        if self._style is None:
+        style = self._style_array
+        if style is None:
             return False
-        return any(self._style)
+        return any(style)
 
@@ -33,7 +33,7 @@ from .named_styles import (
     NamedStyleList,
     NamedStyle,
 )
-from .cell_style import CellStyle, CellStyleList
+from .cell_style import CellStyle, CellStyleList, shared_style
 
 
 class Stylesheet(Serialisable):
@@ -220,7 +220,8 @@ def apply_stylesheet(archive, wb):
         wb._table_styles = stylesheet.tableStyles
 
         # need to overwrite openpyxl defaults in case workbook has different ones
-        wb._cell_styles = stylesheet.cell_styles
+        wb._cell_styles = IndexedList(shared_style(s) for s in stylesheet.cell_styles)
+        wb._compact_styles = None
         wb._named_styles = stylesheet.named_styles
         wb._date_formats = stylesheet.date_formats
         wb._timedelta_formats = stylesheet.timedelta_formats
@@ -142,3 +142,30 @@ class TestNamedStyle:
         assert s1.pivotButton is False
         s1.pivotButton = True
         assert s1.pivotButton is True
+
+
+def test_shared_style(StyleableObject):
+    from copy import copy
+    from ..cell_style import SharedStyleArray
+    s1 = StyleableObject
+    s2 = copy(s1)
+    assert type(s1._style_array) is SharedStyleArray
+    assert s1._style_array is s2._style_array
+
+    s1._style.quotePrefix = 1
+    assert s1.quotePrefix is True
+    assert s2.quotePrefix is False
+    assert s1._style_array is not s2._style_array
+
+    s2.quotePrefix = True
+    assert s1._style_array is s2._style_array
+
+
+def test_shared_style_id(StyleableObject):
+    from ..cell_style import StyleArray
+    so = StyleableObject
+    so.parent.parent._cell_styles = IndexedList([StyleArray()])
+    so.quotePrefix = True
+    assert so.style_id == 1
+    assert so._style_array._index == 1
+    assert so.style_id == 1
@@ -21,6 +21,7 @@ from openpyxl.workbook.defined_name import (
 )
 from openpyxl.workbook.external_reference import ExternalReference
 from openpyxl.packaging.workbook import ChildSheet, WorkbookPackage, PivotCache
+from openpyxl.pivot.cache import CacheDefinition
 from openpyxl.workbook.properties import WorkbookProperties
 from openpyxl.utils.datetime import CALENDAR_MAC_1904
 
@@ -48,8 +49,9 @@ def get_active_sheet(wb):
 
 class WorkbookWriter:
 
-    def __init__(self, wb):
+    def __init__(self, wb, raw_caches=()):
         self.wb = wb
+        self.raw_caches = raw_caches
         self.rels = RelationshipList()
         self.package = WorkbookPackage()
         self.package.workbookProtection = wb.security
@@ -132,6 +134,14 @@ class WorkbookWriter:
                 c.id = rel.id
         #self.wb._pivots = [] # reset
 
+        # caches of pivot tables which were not read
+        for cache_id, path in self.raw_caches:
+            c = PivotCache(cacheId=cache_id)
+            self.package.pivotCaches.append(c)
+            rel = Relationship(Type=CacheDefinition.rel_type, Target="/" + path)
+            self.rels.append(rel)
+            c.id = rel.id
+
 
     def write_views(self):
         active = get_active_sheet(self.wb)
@@ -162,6 +172,10 @@ class WorkbookWriter:
         theme =  Relationship(type='theme', Target='theme/theme1.xml')
         self.rels.append(theme)
 
+        if self.wb.shared_strings:
+            strings =  Relationship(type='sharedStrings', Target='sharedStrings.xml')
+            self.rels.append(strings)
+
         if self.wb.vba_archive:
             vba =  Relationship(type='', Target='vbaProject.bin')
             vba.Type ='http://schemas.microsoft.com/office/2006/relationships/vbaProject'
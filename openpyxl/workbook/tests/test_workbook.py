@@ -310,6 +310,31 @@ class TestCopy:
             wb.copy_worksheet(ws)
 
 
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_read_parallel(self, Workbook, tmpdir, workers):
+        from openpyxl import load_workbook
+        tmpdir.chdir()
+        wb = Workbook()
+        ws = wb.active
+        for i in range(1, 50):
+            ws.append([i, f"s{i % 7}", datetime.date(2024, 1, i % 28 + 1), f"=A{i}"])
+        ws["F60"] = "last"
+        wb.save("sharded.xlsx")
+
+        wb = load_workbook("sharded.xlsx", read_only=True)
+        batches = list(wb.read_parallel("Sheet", workers=workers, shards=40))
+        assert len(batches) == 40
+        rows = [row for batch in batches for row in batch]
+        assert rows == list(wb["Sheet"].values)
+        wb.close()
+
+
+    def test_read_parallel_not_read_only(self, Workbook):
+        wb = Workbook()
+        with pytest.raises(ValueError):
+            wb.read_parallel(wb.active)
+
+
     def test_default_epoch(self, Workbook):
         wb = Workbook()
         assert wb.epoch == datetime.datetime(1899, 12, 30)
@@ -59,6 +59,10 @@ class Workbook:
     def __init__(self,
                  write_only=False,
                  iso_dates=False,
+                 inline_strings=False,
+                 max_shared_strings=None,
+                 max_buffer_size=None,
+                 compact_cells=False,
                  ):
         self._sheets = []
         self._pivots = []
@@ -80,6 +84,10 @@ class Workbook:
         self.epoch = WINDOWS_EPOCH
         self.encoding = "utf-8"
         self.iso_dates = iso_dates
+        self.inline_strings = inline_strings
+        self.max_shared_strings = max_shared_strings
+        self.max_buffer_size = max_buffer_size
+        self.compact_cells = compact_cells
 
         if not self.write_only:
             self._sheets.append(Worksheet(self))
@@ -112,6 +120,7 @@ class Workbook:
 
         self._colors = COLOR_INDEX
         self._cell_styles = IndexedList([StyleArray()])
+        self._compact_styles = None
         self._named_styles = NamedStyleList()
         self.add_named_style(NamedStyle(font=copy(DEFAULT_FONT), border=copy(DEFAULT_BORDER), builtinId=0))
         self._table_styles = TableStyleList()
@@ -370,10 +379,16 @@ class Workbook:
         return ct
 
 
-    def save(self, filename):
+    def save(self, filename, workers=None, compression=None):
         """Save the current workbook under the given `filename`.
         Use this function instead of using an `ExcelWriter`.
 
+        The parts of the workbook can be compressed by several threads while
+        the worksheets are being serialised by passing the number of `workers`.
+
+        `compression` can be 0 to store the parts without compression or
+        between 1 (fastest) and 9 (smallest) for the level of compression.
+
         .. warning::
             When creating your workbook using `write_only` set to True,
             you will only be able to call this function once. Subsequent attempts to
@@ -383,7 +398,7 @@ class Workbook:
             raise TypeError("""Workbook is read-only""")
         if self.write_only and not self.worksheets:
             self.create_sheet()
-        save_workbook(self, filename)
+        save_workbook(self, filename, workers=workers, compression=compression)
 
 
     @property
@@ -414,12 +429,43 @@ class Workbook:
         return to_worksheet
 
 
+    def read_parallel(self, sheet, workers=None, shards=None):
+        """
+        Read the values of a worksheet in read-only mode in a pool of
+        processes. The worksheet is split into shards of rows which are
+        returned as lists of rows in order.
+
+        :param sheet: the worksheet or its title
+        :type sheet: :class:`openpyxl.worksheet._read_only.ReadOnlyWorksheet` or str
+
+        :param workers: number of processes, defaults to the number of CPUs
+        :type workers: int
+
+        :param shards: number of shards, defaults to four per process
+        :type shards: int
+
+        :rtype: generator of lists of tuples
+        """
+        if not self._read_only:
+            raise ValueError("Worksheets can only be read in parallel in read-only mode")
+        if isinstance(sheet, str):
+            sheet = self[sheet]
+        from openpyxl.reader._parallel import read_shards
+        return read_shards(sheet, workers, shards)
+
+
     def close(self):
         """
-        Close workbook file if open. Only affects read-only and write-only modes.
+        Close workbook file if open. Only affects read-only and write-only
+        modes, and workbooks with worksheets or parts which are read later.
         """
         if hasattr(self, '_archive'):
             self._archive.close()
+            for ws in self._sheets:
+                if isinstance(ws, ReadOnlyWorksheet):
+                    ws._close()
+        if hasattr(self, '_source'):
+            self._source.close()
 
 
     def _duplicate_name(self, name):
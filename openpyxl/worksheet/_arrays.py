@@ -0,0 +1,114 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Collect the values of worksheet columns and convert them to NumPy arrays.
+"""
+
+from openpyxl.utils.datetime import from_excel, WINDOWS_EPOCH
+
+
+MS_PER_DAY = 86400000
+
+
+class ColumnBuffer:
+    """
+    Values of a single column. Dates and timedeltas are kept as Excel serials
+    so that columns containing only dates can be converted in one go.
+    """
+
+    __slots__ = ('values', 'kinds', 'count', 'dates', 'timedeltas')
+
+    def __init__(self, size=0):
+        self.values = [None] * size
+        self.kinds = set()
+        self.count = 0
+        self.dates = []
+        self.timedeltas = []
+
+
+    def set(self, idx, value, kind):
+        values = self.values
+        if idx >= len(values):
+            values.extend([None] * (idx + 1 - len(values)))
+        values[idx] = value
+        self.kinds.add(kind)
+        self.count += 1
+        if kind == "d":
+            self.dates.append(idx)
+        elif kind == "td":
+            self.timedeltas.append(idx)
+
+
+    def resize(self, size):
+        values = self.values
+        if size > len(values):
+            values.extend([None] * (size - len(values)))
+        else:
+            del values[size:]
+
+
+    def _infer_dtype(self):
+        kinds = self.kinds
+        complete = self.count == len(self.values)
+        if not kinds or kinds <= {"i", "n"}:
+            if kinds == {"i"} and complete:
+                return "int64"
+            return "float64"
+        elif kinds == {"d"}:
+            return "datetime64[ms]"
+        elif kinds == {"td"}:
+            return "timedelta64[ms]"
+        elif kinds == {"b"} and complete:
+            return "bool"
+        return "object"
+
+
+    def to_array(self, dtype=None, epoch=WINDOWS_EPOCH):
+        """
+        Convert the values to a NumPy array. The type is inferred from the
+        values if no dtype is given.
+        """
+        import numpy
+
+        if dtype is None:
+            dtype = self._infer_dtype()
+        dtype = numpy.dtype(dtype)
+
+        if dtype.kind == "M":
+            return _serials_to_datetimes(self.values, epoch).astype(dtype)
+        elif dtype.kind == "m":
+            return _serials_to_timedeltas(self.values).astype(dtype)
+        elif dtype.kind == "O":
+            values = list(self.values)
+            for idx in self.dates:
+                values[idx] = from_excel(values[idx], epoch)
+            for idx in self.timedeltas:
+                values[idx] = from_excel(values[idx], epoch, timedelta=True)
+            arr = numpy.empty(len(values), dtype=object)
+            arr[:] = values
+            return arr
+        elif dtype.kind == "f":
+            return numpy.array(self.values, dtype=float).astype(dtype)
+        return numpy.array(self.values, dtype=dtype)
+
+
+def _serials_to_timedeltas(values):
+    import numpy
+
+    serials = numpy.array(values, dtype=float)
+    missing = numpy.isnan(serials)
+    ms = numpy.round(numpy.where(missing, 0, serials) * MS_PER_DAY)
+    result = ms.astype("int64").astype("timedelta64[ms]")
+    result[missing] = numpy.timedelta64("NaT")
+    return result
+
+
+def _serials_to_datetimes(values, epoch=WINDOWS_EPOCH):
+    import numpy
+
+    serials = numpy.array(values, dtype=float)
+    if epoch == WINDOWS_EPOCH:
+        # adjust for < 1900-03-01
+        serials = numpy.where((serials > 0) & (serials < 60), serials + 1, serials)
+    deltas = _serials_to_timedeltas(serials)
+    return numpy.datetime64(epoch, "ms") + deltas
@@ -0,0 +1,612 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Compact storage for the cells of a worksheet.
+
+The values, types and styles of cells are kept in arrays for each row, and
+hyperlinks and comments in separate tables. Cell objects are only created
+when they are asked for and read from and write to the arrays, so changes
+are kept after they are discarded.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from openpyxl.cell.cell import Cell, MergedCell
+from openpyxl.styles.cell_style import shared_style
+from openpyxl.styles.styleable import style_index
+from openpyxl.utils.indexed_list import IndexedList
+
+from ._store import CellStore
+from .formula import SharedFormula
+
+
+DATA_TYPES = ('n', 's', 'f', 'b', 'e', 'd', 'str', 'inlineStr')
+TYPE_CODES = {t:idx for idx, t in enumerate(DATA_TYPES)}
+MERGED = 255 # merged cells are kept as objects
+
+
+def compact_styles(wb):
+    """
+    Styles of the cells of compact worksheets.
+
+    The list starts as a copy of the cell styles of the workbook so that
+    styles read from a file keep their position. Styles are only added to
+    the cell styles of the workbook when the cells which use them are
+    written, so styles which a cell only had while it was being styled are
+    not saved.
+    """
+    styles = wb._compact_styles
+    if styles is None:
+        styles = wb._compact_styles = IndexedList(wb._cell_styles)
+    return styles
+
+
+class CellRow:
+    """
+    Columns, values, type codes and style ids of the cells in a row,
+    ordered by column
+    """
+
+    __slots__ = ('columns', 'values', 'types', 'styles')
+
+    def __init__(self):
+        self.columns = array('H')
+        self.values = []
+        self.types = bytearray()
+        self.styles = array('I')
+
+
+    def __len__(self):
+        return len(self.columns)
+
+
+    def find(self, column):
+        """
+        Position of a column or -1 if there is no cell
+        """
+        columns = self.columns
+        idx = bisect_left(columns, column)
+        if idx < len(columns) and columns[idx] == column:
+            return idx
+        return -1
+
+
+    def insert(self, column, value=None, data_type=0, style=0):
+        """
+        Add a cell for a column which does not have one and return its position
+        """
+        columns = self.columns
+        if not columns or column > columns[-1]:
+            idx = len(columns)
+            columns.append(column)
+            self.values.append(value)
+            self.types.append(data_type)
+            self.styles.append(style)
+            return idx
+        idx = bisect_left(columns, column)
+        columns.insert(idx, column)
+        self.values.insert(idx, value)
+        self.types.insert(idx, data_type)
+        self.styles.insert(idx, style)
+        return idx
+
+
+    def remove(self, start, stop):
+        """
+        Remove the cells between two positions
+        """
+        del self.columns[start:stop]
+        del self.values[start:stop]
+        del self.types[start:stop]
+        del self.styles[start:stop]
+
+
+    def merge(self, other):
+        """
+        Add the cells of another row and return the columns of the cells
+        which are replaced
+        """
+        replaced = []
+        for column, value, data_type, style in zip(
+            other.columns, other.values, other.types, other.styles):
+            idx = self.find(column)
+            if idx < 0:
+                self.insert(column, value, data_type, style)
+                continue
+            replaced.append(column)
+            self.values[idx] = value
+            self.types[idx] = data_type
+            self.styles[idx] = style
+        return replaced
+
+
+    def span(self, min_col, max_col):
+        """
+        Positions of the first and after the last cell between two columns
+        """
+        columns = self.columns
+        return bisect_left(columns, min_col), bisect_right(columns, max_col)
+
+
+class StoredCell(Cell):
+    """
+    Cell whose value, type, style, hyperlink and comment are kept in the
+    compact cell store of its worksheet.
+
+    Cells refer to positions: a cell which has been moved by inserting or
+    deleting rows or columns must be looked up again.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, worksheet, row, column):
+        self.parent = worksheet
+        self.row = row
+        self.column = column
+
+
+    def __eq__(self, other):
+        if not isinstance(other, StoredCell):
+            return NotImplemented
+        return (self.parent is other.parent and self.row == other.row
+                and self.column == other.column)
+
+
+    def __hash__(self):
+        return hash((id(self.parent), self.row, self.column))
+
+
+    @property
+    def _value(self):
+        row, idx = self.parent._cells._find(self.row, self.column)
+        if idx >= 0:
+            return row.values[idx]
+
+
+    @_value.setter
+    def _value(self, value):
+        row, idx = self.parent._cells._slot(self.row, self.column)
+        row.values[idx] = value
+
+
+    @property
+    def data_type(self):
+        row, idx = self.parent._cells._find(self.row, self.column)
+        if idx < 0:
+            return 'n'
+        return DATA_TYPES[row.types[idx]]
+
+
+    @data_type.setter
+    def data_type(self, value):
+        row, idx = self.parent._cells._slot(self.row, self.column)
+        row.types[idx] = TYPE_CODES[value]
+
+
+    @property
+    def _style_array(self):
+        row, idx = self.parent._cells._find(self.row, self.column)
+        if idx >= 0:
+            return shared_style(compact_styles(self.parent.parent)[row.styles[idx]])
+
+
+    @_style_array.setter
+    def _style_array(self, value):
+        style_id = 0
+        if value is not None:
+            styles = compact_styles(self.parent.parent)
+            style_id = style_index(styles, shared_style(value))
+        row, idx = self.parent._cells._slot(self.row, self.column)
+        row.styles[idx] = style_id
+
+
+    @property
+    def style_id(self):
+        row, idx = self.parent._cells._find(self.row, self.column)
+        if idx < 0:
+            return 0
+        wb = self.parent.parent
+        style_id = row.styles[idx]
+        style = compact_styles(wb)[style_id]
+        cell_styles = wb._cell_styles
+        if style_id < len(cell_styles) and cell_styles[style_id] is style:
+            return style_id
+        return style_index(cell_styles, style)
+
+
+    @property
+    def _hyperlink(self):
+        return self.parent._cells._hyperlinks.get((self.row, self.column))
+
+
+    @_hyperlink.setter
+    def _hyperlink(self, value):
+        self.parent._cells._set_extra("_hyperlinks", self.row, self.column, value)
+
+
+    @property
+    def _comment(self):
+        return self.parent._cells._comments.get((self.row, self.column))
+
+
+    @_comment.setter
+    def _comment(self, value):
+        self.parent._cells._set_extra("_comments", self.row, self.column, value)
+
+
+class CompactCellStore(CellStore):
+    """
+    Mapping of (row, column) to cells which keeps the contents of cells in
+    arrays for each row. Cells are created when they are looked up.
+    """
+
+    def __init__(self, ws):
+        super().__init__()
+        self.ws = ws
+        self._hyperlinks = {}
+        self._comments = {}
+        self._merged = {}
+
+
+    def clear(self):
+        self.__init__(self.ws)
+
+
+    def _find(self, row, column):
+        cells = self._rows.get(row)
+        if cells is None:
+            return None, -1
+        return cells, cells.find(column)
+
+
+    def _slot(self, row, column):
+        """
+        Row and position of a cell, which is added if it does not exist
+        """
+        cells = self._rows.get(row)
+        if cells is None:
+            cells = self._rows[row] = CellRow()
+            self._add_row(row)
+        idx = cells.find(column)
+        if idx < 0:
+            idx = cells.insert(column)
+            self._add_column(column)
+            self._size += 1
+        return cells, idx
+
+
+    def _set_extra(self, table, row, column, value):
+        """
+        Hyperlinks and comments are kept in tables for the cells they belong to
+        """
+        table = getattr(self, table)
+        if value is None:
+            table.pop((row, column), None)
+            return
+        self._slot(row, column)
+        table[row, column] = value
+
+
+    def _cell(self, row, column, code):
+        if code == MERGED:
+            return self._merged[row, column]
+        return StoredCell(self.ws, row, column)
+
+
+    def __contains__(self, key):
+        row, column = key
+        return self._find(row, column)[1] >= 0
+
+
+    def __getitem__(self, key):
+        row, column = key
+        cells, idx = self._find(row, column)
+        if idx < 0:
+            raise KeyError(key)
+        return self._cell(row, column, cells.types[idx])
+
+
+    def get(self, key, default=None):
+        row, column = key
+        cells, idx = self._find(row, column)
+        if idx < 0:
+            return default
+        return self._cell(row, column, cells.types[idx])
+
+
+    def __setitem__(self, key, cell):
+        """
+        Copy the contents of a cell into the store
+        """
+        row, column = key
+        if isinstance(cell, MergedCell):
+            cells, idx = self._slot(row, column)
+            cells.values[idx] = None
+            cells.types[idx] = MERGED
+            cells.styles[idx] = 0
+            self._merged[key] = cell
+            self._hyperlinks.pop(key, None)
+            self._comments.pop(key, None)
+            return
+
+        value = cell._value
+        data_type = TYPE_CODES[cell.data_type]
+        style = 0
+        if cell._style_array is not None:
+            style = style_index(compact_styles(self.ws.parent), cell._style_array)
+        hyperlink = cell._hyperlink
+        comment = cell._comment
+
+        cells, idx = self._slot(row, column)
+        cells.values[idx] = value
+        cells.types[idx] = data_type
+        cells.styles[idx] = style
+        self._merged.pop(key, None)
+        self._set_extra("_hyperlinks", row, column, hyperlink)
+        self._set_extra("_comments", row, column, comment)
+
+
+    def add(self, cell):
+        key = cell.row, cell.column
+        self[key] = cell
+        return self[key]
+
+
+    def bind(self, row, column, value, data_type, style_id):
+        """
+        Add a cell read from a worksheet
+        """
+        cells, idx = self._slot(row, column)
+        cells.values[idx] = value
+        cells.types[idx] = TYPE_CODES[data_type]
+        cells.styles[idx] = style_id
+
+
+    def _discard(self, keys):
+        for key in keys:
+            self._hyperlinks.pop(key, None)
+            self._comments.pop(key, None)
+            self._merged.pop(key, None)
+
+
+    def __delitem__(self, key):
+        row, column = key
+        cells, idx = self._find(row, column)
+        if idx < 0:
+            raise KeyError(key)
+        cells.remove(idx, idx + 1)
+        self._discard([key])
+        self._size -= 1
+        self._remove_column(column)
+        if not cells:
+            del self._rows[row]
+            self._remove_row(row)
+
+
+    def __iter__(self):
+        rows = self._rows
+        for row in self._row_index:
+            for column in rows[row].columns:
+                yield row, column
+
+
+    def values(self):
+        for row, cells in self.iter_rows():
+            yield from cells
+
+
+    def items(self):
+        for row, cells in self.iter_rows():
+            for cell in cells:
+                yield (row, cell.column), cell
+
+
+    def iter_rows(self, min_row=None, max_row=None):
+        """
+        Yield the index and the cells, ordered by column, of each row
+        that contains cells
+        """
+        index = self._row_index
+        start = 0 if min_row is None else bisect_left(index, min_row)
+        rows = self._rows
+        cell = self._cell
+        for row in index[start:]:
+            if max_row is not None and row > max_row:
+                break
+            cells = rows[row]
+            yield row, [cell(row, column, code)
+                        for column, code in zip(cells.columns, cells.types)]
+
+
+    def get_row(self, row, min_col, max_col, values_only=False):
+        result = [None] * (max_col - min_col + 1)
+        cells = self._rows.get(row)
+        if cells is not None:
+            lo, hi = cells.span(min_col, max_col)
+            columns = cells.columns[lo:hi]
+            if values_only:
+                for column, value in zip(columns, cells.values[lo:hi]):
+                    if value.__class__ is SharedFormula:
+                        value = value.formula(row, column)
+                    result[column - min_col] = value
+            else:
+                for column, code in zip(columns, cells.types[lo:hi]):
+                    result[column - min_col] = self._cell(row, column, code)
+        return tuple(result)
+
+
+    def iter_range(self, min_row=None, min_col=None, max_row=None, max_col=None):
+        index = self._row_index
+        start = 0 if min_row is None else bisect_left(index, min_row)
+        stop = len(index) if max_row is None else bisect_right(index, max_row)
+        min_col = min_col or 1
+        max_col = max_col or 65535
+        rows = self._rows
+        for row in index[start:stop]:
+            cells = rows[row]
+            lo, hi = cells.span(min_col, max_col)
+            for column, code in zip(cells.columns[lo:hi], cells.types[lo:hi]):
+                yield self._cell(row, column, code)
+
+
+    def formulae(self):
+        code = TYPE_CODES["f"]
+        for row, cells in self._rows.items():
+            types = cells.types
+            idx = types.find(code)
+            while idx >= 0:
+                yield StoredCell(self.ws, row, cells.columns[idx])
+                idx = types.find(code, idx + 1)
+
+
+    def keys_in_range(self, min_row, min_col, max_row, max_col):
+        index = self._row_index
+        start = bisect_left(index, min_row)
+        stop = bisect_right(index, max_row)
+        rows = self._rows
+        keys = []
+        for row in index[start:stop]:
+            cells = rows[row]
+            lo, hi = cells.span(min_col, max_col)
+            keys.extend((row, column) for column in cells.columns[lo:hi])
+        return keys
+
+
+    def _extra_keys(self):
+        return set(self._hyperlinks) | set(self._comments) | set(self._merged)
+
+
+    def delete_rows(self, min_row, max_row):
+        """
+        Remove all the cells in the rows
+        """
+        index = self._row_index
+        start = bisect_left(index, min_row)
+        stop = bisect_right(index, max_row)
+        for row in index[start:stop]:
+            cells = self._rows.pop(row)
+            self._size -= len(cells)
+            for column in cells.columns:
+                self._remove_column(column)
+        del index[start:stop]
+        self._discard([key for key in self._extra_keys()
+                       if min_row <= key[0] <= max_row])
+
+
+    def delete_columns(self, min_col, max_col):
+        """
+        Remove all the cells in the columns
+        """
+        for row in list(self._row_index):
+            cells = self._rows[row]
+            lo, hi = cells.span(min_col, max_col)
+            if lo == hi:
+                continue
+            for column in cells.columns[lo:hi]:
+                self._remove_column(column)
+            self._size -= hi - lo
+            cells.remove(lo, hi)
+            if not cells:
+                del self._rows[row]
+                self._remove_row(row)
+        self._discard([key for key in self._extra_keys()
+                       if min_col <= key[1] <= max_col])
+
+
+    def _shift_extras(self, shift):
+        """
+        Move the hyperlinks, comments and merged cells whose keys are changed
+        by `shift`
+        """
+        for name in ("_hyperlinks", "_comments", "_merged"):
+            table = getattr(self, name)
+            moved = {}
+            for key in list(table):
+                new = shift(key)
+                if new != key:
+                    moved[new] = table.pop(key)
+            table.update(moved)
+        for (row, column), cell in self._merged.items():
+            cell.row = row
+            cell.column = column
+
+
+    def shift_rows(self, min_row, offset):
+        """
+        Move all rows from `min_row` by `offset` rows. Existing cells at
+        the new positions are replaced.
+        """
+        index = self._row_index
+        start = bisect_left(index, min_row)
+        rows = self._rows
+        moved = [(row + offset, rows.pop(row)) for row in index[start:]]
+        del index[start:]
+        ordered = not index or not moved or moved[0][0] > index[-1]
+
+        replaced = []
+        for row, cells in moved:
+            target = rows.get(row)
+            if target is None:
+                rows[row] = cells
+                index.append(row)
+                continue
+            for column in target.merge(cells):
+                replaced.append((row, column))
+                self._remove_column(column)
+                self._size -= 1
+        if not ordered:
+            index.sort()
+        self._discard(replaced)
+
+        def shift(key):
+            row, column = key
+            if row >= min_row:
+                return row + offset, column
+            return key
+
+        self._shift_extras(shift)
+
+
+    def shift_columns(self, min_col, offset):
+        """
+        Move all columns from `min_col` by `offset` columns. Existing cells at
+        the new positions are replaced.
+        """
+        replaced = []
+        for row, cells in self._rows.items():
+            columns = cells.columns
+            start = bisect_left(columns, min_col)
+            if start == len(columns):
+                continue
+            if offset > 0 or start == 0 or columns[start-1] < min_col + offset:
+                columns[start:] = array('H', (c + offset for c in columns[start:]))
+                continue
+            # cells which are not moved may be replaced or come after moved ones
+            moved = CellRow()
+            moved.columns = array('H', (c + offset for c in columns[start:]))
+            moved.values = cells.values[start:]
+            moved.types = cells.types[start:]
+            moved.styles = cells.styles[start:]
+            cells.remove(start, len(columns))
+            for column in cells.merge(moved):
+                replaced.append((row, column))
+                self._remove_column(column)
+                self._size -= 1
+        self._discard(replaced)
+
+        counts = {}
+        for column, count in self._columns.items():
+            if column >= min_col:
+                column += offset
+            counts[column] = counts.get(column, 0) + count
+        self._columns = counts
+        self._col_bounds = None
+
+        def shift(key):
+            row, column = key
+            if column >= min_col:
+                return row, column + offset
+            return key
+
+        self._shift_extras(shift)
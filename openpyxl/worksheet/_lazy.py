@@ -0,0 +1,116 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Worksheets which are only read from the source archive when they are used.
+
+Worksheets which are never used can be copied from the source archive when
+the workbook is saved.
+"""
+
+from openpyxl.packaging.relationship import get_rels_path
+
+from .filters import AutoFilter
+from .worksheet import Worksheet
+
+
+# attributes which are available without reading the worksheet
+LAZY_ATTRIBUTES = frozenset([
+    "_WorkbookChild__title",
+    "_default_title",
+    "_id",
+    "_parent",
+    "_path",
+    "_print_area",
+    "_print_cols",
+    "_print_rows",
+    "_rel_type",
+    "auto_filter",
+    "defined_names",
+    "encoding",
+    "mime_type",
+    "parent",
+    "path",
+    "print_area",
+    "print_title_cols",
+    "print_title_rows",
+    "print_titles",
+    "sheet_state",
+    "title",
+])
+
+
+def _is_lazy(name):
+    return name in LAZY_ATTRIBUTES or name.startswith(("__", "_lazy"))
+
+
+class LazyWorksheet(Worksheet):
+    """
+    Placeholder for a worksheet that is read the first time it is used,
+    after which it becomes a regular worksheet.
+
+    `loader` is called with the worksheet to read it. If the worksheet can
+    be copied unchanged when the workbook is saved `source` is the archive,
+    the path of the worksheet, the path of its relationships and the shared
+    strings that it refers to.
+    """
+
+    _lazy_loader = None
+    _lazy_source = None
+
+    def __init__(self, parent, title, loader, source=None):
+        super().__init__(parent, title)
+        self._lazy_loader = loader
+        self._lazy_source = source
+
+
+    def __getattribute__(self, name):
+        if not _is_lazy(name):
+            object.__getattribute__(self, "_lazy_load")()
+        return object.__getattribute__(self, name)
+
+
+    def __setattr__(self, name, value):
+        if not _is_lazy(name):
+            self._lazy_load()
+        object.__setattr__(self, name, value)
+
+
+    def _lazy_load(self):
+        loader = self._lazy_loader
+        if loader is None:
+            return
+        self.__class__ = Worksheet
+        del self._lazy_loader
+        del self._lazy_source
+        self.auto_filter = AutoFilter()
+        loader(self)
+
+
+    def _lazy_copy(self, archive):
+        """
+        Copy the worksheet and its relationships from the source archive if
+        possible. Otherwise the worksheet is read so that it can be written.
+        Return whether the worksheet was copied.
+        """
+        from openpyxl.writer._archive import copy_member
+
+        if self._lazy_source is None:
+            self._lazy_load()
+            return False
+
+        source, path, rels_path, strings = self._lazy_source
+        copy_member(source, path, archive, self.path[1:])
+        if rels_path is not None:
+            copy_member(source, rels_path, archive, get_rels_path(self.path)[1:])
+        return True
+
+
+def source_strings(wb):
+    """
+    Return the shared strings of the source archive if any worksheets will be
+    copied from it, their indices must not change
+    """
+    for ws in wb._sheets:
+        if type(ws) is LazyWorksheet and ws._lazy_source is not None:
+            return ws._lazy_source[3]
+    return ()
@@ -0,0 +1,208 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Spatial index of cell ranges.
+
+The worksheet is divided into blocks of cells of several sizes. Each range
+is recorded in the smallest blocks of which it covers no more than two
+rows and two columns, so that the ranges containing a cell are found by
+looking at one block of each size in use instead of at every range. Block
+heights and widths are chosen separately so that whole rows or columns do
+not end up in the same block as the small ranges around them.
+"""
+
+from itertools import product
+
+SHIFTS = (3, 6, 9, 12, 15, 18, 21) # blocks of 8 to 2097152 rows or columns
+
+
+def _shift(lo, hi):
+    for shift in SHIFTS:
+        if (hi >> shift) - (lo >> shift) < 2:
+            return shift
+
+
+class RangeIndex:
+    """
+    Index of hashable items by their bounds, given as
+    (min_col, min_row, max_col, max_row) like `CellRange.bounds`.
+    """
+
+    def __init__(self):
+        self._bounds = {} # {item: bounds}
+        self._levels = {} # {(row shift, col shift): {(row, col): set of items}}
+        self._sizes = {} # {(row shift, col shift): number of items}
+
+
+    def __len__(self):
+        return len(self._bounds)
+
+
+    def __contains__(self, item):
+        return item in self._bounds
+
+
+    def __iter__(self):
+        return iter(self._bounds)
+
+
+    def _blocks(self, bounds):
+        """
+        The level and the blocks the item with these bounds is recorded in
+        """
+        min_col, min_row, max_col, max_row = bounds
+        rs = _shift(min_row, max_row)
+        cs = _shift(min_col, max_col)
+        rows = range(min_row >> rs, (max_row >> rs) + 1)
+        cols = range(min_col >> cs, (max_col >> cs) + 1)
+        return (rs, cs), product(rows, cols)
+
+
+    def add(self, item, bounds):
+        if item in self._bounds:
+            self.remove(item)
+        self._bounds[item] = bounds
+        level, keys = self._blocks(bounds)
+        blocks = self._levels.get(level)
+        if blocks is None:
+            blocks = self._levels[level] = {}
+            self._sizes[level] = 0
+        self._sizes[level] += 1
+        for key in keys:
+            block = blocks.get(key)
+            if block is None:
+                block = blocks[key] = set()
+            block.add(item)
+
+
+    def remove(self, item):
+        bounds = self._bounds.pop(item)
+        level, keys = self._blocks(bounds)
+        blocks = self._levels[level]
+        for key in keys:
+            block = blocks[key]
+            block.discard(item)
+            if not block:
+                del blocks[key]
+        self._sizes[level] -= 1
+        if not self._sizes[level]:
+            del self._levels[level]
+            del self._sizes[level]
+
+
+    def clear(self):
+        self.__init__()
+
+
+    def at(self, row, column):
+        """
+        Items containing the cell
+        """
+        bounds = self._bounds
+        for (rs, cs), blocks in self._levels.items():
+            block = blocks.get((row >> rs, column >> cs))
+            if block is None:
+                continue
+            for item in block:
+                min_col, min_row, max_col, max_row = bounds[item]
+                if min_row <= row <= max_row and min_col <= column <= max_col:
+                    yield item
+
+
+    def overlapping(self, bounds):
+        """
+        Items with at least one cell in common with the bounds
+        """
+        min_col, min_row, max_col, max_row = bounds
+        candidates = set()
+        for (rs, cs), blocks in self._levels.items():
+            rows = range(min_row >> rs, (max_row >> rs) + 1)
+            cols = range(min_col >> cs, (max_col >> cs) + 1)
+            if len(rows) * len(cols) > len(blocks):
+                keys = blocks
+            else:
+                keys = product(rows, cols)
+            for key in keys:
+                candidates.update(blocks.get(key, ()))
+
+        found = []
+        for item in candidates:
+            lo_col, lo_row, hi_col, hi_row = self._bounds[item]
+            if (lo_row <= max_row and min_row <= hi_row
+                and lo_col <= max_col and min_col <= hi_col):
+                found.append(item)
+        return found
+
+
+def _cell_position(cell):
+    """
+    Row and column of a cell or a cell coordinate
+    """
+    if isinstance(cell, str):
+        from openpyxl.utils import coordinate_to_tuple
+        return coordinate_to_tuple(cell)
+    return cell.row, cell.column
+
+
+def _range_bounds(cell_range):
+    """
+    Bounds of a CellRange or a range string
+    """
+    if isinstance(cell_range, str):
+        from openpyxl.utils import range_boundaries
+        return range_boundaries(cell_range)
+    return cell_range.bounds
+
+
+class RangeLookup:
+    """
+    Find the objects, such as conditional formats or data validations, which
+    apply to a cell or range.
+
+    `source` returns the objects, each with the bounds of its ranges. They
+    are indexed when they are first looked up and again whenever the `state`
+    passed in changes. Objects are returned in the order of the source.
+    """
+
+    def __init__(self):
+        self._state = None
+        self._objects = []
+        self._index = None
+
+
+    def __getstate__(self):
+        # copies are indexed again when they are used
+        return {"_state": None, "_objects": [], "_index": None}
+
+
+    def _build(self, source, state):
+        if self._index is not None and state == self._state:
+            return
+        self._index = index = RangeIndex()
+        self._objects = []
+        for pos, (obj, bounds) in enumerate(source()):
+            self._objects.append(obj)
+            for idx, b in enumerate(bounds):
+                index.add((pos, idx), b)
+        self._state = state
+
+
+    def _found(self, items):
+        return [self._objects[pos] for pos in sorted({pos for pos, _ in items})]
+
+
+    def at(self, cell, source, state):
+        """
+        Objects which apply to a cell or cell coordinate
+        """
+        self._build(source, state)
+        row, column = _cell_position(cell)
+        return self._found(self._index.at(row, column))
+
+
+    def overlapping(self, cell_range, source, state):
+        """
+        Objects which apply to at least one cell of a range
+        """
+        self._build(source, state)
+        return self._found(self._index.overlapping(_range_bounds(cell_range)))
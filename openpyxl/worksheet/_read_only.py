@@ -3,11 +3,15 @@
 """ Read worksheets on-demand
 """
 
+from contextlib import contextmanager
+
 from .worksheet import Worksheet
 from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
-from openpyxl.utils import get_column_letter
+from openpyxl.utils import get_column_letter, column_index_from_string
 
 from ._reader import WorkSheetParser
+from ._arrays import ColumnBuffer
+from ._row_index import RowIndex
 from openpyxl.workbook.defined_name import DefinedNameDict
 
 
@@ -16,6 +20,45 @@ def read_dimension(source):
     return parser.parse_dimensions()
 
 
+def _column_index(column):
+    if isinstance(column, str):
+        return column_index_from_string(column)
+    return column
+
+
+def _column_keys(tests):
+    if tests is None:
+        return None
+    return {_column_index(column): test for column, test in tests.items()}
+
+
+def fill_rows(rows, min_row, max_row, empty_row, get_row):
+    """
+    Yield the rows from `min_row` to `max_row` from the parsed rows. Rows
+    missing from the source are empty.
+    """
+    counter = min_row
+    idx = 1
+    for idx, row in rows:
+        if max_row is not None and idx > max_row:
+            break
+
+        # some rows are missing
+        for _ in range(counter, idx):
+            counter += 1
+            yield empty_row
+
+        # return cells from a row
+        if counter <= idx:
+            row = get_row(row)
+            counter += 1
+            yield row
+
+    if max_row is not None and max_row < idx:
+        for _ in range(counter, max_row+1):
+            yield empty_row
+
+
 class ReadOnlyWorksheet:
 
     _min_column = 1
@@ -25,20 +68,23 @@ class ReadOnlyWorksheet:
     # from Standard Worksheet
     # Methods from Worksheet
     cell = Worksheet.cell
-    iter_rows = Worksheet.iter_rows
     values = Worksheet.values
     rows = Worksheet.rows
     __getitem__ = Worksheet.__getitem__
     __iter__ = Worksheet.__iter__
 
 
-    def __init__(self, parent_workbook, title, worksheet_path, shared_strings):
+    def __init__(self, parent_workbook, title, worksheet_path, shared_strings,
+                 row_index=False):
         self.parent = parent_workbook
         self.title = title
         self.sheet_state = 'visible'
         self._current_row = None
         self._worksheet_path = worksheet_path
         self._shared_strings = shared_strings
+        self._row_index = None
+        if row_index:
+            self._row_index = RowIndex(self._get_source)
         self._get_size()
         self.defined_names = DefinedNameDict()
 
@@ -57,6 +103,89 @@ class ReadOnlyWorksheet:
         return self.parent._archive.open(self._worksheet_path)
 
 
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None,
+                  values_only=False, columns=None, where=None, until=None):
+        """
+        Produces cells from the worksheet, by row. Specify the iteration range
+        using indices of rows and columns.
+
+        If no indices are specified the range starts at A1.
+
+        If no cells are in the worksheet an empty tuple will be returned.
+
+        Columns can also be selected with `columns` and rows filtered with
+        `where` and `until`, which map columns to functions of cell values.
+        Cells in other columns are skipped before their values are decoded.
+        Only rows for which all the `where` functions return True are
+        produced and iteration stops at the first row for which an `until`
+        function returns True. Rows missing from the source are skipped when
+        filtering.
+
+        :param min_col: smallest column index (1-based index)
+        :type min_col: int
+
+        :param min_row: smallest row index (1-based index)
+        :type min_row: int
+
+        :param max_col: largest column index (1-based index)
+        :type max_col: int
+
+        :param max_row: largest row index (1-based index)
+        :type max_row: int
+
+        :param values_only: whether only cell values should be returned
+        :type values_only: bool
+
+        :param columns: column indices (1-based) or letters to return, in order
+        :type columns: list
+
+        :param where: columns and functions which must all return True for a row to be returned
+        :type where: dict
+
+        :param until: columns and functions which stop iteration when one returns True
+        :type until: dict
+
+        :rtype: generator
+        """
+        if columns is None and where is None and until is None:
+            return Worksheet.iter_rows(self, min_row, max_row, min_col, max_col, values_only)
+
+        if columns is None:
+            max_col = max_col or self.max_column
+            if max_col is None:
+                raise ValueError("Worksheet is unsized, columns must be given")
+            columns = range(min_col or 1, max_col + 1)
+        return self._project_rows(min_row or 1, max_row or self.max_row,
+                                  [_column_index(c) for c in columns],
+                                  _column_keys(where), _column_keys(until),
+                                  values_only)
+
+
+    def _project_rows(self, min_row, max_row, columns, where, until, values_only):
+        filler = None if values_only else EMPTY_CELL
+
+        def get_row(cells):
+            row = []
+            for column in columns:
+                cell = cells.get(column)
+                if cell is None:
+                    row.append(filler)
+                elif values_only:
+                    row.append(cell['value'])
+                else:
+                    row.append(ReadOnlyCell(self, **cell))
+            return tuple(row)
+
+        with self._open_parser(min_row) as parser:
+            rows = parser.parse_projection(columns, where, until, min_row, max_row)
+            if where or until:
+                for idx, cells in rows:
+                    yield get_row(cells)
+            else:
+                empty_row = (filler,) * len(columns)
+                yield from fill_rows(rows, min_row, max_row, empty_row, get_row)
+
+
     def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
         """
         The source worksheet file may have columns or rows missing.
@@ -72,34 +201,171 @@ class ReadOnlyWorksheet:
         if max_col is not None:
             empty_row = (filler,) * (max_col + 1 - min_col)
 
-        counter = min_row
-        idx = 1
-        with self._get_source() as src:
-            parser = WorkSheetParser(src,
-                                     self._shared_strings,
-                                     data_only=self.parent.data_only,
-                                     epoch=self.parent.epoch,
-                                     date_formats=self.parent._date_formats,
-                                     timedelta_formats=self.parent._timedelta_formats)
-
-            for idx, row in parser.parse():
-                if max_row is not None and idx > max_row:
-                    break
-
-                # some rows are missing
-                for _ in range(counter, idx):
-                    counter += 1
-                    yield empty_row
-
-                # return cells from a row
-                if counter <= idx:
-                    row = self._get_row(row, min_col, max_col, values_only)
-                    counter += 1
-                    yield row
-
-        if max_row is not None and max_row < idx:
-            for _ in range(counter, max_row+1):
-                yield empty_row
+        def get_row(row):
+            return self._get_row(row, min_col, max_col, values_only)
+
+        with self._open_parser(min_row) as parser:
+            yield from fill_rows(parser.parse(), min_row, max_row, empty_row, get_row)
+
+
+    @contextmanager
+    def _open_parser(self, min_row=1):
+        """
+        Return a parser for the worksheet. If the rows are indexed parsing
+        starts at `min_row`.
+        """
+        index = self._row_index
+        if index is None:
+            with self._get_source() as src:
+                yield self._get_parser(src)
+            return
+
+        src, row, formulae = index.open(min_row)
+        with src:
+            parser = self._get_parser(src)
+            parser.row_counter = row
+            parser.shared_formulae = formulae
+            yield parser
+
+
+    def _get_row_index(self):
+        if self._row_index is None:
+            self._row_index = RowIndex(self._get_source)
+        return self._row_index
+
+
+    def iter_rows_sharded(self, shard, num_shards, min_col=None, max_col=None,
+                          values_only=False):
+        """
+        Produce the rows of one of `num_shards` parts of the worksheet. The
+        parts are split at rows so that they are about the same size and
+        together they contain the same rows as `iter_rows()`.
+        The rows of the worksheet are indexed to find the parts.
+
+        :param shard: the part to read (0-based index)
+        :type shard: int
+
+        :param num_shards: the number of parts
+        :type num_shards: int
+
+        :rtype: generator
+        """
+        if not 0 <= shard < num_shards:
+            raise IndexError(f"Shard {shard} is not in the range 0 to {num_shards - 1}")
+        bounds = self._get_row_index().shards(num_shards)[shard]
+        if bounds is None:
+            return iter(())
+        min_row, max_row = bounds[:2]
+        return self.iter_rows(min_row, max_row, min_col, max_col, values_only)
+
+
+    def _close(self):
+        if self._row_index is not None:
+            self._row_index.close()
+
+
+    def _get_parser(self, src):
+        return WorkSheetParser(src,
+                               self._shared_strings,
+                               data_only=self.parent.data_only,
+                               epoch=self.parent.epoch,
+                               date_formats=self.parent._date_formats,
+                               timedelta_formats=self.parent._timedelta_formats)
+
+
+    def to_arrays(self, min_row=None, max_row=None, columns=None, dtypes=None):
+        """
+        Read the values of the worksheet into NumPy arrays, one per column,
+        without creating cells.
+
+        :param min_row: first row to read, defaults to the first row
+        :type min_row: int
+
+        :param max_row: last row to read, defaults to the last row
+        :type max_row: int
+
+        :param columns: column indices (1-based) or letters to read, defaults to all
+        :type columns: list
+
+        :param dtypes: NumPy dtypes, either one per column or a mapping of column to dtype. Types not given are inferred from the values.
+        :type dtypes: list or dict
+
+        :rtype: list of arrays
+        """
+        min_row = min_row or self.min_row or 1
+        max_row = max_row or self.max_row
+
+        keys = columns
+        if columns is not None:
+            columns = [_column_index(c) for c in columns]
+
+        with self._open_parser(min_row) as parser:
+            buffers = parser.parse_columns(columns, min_row, max_row)
+
+        if columns is None:
+            max_col = max(buffers, default=0)
+            if self.max_column is not None:
+                max_col = max(self.max_column, max_col)
+            keys = columns = list(range(1, max_col + 1))
+            size = max((len(b.values) for b in buffers.values()), default=0)
+            for col in columns:
+                if col not in buffers:
+                    buffers[col] = ColumnBuffer(size)
+
+        if dtypes is None:
+            dtypes = [None] * len(columns)
+        elif isinstance(dtypes, dict):
+            dtypes = [dtypes.get(key) for key in keys]
+
+        return [buffers[col].to_array(dtype, self.parent.epoch)
+                for col, dtype in zip(columns, dtypes)]
+
+
+    def to_dataframe(self, header_row=1, max_row=None, columns=None, dtypes=None):
+        """
+        Read the worksheet into a pandas DataFrame using typed columns.
+
+        :param header_row: row containing the column names, use None if there is no header
+        :type header_row: int
+
+        :param max_row: last row to read, defaults to the last row
+        :type max_row: int
+
+        :param columns: column indices (1-based) or letters to read, defaults to all
+        :type columns: list
+
+        :param dtypes: NumPy dtypes, either one per column or a mapping of column to dtype
+        :type dtypes: list or dict
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from pandas import DataFrame
+
+        min_row = None
+        if header_row is not None:
+            min_row = header_row + 1
+        arrays = self.to_arrays(min_row, max_row, columns, dtypes)
+
+        names = None
+        if header_row is not None:
+            header = next(self.iter_rows(min_row=header_row, max_row=header_row,
+                                         values_only=True), ())
+            if columns is None:
+                columns = range(1, len(arrays) + 1)
+            names = []
+            for col in columns:
+                if isinstance(col, str):
+                    col = column_index_from_string(col)
+                name = None
+                if col <= len(header):
+                    name = header[col - 1]
+                names.append(name)
+
+        data = dict(zip(range(len(arrays)), arrays))
+        df = DataFrame(data)
+        if names is not None:
+            df.columns = names
+        return df
 
 
     def _get_row(self, row, min_col=1, max_col=None, values_only=False):
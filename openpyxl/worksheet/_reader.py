@@ -2,6 +2,7 @@
 
 """Reader for a single worksheet."""
 from copy import copy
+from string import digits
 from warnings import warn
 
 # compatibility imports
@@ -24,13 +25,14 @@ from openpyxl.formatting.formatting import ConditionalFormatting
 from openpyxl.formula.translate import Translator
 from openpyxl.utils import (
     get_column_letter,
+    column_index_from_string,
     coordinate_to_tuple,
     )
 from openpyxl.utils.datetime import from_excel, from_ISO8601, WINDOWS_EPOCH
 from openpyxl.descriptors.excel import ExtensionList
 from openpyxl.cell.rich_text import CellRichText
 
-from .formula import DataTableFormula, ArrayFormula
+from .formula import DataTableFormula, ArrayFormula, SharedFormula
 from .filters import AutoFilter
 from .header_footer import HeaderFooter
 from .hyperlink import HyperlinkList
@@ -45,6 +47,8 @@ from .table import TablePartList
 from .properties import WorksheetProperties
 from .dimensions import SheetDimension
 from .related import Related
+from ._arrays import ColumnBuffer
+from ._compact import CompactCellStore
 
 
 CELL_TAG = '{%s}c' % SHEET_MAIN_NS
@@ -75,6 +79,13 @@ SCENARIOS_TAG = '{%s}scenarios' % SHEET_MAIN_NS
 DATA_TAG = '{%s}sheetData' % SHEET_MAIN_NS
 DIMENSION_TAG = '{%s}dimension' % SHEET_MAIN_NS
 CUSTOM_VIEWS_TAG = '{%s}customSheetViews' % SHEET_MAIN_NS
+CELL_TAGS = frozenset([CELL_TAG, VALUE_TAG, FORMULA_TAG])
+
+
+# use the fast path for decoding cells unless a parser is told otherwise
+FAST_PARSE = True
+
+_COLUMN_INDICES = {} # column letters to indices
 
 
 def _cast_number(value):
@@ -98,13 +109,14 @@ class WorkSheetParser:
 
     def __init__(self, src, shared_strings, data_only=False,
                  epoch=WINDOWS_EPOCH, date_formats=set(),
-                 timedelta_formats=set(), rich_text=False):
+                 timedelta_formats=set(), rich_text=False, fast=None):
         self.min_row = self.min_col = None
         self.epoch = epoch
         self.source = src
         self.shared_strings = shared_strings
         self.data_only = data_only
         self.shared_formulae = {}
+        self.expand_shared_formulae = True
         self.row_counter = self.col_counter = 0
         self.tables = TablePartList()
         self.date_formats = date_formats
@@ -120,6 +132,9 @@ class WorkSheetParser:
         self.row_breaks = RowBreak()
         self.col_breaks = ColBreak()
         self.rich_text = rich_text
+        if fast is None:
+            fast = FAST_PARSE
+        self.fast = fast
 
 
     def parse(self):
@@ -155,7 +170,10 @@ class WorkSheetParser:
 
         for _, element in it:
             tag_name = element.tag
-            if tag_name in dispatcher:
+            if tag_name in CELL_TAGS:
+                # handled with the row
+                continue
+            elif tag_name in dispatcher:
                 dispatcher[tag_name](element)
                 element.clear()
             elif tag_name in properties:
@@ -260,7 +278,9 @@ class WorkSheetParser:
 
         elif formula_type == "shared":
             idx = formula.get('si')
-            if idx in self.shared_formulae:
+            if not self.expand_shared_formulae:
+                value = self._shared_formula(formula, idx, coordinate, value)
+            elif idx in self.shared_formulae:
                 trans = self.shared_formulae[idx]
                 value = trans.translate_formula(coordinate)
             elif value != "=":
@@ -272,6 +292,210 @@ class WorkSheetParser:
         return value
 
 
+    def _shared_formula(self, formula, idx, coordinate, value):
+        """
+        Cells which share a formula all refer to the same SharedFormula
+        """
+        shared = self.shared_formulae.get(idx)
+        if shared is None and value != "=":
+            row, column = coordinate_to_tuple(coordinate)
+            shared = SharedFormula(formula.get('ref'), idx, value, row, column)
+            self.shared_formulae[idx] = shared
+        return shared or value
+
+
+    def parse_value(self, element):
+        """
+        Return the value and type of a cell without binding it. Dates and
+        times are returned as Excel serials.
+        """
+        data_type = element.get('t', 'n')
+
+        if not self.data_only and element.find(FORMULA_TAG) is not None:
+            return self.parse_formula(element), 'f'
+
+        if data_type == 'inlineStr':
+            child = element.find(INLINE_STRING)
+            if child is None:
+                return None, None
+            return Text.from_tree(child).content, 's'
+
+        value = element.findtext(VALUE_TAG, None) or None
+        if value is None:
+            return None, None
+
+        if data_type == 'n':
+            value = _cast_number(value)
+            style_id = element.get('s')
+            if style_id and int(style_id) in self.date_formats:
+                if int(style_id) in self.timedelta_formats:
+                    return value, 'td'
+                return value, 'd'
+            if isinstance(value, int):
+                return value, 'i'
+            return value, 'n'
+        elif data_type == 's':
+            return self.shared_strings[int(value)], 's'
+        elif data_type == 'b':
+            return bool(int(value)), 'b'
+        elif data_type == 'str':
+            return value, 's'
+        elif data_type == 'd':
+            return from_ISO8601(value), 'o'
+        return value, data_type
+
+
+    def _skip_cell(self, element):
+        """
+        Keep the formula of a cell which is not read if it is shared with
+        other cells
+        """
+        if self.data_only:
+            return
+        formula = element.find(FORMULA_TAG)
+        if (formula is not None and formula.get('t') == "shared"
+            and formula.get('ref') and element.get('r')):
+            self.parse_formula(element)
+
+
+    def _skip_row(self, row):
+        if self.data_only:
+            return
+        for el in row:
+            if el.tag == CELL_TAG:
+                self._skip_cell(el)
+
+
+    def parse_columns(self, columns=None, min_row=1, max_row=None):
+        """
+        Collect the values of the selected columns into buffers, one per
+        column, without creating cells. Cells in other columns are skipped
+        before their values are decoded.
+        Returns a dictionary of column index to buffer.
+        """
+        size = 0
+        if max_row is not None:
+            size = max_row + 1 - min_row
+
+        buffers = {}
+        if columns is not None:
+            buffers = {col: ColumnBuffer(size) for col in columns}
+
+        last = min_row - 1
+        for _, element in iterparse(self.source):
+            if element.tag != ROW_TAG:
+                continue
+
+            row = self._next_row(element.get('r'))
+            if row < min_row:
+                self._skip_row(element)
+                element.clear()
+                continue
+            if max_row is not None and row > max_row:
+                break
+
+            last = row
+            idx = row - min_row
+            column = 0
+            for el in element:
+                if el.tag != CELL_TAG:
+                    continue
+                coordinate = el.get('r')
+                if coordinate:
+                    column = column_index_from_string(coordinate.rstrip(digits))
+                else:
+                    column += 1
+
+                buf = buffers.get(column)
+                if buf is None:
+                    if columns is not None:
+                        self._skip_cell(el)
+                        continue
+                    buf = buffers[column] = ColumnBuffer(size)
+
+                value, kind = self.parse_value(el)
+                if kind is not None:
+                    buf.set(idx, value, kind)
+            element.clear()
+
+        if max_row is None:
+            size = last + 1 - min_row
+        for buf in buffers.values():
+            buf.resize(size)
+        return buffers
+
+
+    def parse_projection(self, columns, where=None, until=None, min_row=1, max_row=None):
+        """
+        Yield the index and the cells of the selected columns of each row
+        from `min_row` to `max_row`. Cells in other columns are skipped
+        before their values are decoded.
+
+        `where` and `until` map columns to functions of cell values. Other
+        cells of a row are only decoded if all the `where` functions return
+        True. Parsing stops at the first row for which an `until` function
+        returns True.
+        """
+        where = where or {}
+        until = until or {}
+        wanted = set(columns) | set(where) | set(until)
+
+        for _, element in iterparse(self.source):
+            if element.tag != ROW_TAG:
+                continue
+
+            idx = self._next_row(element.get('r'))
+            if idx < min_row:
+                self._skip_row(element)
+                element.clear()
+                continue
+            if max_row is not None and idx > max_row:
+                break
+
+            selected = {}
+            column = 0
+            for el in element:
+                if el.tag != CELL_TAG:
+                    continue
+                coordinate = el.get('r')
+                if coordinate:
+                    letters = coordinate.rstrip(digits)
+                    column = _COLUMN_INDICES.get(letters)
+                    if column is None:
+                        column = _COLUMN_INDICES[letters] = column_index_from_string(letters)
+                else:
+                    column += 1
+                if column in wanted:
+                    selected[column] = el
+                else:
+                    self._skip_cell(el)
+
+            cells = {}
+
+            def value(column):
+                if column not in cells:
+                    el = selected.get(column)
+                    if el is None:
+                        cells[column] = None
+                    else:
+                        self.col_counter = column - 1 # for cells without coordinates
+                        cells[column] = self.parse_cell(el)
+                cell = cells[column]
+                return cell and cell['value']
+
+            if any(test(value(col)) for col, test in until.items()):
+                break
+            if all(test(value(col)) for col, test in where.items()):
+                for col in columns:
+                    value(col)
+                yield idx, cells
+            else:
+                for col, el in selected.items():
+                    if col not in cells:
+                        self._skip_cell(el)
+            element.clear()
+
+
     def parse_column_dimensions(self, col):
         attrs = dict(col.attrib)
         column = get_column_letter(int(attrs['min']))
@@ -279,31 +503,116 @@ class WorkSheetParser:
         self.column_dimensions[column] = attrs
 
 
-    def parse_row(self, row):
-        attrs = dict(row.attrib)
-
-        if "r" in attrs:
+    def _next_row(self, idx=None):
+        """
+        Advance the row counter to the row number given or to the next row
+        """
+        if idx is not None:
             try:
-                self.row_counter = int(attrs['r'])
+                self.row_counter = int(idx)
             except ValueError:
-                val = float(attrs['r'])
+                val = float(idx)
                 if val.is_integer():
                     self.row_counter = int(val)
                 else:
-                    raise ValueError(f"{attrs['r']} is not a valid row number")
+                    raise ValueError(f"{idx} is not a valid row number")
         else:
             self.row_counter += 1
         self.col_counter = 0
+        return self.row_counter
+
+
+    def parse_row(self, row):
+        attrs = dict(row.attrib)
+        self._next_row(attrs.get('r'))
 
         keys = {k for k in attrs if not k.startswith('{')}
         if keys - {'r', 'spans'}:
             # don't create dimension objects unless they have relevant information
             self.row_dimensions[str(self.row_counter)] = attrs
 
-        cells = [self.parse_cell(el) for el in row]
+        if self.fast:
+            cells = self._parse_cells(row)
+        else:
+            cells = [self.parse_cell(el) for el in row]
         return self.row_counter, cells
 
 
+    def _parse_cells(self, row):
+        """
+        Decode the cells of a row as `parse_cell` does but with a single pass
+        over the children of each cell. Formulae, inline strings and invalid
+        dates are rare and are passed on to `parse_cell`.
+        """
+        cells = []
+        append = cells.append
+        shared_strings = self.shared_strings
+        date_formats = self.date_formats
+        check_formula = not self.data_only
+        row_idx = self.row_counter
+        columns = _COLUMN_INDICES
+
+        for element in row:
+            if element.tag != CELL_TAG:
+                continue
+            get = element.get
+            data_type = get('t', 'n')
+            if data_type == "inlineStr":
+                append(self.parse_cell(element))
+                continue
+
+            value = None
+            formula = False
+            for child in element:
+                tag = child.tag
+                if tag == VALUE_TAG:
+                    value = child.text or None
+                    break
+                elif tag == FORMULA_TAG and check_formula:
+                    formula = True
+                    break
+            if formula:
+                append(self.parse_cell(element))
+                continue
+
+            coordinate = get('r')
+            if coordinate:
+                letters = coordinate.rstrip(digits)
+                column = columns.get(letters)
+                if column is None:
+                    column = columns[letters] = column_index_from_string(letters)
+                idx = int(coordinate[len(letters):])
+            else:
+                idx, column = row_idx, self.col_counter + 1
+            style_id = get('s')
+            style_id = int(style_id) if style_id else 0
+
+            if value is not None:
+                if data_type == 'n':
+                    value = _cast_number(value)
+                    if style_id in date_formats:
+                        try:
+                            value = from_excel(
+                                value, self.epoch, timedelta=style_id in self.timedelta_formats
+                            )
+                        except (OverflowError, ValueError):
+                            append(self.parse_cell(element))
+                            continue
+                        data_type = 'd'
+                elif data_type == 's':
+                    value = shared_strings[int(value)]
+                elif data_type == 'b':
+                    value = bool(int(value))
+                elif data_type == "str":
+                    data_type = "s"
+                elif data_type == 'd':
+                    value = from_ISO8601(value)
+
+            self.col_counter = column
+            append({'row':idx, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id})
+        return cells
+
+
     def parse_formatting(self, element):
         try:
             cf = ConditionalFormatting.from_tree(element)
@@ -361,10 +670,26 @@ class WorksheetReader:
         self.parser = WorkSheetParser(xml_source, shared_strings,
                 data_only, ws.parent.epoch, ws.parent._date_formats,
                 ws.parent._timedelta_formats, rich_text)
+        self.parser.expand_shared_formulae = False
         self.tables = []
 
 
     def bind_cells(self):
+        cells = self.ws._cells
+        if isinstance(cells, CompactCellStore):
+            for idx, row in self.parser.parse():
+                for cell in row:
+                    cells.bind(cell['row'], cell['column'], cell['value'],
+                               cell['data_type'], cell['style_id'])
+        else:
+            self._bind_cells()
+
+        if self.ws._cells:
+            self.ws._current_row = self.ws.max_row # use cells not row dimensions
+        self.ws._shared_formulae = bool(self.parser.shared_formulae)
+
+
+    def _bind_cells(self):
         for idx, row in self.parser.parse():
             for cell in row:
                 style = self.ws.parent._cell_styles[cell['style_id']]
@@ -373,9 +698,6 @@ class WorksheetReader:
                 c.data_type = cell['data_type']
                 self.ws._cells[(cell['row'], cell['column'])] = c
 
-        if self.ws._cells:
-            self.ws._current_row = self.ws.max_row # use cells not row dimensions
-
 
     def bind_formatting(self):
         for cf in self.parser.formatting:
@@ -429,9 +751,10 @@ class WorksheetReader:
         Returns the appropriate cell to which a hyperlink, which references a merged cell at the specified coordinates,
         should be bound.
         """
-        for rng in self.ws.merged_cells:
-            if coord in rng:
-                return self.ws.cell(*rng.top[0])
+        row, column = coordinate_to_tuple(coord)
+        rng = self.ws.merged_cells.range_at(row, column)
+        if rng is not None:
+            return self.ws.cell(rng.min_row, rng.min_col)
 
     def bind_col_dimensions(self):
         for col, cd in self.parser.column_dimensions.items():
@@ -0,0 +1,156 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Update the references to a worksheet when rows or columns are inserted or
+deleted.
+
+Formulae in all the worksheets of the workbook and defined names are
+changed, as well as the merged cells, conditional formats, data
+validations, tables, filters and print settings of the worksheet itself.
+"""
+
+from collections import OrderedDict
+
+from openpyxl.formula.translate import ReferenceShift
+from openpyxl.formatting.formatting import ConditionalFormatting
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+from .formula import ArrayFormula, DataTableFormula, SharedFormula
+from .print_settings import ColRange, RowRange
+
+
+def update_references(ws, row_or_col, idx, amount):
+    """
+    Update the references to `ws` after `amount` rows or columns were
+    inserted at `idx`, or deleted from `idx` if `amount` is negative
+    """
+    shift = ReferenceShift(ws.title, row_or_col, idx, amount)
+    wb = ws.parent
+
+    for sheet in wb.worksheets:
+        if hasattr(sheet, "_cells"):
+            _update_formulae(sheet, shift, sheet is ws)
+        for name in getattr(sheet, "defined_names", {}).values():
+            _update_defined_name(name, shift)
+    for name in wb.defined_names.values():
+        _update_defined_name(name, shift)
+
+    ws.merged_cells = _shift_ranges(ws.merged_cells, shift)
+    _update_conditional_formatting(ws, shift)
+    _update_data_validations(ws, shift)
+    _update_tables(ws, shift)
+    if ws.auto_filter.ref:
+        ws.auto_filter.ref = shift.shift_range(ws.auto_filter.ref)
+    _update_print_settings(ws, shift)
+
+
+def _formula(text, shift, title=None):
+    """
+    Shift the references of formulae stored without "="
+    """
+    if text is None:
+        return text
+    return shift.translate_formula(f"={text}", title)[1:]
+
+
+def _shift_ranges(ranges, shift):
+    """
+    Shift the ranges of a MultiCellRange in place and return a new
+    MultiCellRange so that lookups are rebuilt. Deleted ranges are dropped.
+    """
+    kept = []
+    for cr in ranges:
+        bounds = shift.shift_bounds(*cr.bounds)
+        if bounds is None:
+            continue
+        cr.min_col, cr.min_row, cr.max_col, cr.max_row = bounds
+        kept.append(cr)
+    return type(ranges)(kept)
+
+
+def _update_formulae(ws, shift, local):
+    title = ws.title
+    needles = (shift.title, shift.title.replace("'", "''"))
+    for cell in ws._cells.formulae():
+        value = cell._value
+        if isinstance(value, ArrayFormula):
+            if value.text:
+                value.text = shift.translate_formula(value.text, title)
+            if local:
+                value.ref = shift.shift_range(value.ref) or value.ref
+        elif isinstance(value, DataTableFormula):
+            if local:
+                value.ref = shift.shift_range(value.ref) or value.ref
+                for attr in ("r1", "r2"):
+                    ref = getattr(value, attr)
+                    if ref:
+                        setattr(value, attr, shift.shift_range(ref) or "#REF!")
+        elif isinstance(value, (str, SharedFormula)):
+            text = value if isinstance(value, str) else value.text
+            if not local and not any(n in text.lower() for n in needles):
+                continue
+            if isinstance(value, SharedFormula):
+                value = value.formula(cell.row, cell.column)
+            new = shift.translate_formula(value, title)
+            if new != value:
+                cell._value = new
+
+
+def _update_defined_name(name, shift):
+    if name.attr_text and not name.is_external:
+        name.attr_text = _formula(name.attr_text, shift)
+
+
+def _update_conditional_formatting(ws, shift):
+    cf_list = ws.conditional_formatting
+    rules = OrderedDict()
+    for cf, cf_rules in cf_list._cf_rules.items():
+        sqref = _shift_ranges(cf.sqref, shift)
+        if not sqref:
+            continue
+        for rule in cf_rules:
+            rule.formula = [_formula(f, shift, ws.title) for f in rule.formula]
+        rules.setdefault(ConditionalFormatting(sqref=sqref, pivot=cf.pivot), []).extend(cf_rules)
+    cf_list._cf_rules = rules
+    cf_list._changes += 1
+
+
+def _update_data_validations(ws, shift):
+    dvs = ws.data_validations
+    kept = []
+    for dv in dvs.dataValidation:
+        dv.sqref = _shift_ranges(dv.sqref, shift)
+        if not dv.sqref:
+            continue
+        dv.formula1 = _formula(dv.formula1, shift, ws.title)
+        dv.formula2 = _formula(dv.formula2, shift, ws.title)
+        kept.append(dv)
+    dvs.dataValidation = kept
+
+
+def _update_tables(ws, shift):
+    for name, table in list(dict.items(ws.tables)):
+        ref = shift.shift_range(table.ref)
+        if ref is None:
+            del ws.tables[name]
+            continue
+        table.ref = ref
+        if table.autoFilter is not None and table.autoFilter.ref:
+            table.autoFilter.ref = shift.shift_range(table.autoFilter.ref) or ref
+
+
+def _update_print_settings(ws, shift):
+    if ws._print_area:
+        ws._print_area = _shift_ranges(ws._print_area, shift)
+
+    rows = ws._print_rows
+    if rows is not None and shift.rows:
+        span = shift.shift_span(rows.min_row, rows.max_row)
+        ws._print_rows = span and RowRange(min_row=span[0], max_row=span[1])
+
+    cols = ws._print_cols
+    if cols is not None and not shift.rows:
+        span = shift.shift_span(column_index_from_string(cols.min_col),
+                                column_index_from_string(cols.max_col))
+        ws._print_cols = span and ColRange(min_col=get_column_letter(span[0]),
+                                           max_col=get_column_letter(span[1]))
@@ -0,0 +1,239 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Random access to the rows of read-only worksheets.
+
+The worksheet is decompressed once to a temporary file which is memory-mapped
+and the positions of the rows are recorded. Worksheets can then be parsed
+starting from any row instead of from the beginning of the file. Other
+processes can open the temporary file to parse shards of the rows.
+"""
+
+from array import array
+from bisect import bisect_left
+from html import unescape
+import mmap
+import os
+import re
+from shutil import copyfileobj
+from tempfile import mkstemp
+from weakref import finalize
+
+from openpyxl.formula.translate import Translator
+
+
+PREFIX = rb"(?:[\w.-]+:)?"
+SHEET_DATA_RE = re.compile(rb"<" + PREFIX + rb"sheetData\b[^>]*?(/?)>")
+SHEET_DATA_END_RE = re.compile(rb"</" + PREFIX + rb"sheetData\s*>")
+ROW_RE = re.compile(rb"<" + PREFIX + rb"row\b([^>]*)>")
+ROW_NUMBER_RE = re.compile(rb"""\sr\s*=\s*["']([\d.eE+]+)["']""")
+COORDINATE_RE = re.compile(rb"""\sr\s*=\s*["']([A-Za-z]+\d+)["']""")
+SI_RE = re.compile(rb"""\ssi\s*=\s*["'](\d+)["']""")
+# cells with the master formula of a group of shared formulae
+SHARED_FORMULA_RE = re.compile(
+    rb"<" + PREFIX + rb"c\b([^>]*)>\s*<" + PREFIX
+    + rb"""f\b(?=[^>]*\st\s*=\s*["']shared["'])([^>]*)>([^<]*)<"""
+)
+
+
+def map_file(f):
+    """
+    Memory-map a file opened for reading
+    """
+    if not os.fstat(f.fileno()).st_size:
+        return b""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _discard(data, spill, filename):
+    if data:
+        data.close()
+    spill.close()
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
+
+
+class RowIndex:
+    """
+    Index of the rows of a worksheet, built the first time the worksheet
+    is opened.
+
+    `opener` returns the source of the worksheet.
+    """
+
+    def __init__(self, opener):
+        self.opener = opener
+        self.ordered = True
+        self._data = None
+
+
+    def build(self):
+        if self._data is None:
+            self._build()
+
+
+    def _build(self):
+        fd, self.filename = mkstemp(suffix=".xml")
+        spill = open(fd, "w+b")
+        with self.opener() as src:
+            copyfileobj(src, spill)
+        spill.flush()
+
+        self._data = data = map_file(spill)
+        self._discard = finalize(self, _discard, data, spill, self.filename)
+
+        self.rows = array("q")
+        self.offsets = array("q")
+        self.formulae = [] # (offset, si, Translator)
+        match = SHEET_DATA_RE.search(data)
+        if match is None or match.group(1):
+            # no rows
+            self.head = self.tail = len(data)
+            return
+        self.head = start = match.end()
+        match = SHEET_DATA_END_RE.search(data, start)
+        self.tail = end = len(data) if match is None else match.start()
+
+        counter = 0
+        for match in ROW_RE.finditer(data, start, end):
+            number = ROW_NUMBER_RE.search(match.group(1))
+            if number is None:
+                counter += 1
+            else:
+                counter = int(float(number.group(1)))
+            if self.rows and counter <= self.rows[-1]:
+                # rows are not in order so they can only be read from the start
+                self.ordered = False
+                break
+            self.rows.append(counter)
+            self.offsets.append(match.start())
+
+        for match in SHARED_FORMULA_RE.finditer(data, start, end):
+            attrs, formula, text = match.groups()
+            coordinate = COORDINATE_RE.search(attrs)
+            si = SI_RE.search(formula)
+            if formula.endswith(b"/") or coordinate is None or si is None:
+                continue
+            text = unescape(text.decode("utf-8"))
+            if not text:
+                continue
+            self.formulae.append((
+                match.start(),
+                si.group(1).decode(),
+                Translator("=" + text, coordinate.group(1).decode())
+                ))
+
+
+    def open(self, min_row=1):
+        """
+        Return a source which starts at the first row from `min_row`, the
+        number of the row before it and the shared formulae defined before it.
+        """
+        self.build()
+
+        idx = 0
+        if self.ordered:
+            idx = bisect_left(self.rows, min_row)
+        if idx < len(self.rows):
+            offset = self.offsets[idx]
+            row = self.rows[idx] - 1
+        else:
+            offset = self.tail
+            row = min_row - 1
+
+        stream = RowStream(self._data, [(0, self.head), (offset, len(self._data))])
+        return stream, row, self.formulae_before(offset)
+
+
+    def formulae_before(self, offset):
+        """
+        Shared formulae defined before the offset
+        """
+        formulae = {}
+        for pos, si, translator in self.formulae:
+            if pos >= offset:
+                break
+            formulae[si] = translator
+        return formulae
+
+
+    def shards(self, num_shards):
+        """
+        Split the rows into shards of about the same size. Return the first
+        and last row and the start and end offsets of each shard, or None
+        if a shard is empty. The first shard starts at the first row of the
+        worksheet and the last row of the last shard is None.
+        """
+        self.build()
+        rows, offsets = self.rows, self.offsets
+        count = len(rows)
+        if self.ordered:
+            size = self.tail - self.head
+            bounds = [bisect_left(offsets, self.head + size * k // num_shards)
+                      for k in range(1, num_shards)]
+        else:
+            bounds = [count] * (num_shards - 1)
+        bounds = [0] + bounds + [count]
+
+        def offset(idx):
+            return offsets[idx] if idx < count else self.tail
+
+        shards = []
+        for k in range(num_shards):
+            lo, hi = bounds[k], bounds[k + 1]
+            first = rows[lo] if lo < count else None
+            if k == 0:
+                first = 1
+            last = rows[hi] - 1 if hi < count else None
+            if first is None or last is not None and last < first:
+                shards.append(None)
+                continue
+            shards.append((first, last, offset(lo), offset(hi)))
+        return shards
+
+
+    def close(self):
+        if self._data is not None:
+            self._discard()
+            self._data = None
+
+
+class RowStream:
+    """
+    Read the parts of the data given as (start, end) offsets one after
+    the other.
+    """
+
+    def __init__(self, data, parts):
+        self.data = data
+        self.parts = list(parts)
+
+
+    def read(self, size=-1):
+        chunks = []
+        while self.parts and size:
+            start, end = self.parts[0]
+            if size < 0 or end - start <= size:
+                stop = end
+                self.parts.pop(0)
+            else:
+                stop = start + size
+                self.parts[0] = (stop, end)
+            chunks.append(self.data[start:stop])
+            if size > 0:
+                size -= stop - start
+        return b"".join(chunks)
+
+
+    def close(self):
+        self.parts = []
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,346 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Storage for the cells of a worksheet.
+
+Cells are held row by row so that rows can be iterated in order and moved
+without touching the rest of the worksheet. Each row keeps its cells in
+column order; rows whose cells were added out of order are sorted the next
+time they are read. The bounds of the cells are
+tracked as they are added and removed so that the dimensions of a worksheet
+are available without scanning every cell.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+
+
+class CellStore(MutableMapping):
+    """
+    Mapping of (row, column) to cells, indexed by row.
+
+    Iteration is in row-major order.
+    """
+
+    def __init__(self):
+        self._rows = {} # {row: {column: cell}}
+        self._row_index = [] # sorted rows
+        self._unsorted = set() # rows whose cells are not in column order
+        self._columns = {} # {column: number of cells}
+        self._size = 0
+        self._col_bounds = None
+
+
+    def __len__(self):
+        return self._size
+
+
+    def __contains__(self, key):
+        row, column = key
+        cells = self._rows.get(row)
+        return cells is not None and column in cells
+
+
+    def __getitem__(self, key):
+        row, column = key
+        try:
+            return self._rows[row][column]
+        except KeyError:
+            raise KeyError(key)
+
+
+    def get(self, key, default=None):
+        row, column = key
+        cells = self._rows.get(row)
+        if cells is None:
+            return default
+        return cells.get(column, default)
+
+
+    def __setitem__(self, key, cell):
+        row, column = key
+        cells = self._rows.get(row)
+        if cells is None:
+            cells = self._rows[row] = {}
+            self._add_row(row)
+        if column not in cells:
+            if cells and column < next(reversed(cells)):
+                self._unsorted.add(row)
+            self._add_column(column)
+            self._size += 1
+        cells[column] = cell
+
+
+    def add(self, cell):
+        """
+        Add a cell at its position and return the cell which is stored
+        """
+        self[cell.row, cell.column] = cell
+        return cell
+
+
+    def __delitem__(self, key):
+        row, column = key
+        cells = self._rows.get(row)
+        if cells is None or column not in cells:
+            raise KeyError(key)
+        del cells[column]
+        self._size -= 1
+        self._remove_column(column)
+        if not cells:
+            del self._rows[row]
+            self._unsorted.discard(row)
+            self._remove_row(row)
+
+
+    def __iter__(self):
+        for row in self._row_index:
+            for column in self._ordered(row):
+                yield row, column
+
+
+    def values(self):
+        for row in self._row_index:
+            yield from self._ordered(row).values()
+
+
+    def items(self):
+        for row in self._row_index:
+            for column, cell in self._ordered(row).items():
+                yield (row, column), cell
+
+
+    def clear(self):
+        self.__init__()
+
+
+    def _ordered(self, row):
+        """
+        Cells of a row in column order
+        """
+        cells = self._rows[row]
+        if row in self._unsorted:
+            ordered = sorted(cells.items())
+            cells.clear()
+            cells.update(ordered)
+            self._unsorted.discard(row)
+        return cells
+
+
+    def _add_row(self, row):
+        index = self._row_index
+        if not index or row > index[-1]:
+            index.append(row)
+        else:
+            insort(index, row)
+
+
+    def _remove_row(self, row):
+        index = self._row_index
+        del index[bisect_left(index, row)]
+
+
+    def _add_column(self, column):
+        count = self._columns.get(column, 0)
+        self._columns[column] = count + 1
+        if count == 0 and self._col_bounds is not None:
+            lo, hi = self._col_bounds
+            self._col_bounds = min(lo, column), max(hi, column)
+
+
+    def _remove_column(self, column):
+        count = self._columns[column] - 1
+        if count:
+            self._columns[column] = count
+            return
+        del self._columns[column]
+        if self._col_bounds is not None and column in self._col_bounds:
+            self._col_bounds = None
+
+
+    @property
+    def min_row(self):
+        return self._row_index[0]
+
+
+    @property
+    def max_row(self):
+        return self._row_index[-1]
+
+
+    def _column_bounds(self):
+        if self._col_bounds is None:
+            self._col_bounds = min(self._columns), max(self._columns)
+        return self._col_bounds
+
+
+    @property
+    def min_column(self):
+        return self._column_bounds()[0]
+
+
+    @property
+    def max_column(self):
+        return self._column_bounds()[1]
+
+
+    def iter_rows(self, min_row=None, max_row=None):
+        """
+        Yield the index and the cells, ordered by column, of each row
+        that contains cells
+        """
+        index = self._row_index
+        start = 0 if min_row is None else bisect_left(index, min_row)
+        for row in index[start:]:
+            if max_row is not None and row > max_row:
+                break
+            yield row, list(self._ordered(row).values())
+
+
+    def get_row(self, row, min_col, max_col, values_only=False):
+        """
+        Cells, or their values, of a row between two columns with None where
+        there are no cells
+        """
+        cells = self._rows.get(row)
+        columns = range(min_col, max_col + 1)
+        if cells is None:
+            return (None,) * len(columns)
+        if values_only:
+            return tuple(cells[c].value if c in cells else None for c in columns)
+        return tuple(cells.get(c) for c in columns)
+
+
+    def iter_range(self, min_row=None, min_col=None, max_row=None, max_col=None):
+        """
+        Yield the cells in a range which exist in row-major order
+        """
+        min_col = min_col or 1
+        for row, cells in self.iter_rows(min_row, max_row):
+            for cell in cells:
+                if cell.column < min_col:
+                    continue
+                if max_col is not None and cell.column > max_col:
+                    break
+                yield cell
+
+
+    def formulae(self):
+        """
+        Cells containing formulae in no particular order
+        """
+        for cells in self._rows.values():
+            for cell in cells.values():
+                if cell.data_type == "f":
+                    yield cell
+
+
+    def keys_in_range(self, min_row, min_col, max_row, max_col):
+        """
+        Coordinates of the cells in a range which exist. Only the rows which
+        contain cells are looked at.
+        """
+        index = self._row_index
+        start = bisect_left(index, min_row)
+        stop = bisect_right(index, max_row)
+        keys = []
+        for row in index[start:stop]:
+            cells = self._ordered(row)
+            if len(cells) > max_col - min_col:
+                columns = (c for c in range(min_col, max_col + 1) if c in cells)
+            else:
+                columns = (c for c in cells if min_col <= c <= max_col)
+            keys.extend((row, column) for column in columns)
+        return keys
+
+
+    def row_indices(self):
+        """
+        Rows containing cells in ascending order
+        """
+        return list(self._row_index)
+
+
+    def delete_rows(self, min_row, max_row):
+        """
+        Remove all the cells in the rows
+        """
+        index = self._row_index
+        start = bisect_left(index, min_row)
+        stop = bisect_right(index, max_row)
+        self._unsorted.difference_update(index[start:stop])
+        for row in index[start:stop]:
+            cells = self._rows.pop(row)
+            self._size -= len(cells)
+            for column in cells:
+                self._remove_column(column)
+        del index[start:stop]
+
+
+    def delete_columns(self, min_col, max_col):
+        """
+        Remove all the cells in the columns
+        """
+        for row in list(self._row_index):
+            cells = self._rows[row]
+            for column in [c for c in cells if min_col <= c <= max_col]:
+                del self[row, column]
+
+
+    def shift_rows(self, min_row, offset):
+        """
+        Move all rows from `min_row` by `offset` rows. Existing cells at
+        the new positions are replaced.
+        """
+        index = self._row_index
+        start = bisect_left(index, min_row)
+        rows = self._rows
+        moved = [(row, rows.pop(row)) for row in index[start:]]
+        unsorted = self._unsorted
+        moved_unsorted = unsorted.intersection(index[start:])
+        unsorted.difference_update(moved_unsorted)
+        del index[start:]
+        # moved rows stay in order and after the others unless moved up past them
+        ordered = not index or not moved or moved[0][0] + offset > index[-1]
+
+        for row, cells in moved:
+            new_row = row + offset
+            for cell in cells.values():
+                cell.row = new_row
+            target = rows.get(new_row)
+            if target is None:
+                rows[new_row] = cells
+                index.append(new_row)
+                if row in moved_unsorted:
+                    unsorted.add(new_row)
+                continue
+            unsorted.add(new_row)
+            for column, cell in cells.items():
+                if column in target:
+                    self._remove_column(column)
+                    self._size -= 1
+                target[column] = cell
+        if not ordered:
+            index.sort()
+
+
+    def shift_columns(self, min_col, offset):
+        """
+        Move all columns from `min_col` by `offset` columns. Existing cells at
+        the new positions are replaced.
+        """
+        reverse = offset > 0
+        for row, cells in self._rows.items():
+            moved = sorted((c for c in cells if c >= min_col), reverse=reverse)
+            if moved:
+                self._unsorted.add(row)
+            for column in moved:
+                cell = cells.pop(column)
+                self._remove_column(column)
+                new_col = column + offset
+                if new_col in cells:
+                    self._remove_column(new_col)
+                    self._size -= 1
+                cells[new_col] = cell
+                self._add_column(new_col)
+                cell.column = new_col
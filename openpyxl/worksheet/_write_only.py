@@ -6,6 +6,7 @@
 from inspect import isgenerator
 
 from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.cell._columns import write_columns
 from openpyxl.workbook.child import _WorkbookChild
 from .worksheet import Worksheet
 from openpyxl.utils.exceptions import WorkbookAlreadySaved
@@ -27,6 +28,7 @@ class WriteOnlyWorksheet(_WorkbookChild):
     _rel_type = Worksheet._rel_type
     _path = Worksheet._path
     mime_type = Worksheet.mime_type
+    _raw_parts = Worksheet._raw_parts
 
     # copy methods from Standard worksheet
     _add_row = Worksheet._add_row
@@ -64,13 +66,16 @@ class WriteOnlyWorksheet(_WorkbookChild):
             self._already_saved()
 
         with xf.element("sheetData"):
-            row_idx = 1
             try:
                 while True:
                     row = (yield)
-                    row = self._values_to_row(row, row_idx)
-                    self._writer.write_row(xf, row, row_idx)
-                    row_idx += 1
+                    if row is True:
+                        # direct access to the stream for bulk writes
+                        yield xf
+                        continue
+                    self._max_row += 1
+                    row = self._values_to_row(row, self._max_row)
+                    self._writer.write_row(xf, row, self._max_row)
             except GeneratorExit:
                 pass
 
@@ -120,6 +125,71 @@ class WriteOnlyWorksheet(_WorkbookChild):
         self._rows.send(row)
 
 
+    def append_columns(self, columns, number_formats=None):
+        """
+        Append rows formed from a sequence of columns of equal length.
+
+        The type of each column is inferred once from its dtype, so NumPy
+        arrays and pandas Series are written without creating cells.
+
+        :param columns: sequence of array-likes, one per column
+        :type columns: list or tuple
+
+        :param number_formats: optional number formats, one per column or None
+        :type number_formats: list or tuple
+        """
+        if not isinstance(columns, (list, tuple)):
+            self._invalid_row(columns)
+        if len({len(values) for values in columns}) > 1:
+            raise ValueError("All columns must have the same length")
+
+        self._get_writer()
+
+        if self._rows is None:
+            self._rows = self._write_rows()
+            next(self._rows)
+
+        xf = self._rows.send(True)
+        try:
+            write_columns(xf, self, columns, number_formats)
+        finally:
+            self._rows.send(None)
+
+
+    def write_frame(self, df, index=False, header=True, number_formats=None):
+        """
+        Append the contents of a pandas DataFrame column by column.
+
+        :param df: the DataFrame
+        :param index: include the index as the first column(s)
+        :param header: include the column names as the first row(s)
+        :param number_formats: optional mapping of column name to number format
+        """
+        from openpyxl.utils.dataframe import expand_index
+
+        names = list(df.columns)
+        columns = [df.iloc[:, idx] for idx in range(len(names))]
+        number_formats = number_formats or {}
+        formats = [number_formats.get(name) for name in names]
+
+        if index:
+            levels = df.index.nlevels
+            columns = [df.index.get_level_values(idx) for idx in range(levels)] + columns
+            formats = [None] * levels + formats
+
+        if header:
+            if df.columns.nlevels > 1:
+                rows = list(expand_index(df.columns, header))
+            else:
+                rows = [names]
+            for row in rows:
+                if index:
+                    row = list(df.index.names) + row
+                self.append(row)
+
+        self.append_columns(columns, formats)
+
+
     def _values_to_row(self, values, row_idx):
         """
         Convert whatever has been appended into a form suitable for work_rows
@@ -143,6 +213,9 @@ class WriteOnlyWorksheet(_WorkbookChild):
             if cell.hyperlink is not None:
                 cell.hyperlink.ref = cell.coordinate
 
+            if col_idx > self._max_col:
+                self._max_col = col_idx
+
             yield cell
 
             # reset cell if style applied
@@ -1,19 +1,28 @@
 # Copyright (c) 2010-2024 openpyxl
 
-import atexit
-from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from copy import copy
+from heapq import merge
 from io import BytesIO
+from itertools import chain
 import os
-from tempfile import NamedTemporaryFile
+from shutil import copyfileobj
+from tempfile import SpooledTemporaryFile
 from warnings import warn
+from zipfile import ZIP64_LIMIT
 
-from openpyxl.xml.functions import xmlfile
+from openpyxl.xml.functions import xmlfile, tostring
 from openpyxl.xml.constants import SHEET_MAIN_NS
 
 from openpyxl.comments.comment_sheet import CommentRecord
+from openpyxl.formatting.formatting import ConditionalFormatting
+from openpyxl.formula.tokenizer import TokenizerError
+from openpyxl.formula.translate import Translator, TranslatorError
 from openpyxl.packaging.relationship import Relationship, RelationshipList
 from openpyxl.styles.differential import DifferentialStyle
 
+from .cell_range import MultiCellRange
+from .datavalidation import DataValidationList
 from .dimensions import SheetDimension
 from .hyperlink import HyperlinkList
 from .merge import MergeCell, MergeCells
@@ -23,35 +32,161 @@ from .table import TablePartList
 from openpyxl.cell._writer import write_cell
 
 
-ALL_TEMP_FILES = []
-
-@atexit.register
-def _openpyxl_shutdown():
-    for path in ALL_TEMP_FILES:
-        if os.path.exists(path):
-            os.remove(path)
-
-
-def create_temporary_file(suffix=''):
-    fobj = NamedTemporaryFile(mode='w+', suffix=suffix,
-                              prefix='openpyxl.', delete=False)
-    filename = fobj.name
-    fobj.close()
-    ALL_TEMP_FILES.append(filename)
-    return filename
+# worksheets larger than this are moved from memory to a temporary file
+MAX_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def _is_fixed(formula):
+    """
+    Check whether a formula means the same wherever it is used, so that it
+    does not depend on the first cell of the ranges it applies to
+    """
+    if formula is None:
+        return True
+    if not formula.startswith("="):
+        formula = "=" + formula
+    try:
+        return Translator(formula, "A1").translate_formula("C3") == formula
+    except (TokenizerError, TranslatorError):
+        return False
+
+
+def _definition(obj, ignore):
+    """
+    The serialised form of an object without the attributes in `ignore`
+    """
+    tree = obj.to_tree()
+    for attr in ignore:
+        tree.attrib.pop(attr, None)
+    return tostring(tree)
+
+
+def _overlaps(first, second):
+    return any(not a.isdisjoint(b) for a in first for b in second)
+
+
+def compact_formatting(formatting):
+    """
+    Coalesce the ranges of conditional formats and merge formats whose rules
+    are the same apart from their priority. Rules are only merged if their
+    formulae do not depend on where they are used and if no other rule with
+    a priority between theirs applies to the same cells. Merged rules keep
+    the highest priority.
+    """
+    formats = list(formatting)
+    ranked = sorted(
+        (rule.priority, idx) for idx, cf in enumerate(formats)
+        for rule in cf.rules if rule.priority is not None
+    )
+    priorities = [p for p, _ in ranked]
+
+    def conflicts(members, sqrefs, lo, hi):
+        # rules of other formats which would change places with merged rules
+        start = bisect_right(priorities, lo)
+        stop = bisect_left(priorities, hi)
+        return any(
+            idx not in members and _overlaps(formats[idx].sqref, sqref)
+            for _, idx in ranked[start:stop] for sqref in sqrefs
+        )
+
+    groups = {}
+    compacted = []
+    for idx, cf in enumerate(formats):
+        rules = list(cf.rules)
+        key = None
+        if all(rule.priority is not None and _is_fixed(f)
+               for rule in rules for f in rule.formula):
+            key = (cf.pivot, tuple(_definition(rule, ["priority"]) for rule in rules))
+        group = groups.get(key)
+        if group is not None:
+            spans = [(min(lo, r.priority), max(hi, r.priority))
+                     for (lo, hi), r in zip(group["spans"], rules)]
+            sqrefs = group["sqrefs"] + [cf.sqref]
+            members = group["members"] | {idx}
+            if any(conflicts(members, sqrefs, lo, hi) for lo, hi in spans):
+                group = None
+            else:
+                group["rules"] = [r1 if r1.priority <= r2.priority else r2
+                                  for r1, r2 in zip(group["rules"], rules)]
+                group.update(spans=spans, sqrefs=sqrefs, members=members)
+        if group is None:
+            group = {
+                "pivot": cf.pivot,
+                "rules": rules,
+                "spans": [(r.priority, r.priority) for r in rules],
+                "sqrefs": [cf.sqref],
+                "members": {idx},
+            }
+            compacted.append(group)
+            if key is not None:
+                groups[key] = group
+
+    for group in compacted:
+        sqref = MultiCellRange(chain.from_iterable(group["sqrefs"])).coalesce()
+        yield ConditionalFormatting(sqref=sqref, pivot=group["pivot"], cfRule=group["rules"])
+
+
+def compact_validations(validations):
+    """
+    Coalesce the ranges of data validations and merge validations which
+    are the same apart from their ranges and whose formulae do not depend on
+    where they are used.
+    """
+    groups = {}
+    compacted = []
+    for dv in validations.dataValidation:
+        key = None
+        if _is_fixed(dv.formula1) and _is_fixed(dv.formula2):
+            key = _definition(dv, ["sqref"])
+        group = groups.get(key)
+        if group is None:
+            group = [dv, []]
+            compacted.append(group)
+            if key is not None:
+                groups[key] = group
+        group[1].append(dv.sqref)
+
+    merged = []
+    for dv, sqrefs in compacted:
+        dv = copy(dv)
+        dv.sqref = MultiCellRange(chain.from_iterable(sqrefs)).coalesce()
+        merged.append(dv)
+    return DataValidationList(
+        disablePrompts=validations.disablePrompts,
+        xWindow=validations.xWindow,
+        yWindow=validations.yWindow,
+        dataValidation=merged,
+    )
+
+
+def create_buffer(max_size=None):
+    """
+    Return a buffer that is kept in memory until it grows larger than
+    `max_size`. Temporary files are removed when the buffer is closed.
+    """
+    if max_size is None:
+        max_size = MAX_BUFFER_SIZE
+    return SpooledTemporaryFile(max_size=max_size, prefix='openpyxl.')
 
 
 class WorksheetWriter:
 
+    """
+    Serialise a worksheet to `out`, which can be a path or a file-like object
+    such as a member of the archive opened for writing. By default the
+    worksheet is written to a buffer.
+    """
 
     def __init__(self, ws, out=None):
         self.ws = ws
         self.ws._hyperlinks = []
         self.ws._comments = []
+        self._buffered = out is None
         if out is None:
-            out = create_temporary_file()
+            out = create_buffer(ws.parent.max_buffer_size)
         self.out = out
         self._rels = RelationshipList()
+        self._raw = []
         self.xf = self.get_stream()
         next(self.xf) # start generator
 
@@ -105,16 +240,15 @@ class WorksheetWriter:
 
     def rows(self):
         """Return all rows, and any cells that they contain"""
-        # order cells by row
-        rows = defaultdict(list)
-        for (row, col), cell in sorted(self.ws._cells.items()):
-            rows[row].append(cell)
+        cells = self.ws._cells
+        rows = cells.iter_rows()
 
         # add empty rows if styling has been applied
-        for row in self.ws.row_dimensions.keys() - rows.keys():
-            rows[row] = []
+        styled = self.ws.row_dimensions.keys() - set(cells.row_indices())
+        if styled:
+            rows = merge(rows, ((row, []) for row in sorted(styled)))
 
-        return sorted(rows.items())
+        return list(rows)
 
 
     def write_rows(self):
@@ -187,13 +321,14 @@ class WorksheetWriter:
             for rule in cf.rules:
                 if rule.dxf and rule.dxf != df:
                     rule.dxfId = wb._differential_styles.add(rule.dxf)
+        for cf in compact_formatting(self.ws.conditional_formatting):
             self.xf.send(cf.to_tree())
 
 
     def write_validations(self):
         dv = self.ws.data_validations
         if dv:
-            self.xf.send(dv.to_tree())
+            self.xf.send(compact_validations(dv).to_tree())
 
 
     def write_hyperlinks(self):
@@ -241,13 +376,38 @@ class WorksheetWriter:
                 self.xf.send(brk.to_tree())
 
 
+    def write_raw(self, kind, replaced=False):
+        """
+        Add relationships to the related parts of a kind which were not read,
+        unless they have been replaced. The parts are copied by the workbook
+        writer.
+        """
+        rels = []
+        for part in self.ws._raw_parts:
+            if part.kind != kind:
+                continue
+            if replaced:
+                warn(f"Worksheet {self.ws.title}: the {kind} which was not read will be replaced")
+                continue
+            rel = Relationship(Id=part.id, Type=part.rel.Type, Target=part.rel.Target)
+            self._rels.append(rel)
+            self._raw.append((rel, part))
+            rels.append(rel)
+        return rels
+
+
     def write_drawings(self):
-        if self.ws._charts or self.ws._images:
+        replaced = bool(self.ws._charts or self.ws._images)
+        raw = self.write_raw("drawing", replaced)
+        if replaced:
             rel = Relationship(type="drawing", Target="")
             self._rels.append(rel)
             drawing = Related()
             drawing.id = rel.id
             self.xf.send(drawing.to_tree("drawing"))
+        elif raw:
+            drawing = Related(id=raw[0].id)
+            self.xf.send(drawing.to_tree("drawing"))
 
 
     def write_legacy(self):
@@ -255,9 +415,15 @@ class WorksheetWriter:
         Comments & VBA controls use VML and require an additional element
         that is no longer in the specification.
         """
-        if (self.ws.legacy_drawing is not None or self.ws._comments):
+        replaced = bool(self.ws.legacy_drawing is not None or self.ws._comments)
+        raw = [r for r in self.write_raw("comments", replaced)
+               if r.Type.endswith("/vmlDrawing")]
+        if replaced:
             legacy = Related(id="anysvml")
             self.xf.send(legacy.to_tree("legacyDrawing"))
+        elif raw:
+            legacy = Related(id=raw[0].id)
+            self.xf.send(legacy.to_tree("legacyDrawing"))
 
 
     def write_tables(self):
@@ -349,6 +515,7 @@ class WorksheetWriter:
         self.write_drawings()
         self.write_legacy()
         self.write_tables()
+        self.write_raw("pivot")
 
 
     def write(self):
@@ -376,15 +543,36 @@ class WorksheetWriter:
         self.close()
         if isinstance(self.out, BytesIO):
             return self.out.getvalue()
+        if not isinstance(self.out, str):
+            self.out.seek(0)
+            return self.out.read()
         with open(self.out, "rb") as src:
             out = src.read()
 
         return out
 
 
+    def copy_to(self, archive, arcname):
+        """
+        Close the context manager and add the serialised XML to the archive
+        """
+        self.close()
+        if isinstance(self.out, str):
+            archive.write(self.out, arcname)
+            return
+
+        src = self.out
+        size = src.seek(0, os.SEEK_END)
+        src.seek(0)
+        with archive.open(arcname, "w", force_zip64=size > ZIP64_LIMIT) as dest:
+            copyfileobj(src, dest)
+
+
     def cleanup(self):
         """
-        Remove tempfile
+        Release the buffer or remove the file the worksheet was written to
         """
-        os.remove(self.out)
-        ALL_TEMP_FILES.remove(self.out)
+        if self._buffered:
+            self.out.close()
+        elif isinstance(self.out, str) and os.path.exists(self.out):
+            os.remove(self.out)
@@ -1,10 +1,14 @@
 # Copyright (c) 2010-2024 openpyxl
 
+from bisect import bisect_left
+from collections import defaultdict
 from copy import copy
+from itertools import chain
 from operator import attrgetter
+from weakref import ref
 
 from openpyxl.descriptors import Strict
-from openpyxl.descriptors import MinMax
+from openpyxl.descriptors import MinMax, Convertible
 from openpyxl.descriptors.sequence import UniqueSequence
 from openpyxl.descriptors.serialisable import Serialisable
 
@@ -15,6 +19,23 @@ from openpyxl.utils import (
     quote_sheetname,
 )
 
+def _watch(obj, owner):
+    """
+    Call `owner._touch()` when the ranges of `obj` are changed
+    """
+    owners = [o for o in obj.__dict__.get("_owners", ()) if o() is not None]
+    if not any(o() is owner for o in owners):
+        owners.append(ref(owner))
+    obj.__dict__["_owners"] = owners
+
+
+def _notify(obj):
+    for owner in obj.__dict__.get("_owners", ()):
+        owner = owner()
+        if owner is not None:
+            owner._touch()
+
+
 class CellRange(Serialisable):
     """
     Represents a range in a sheet: title and coordinates.
@@ -155,6 +176,12 @@ class CellRange(Serialisable):
                               title=self.title)
 
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_owners", None)
+        return state
+
+
     def shift(self, col_shift=0, row_shift=0):
         """
         Shift the focus of the range according to the shift values (*col_shift*, *row_shift*).
@@ -173,6 +200,7 @@ class CellRange(Serialisable):
         self.min_row += row_shift
         self.max_col += col_shift
         self.max_row += row_shift
+        _notify(self)
 
 
     def __ne__(self, other):
@@ -369,6 +397,7 @@ class CellRange(Serialisable):
         self.min_row -= up
         self.max_col += right
         self.max_row += down
+        _notify(self)
 
 
     def shrink(self, right=0, bottom=0, left=0, top=0):
@@ -388,6 +417,7 @@ class CellRange(Serialisable):
         self.min_row += top
         self.max_col -= right
         self.max_row -= bottom
+        _notify(self)
 
 
     @property
@@ -422,10 +452,102 @@ class CellRange(Serialisable):
         return [(row, self.max_col) for row in range(self.min_row, self.max_row+1)]
 
 
+def _merge_intervals(intervals):
+    """
+    Sort row intervals and merge those which overlap or are adjacent
+    """
+    merged = []
+    for lo, hi in sorted(intervals):
+        if merged and lo <= merged[-1][1] + 1:
+            if hi > merged[-1][1]:
+                merged[-1][1] = hi
+        else:
+            merged.append([lo, hi])
+    return merged
+
+
+def _subtract_intervals(intervals, removed):
+    """
+    Remove merged row intervals from merged row intervals
+    """
+    result = []
+    idx = 0
+    for lo, hi in intervals:
+        while idx < len(removed) and removed[idx][1] < lo:
+            idx += 1
+        pos = idx
+        while lo <= hi and pos < len(removed) and removed[pos][0] <= hi:
+            r_lo, r_hi = removed[pos]
+            if r_lo > lo:
+                result.append([lo, r_lo - 1])
+            lo = max(lo, r_hi + 1)
+            pos += 1
+        if lo <= hi:
+            result.append([lo, hi])
+    return result
+
+
+def _coalesce(ranges, removed=()):
+    """
+    Return the bounds of disjoint ranges covering the cells of `ranges` which
+    are not in `removed`.
+
+    The columns are split wherever a range starts or ends. In each slice of
+    columns the rows covered are merged into intervals, and intervals which
+    are the same in adjacent slices are joined.
+    """
+    edges = sorted({edge for r in chain(ranges, removed)
+                    for edge in (r.min_col, r.max_col + 1)})
+
+    def slices(rngs):
+        found = defaultdict(list)
+        for r in rngs:
+            start = bisect_left(edges, r.min_col)
+            stop = bisect_left(edges, r.max_col + 1)
+            for idx in range(start, stop):
+                found[idx].append((r.min_row, r.max_row))
+        return found
+
+    covered = slices(ranges)
+    cut = slices(removed)
+
+    bounds = []
+    current = {} # {(min_row, max_row): [min_col, max_col]}
+    for idx in sorted(covered):
+        min_col, max_col = edges[idx], edges[idx + 1] - 1
+        intervals = _merge_intervals(covered[idx])
+        if idx in cut:
+            intervals = _subtract_intervals(intervals, _merge_intervals(cut[idx]))
+        opened = {}
+        for lo, hi in intervals:
+            cols = current.pop((lo, hi), None)
+            if cols is not None and cols[1] == min_col - 1:
+                cols[1] = max_col
+            else:
+                if cols is not None:
+                    bounds.append((cols[0], lo, cols[1], hi))
+                cols = [min_col, max_col]
+            opened[lo, hi] = cols
+        for (lo, hi), cols in current.items():
+            bounds.append((cols[0], lo, cols[1], hi))
+        current = opened
+    for (lo, hi), cols in current.items():
+        bounds.append((cols[0], lo, cols[1], hi))
+    return sorted(bounds)
+
+
+class _Ranges(UniqueSequence):
+
+    def __set__(self, instance, value):
+        super().__set__(instance, value)
+        instance._touch()
+
+
 class MultiCellRange(Strict):
 
 
-    ranges = UniqueSequence(expected_type=CellRange)
+    ranges = _Ranges(expected_type=CellRange)
+    _version = 0 # counts changes to the ranges so that indexes can be rebuilt
 
 
     def __init__(self, ranges=set()):
@@ -434,15 +556,111 @@ class MultiCellRange(Strict):
         self.ranges = set(ranges)
 
 
+    def _track(self):
+        """
+        Version of the ranges. It changes when they are added, removed,
+        shifted, expanded or shrunk, or when the set of ranges is replaced or
+        changed without using `add` or `remove`.
+        """
+        ranges = self.ranges
+        tracked = id(ranges), len(ranges)
+        if self.__dict__.get("_tracked") != tracked:
+            for r in ranges:
+                _watch(r, self)
+            self._tracked = tracked
+            self._touch()
+        return self._version
+
+
+    def _get_index(self):
+        """
+        Spatial index of the ranges. It is rebuilt when their version changes.
+        """
+        version = self._track()
+        index = self.__dict__.get("_index")
+        if index is None or self.__dict__.get("_indexed") != version:
+            from ._range_index import RangeIndex
+            index = RangeIndex()
+            for r in self.ranges:
+                index.add(r, r.bounds)
+            self._index = index
+            self._indexed = version
+        return index
+
+
+    def _changed(self):
+        ranges = self.ranges
+        self._touch()
+        self._tracked = id(ranges), len(ranges)
+        self._indexed = self._version
+
+
+    def _touch(self):
+        self._version += 1
+        _notify(self)
+
+
+    def _bounds(self):
+        """
+        Bounds of the smallest range containing all the ranges or None if
+        there are no ranges. They are kept until the ranges change.
+        """
+        version = self._track()
+        bounded = self.__dict__.get("_bounded")
+        if bounded is None or bounded[0] != version:
+            bounds = None
+            ranges = self.ranges
+            if ranges:
+                bounds = (
+                    min(r.min_col for r in ranges),
+                    min(r.min_row for r in ranges),
+                    max(r.max_col for r in ranges),
+                    max(r.max_row for r in ranges),
+                )
+            bounded = self._bounded = version, bounds
+        return bounded[1]
+
+
+    def _watch(self, owner):
+        """
+        Call `owner._touch()` when the ranges are changed or replaced
+        """
+        self._track()
+        _watch(self, owner)
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_owners", None)
+        return state
+
+
     def __contains__(self, coord):
         if isinstance(coord, str):
             coord = CellRange(coord)
-        for r in self.ranges:
+        for r in self._get_index().at(coord.min_row, coord.min_col):
             if coord <= r:
                 return True
         return False
 
 
+    def range_at(self, row, column):
+        """
+        Return the range containing the cell or None
+        """
+        for r in self._get_index().at(row, column):
+            return r
+
+
+    def overlapping(self, coord):
+        """
+        Return the ranges with at least one cell in common with a cell range
+        """
+        if isinstance(coord, str):
+            coord = CellRange(coord)
+        return self._get_index().overlapping(coord.bounds)
+
+
     def __repr__(self):
         ranges = " ".join([str(r) for r in self.sorted()])
         return f"<{self.__class__.__name__} [{ranges}]>"
@@ -475,6 +693,9 @@ class MultiCellRange(Strict):
             raise ValueError("You can only add CellRanges")
         if cr not in self:
             self.ranges.add(cr)
+            self._index.add(cr, cr.bounds)
+            _watch(cr, self)
+            self._changed()
 
 
     def __iadd__(self, coord):
@@ -499,7 +720,10 @@ class MultiCellRange(Strict):
     def remove(self, coord):
         if not isinstance(coord, CellRange):
             coord = CellRange(coord)
+        index = self._get_index()
         self.ranges.remove(coord)
+        index.remove(coord)
+        self._changed()
 
 
     def __iter__(self):
@@ -510,3 +734,61 @@ class MultiCellRange(Strict):
     def __copy__(self):
         ranges = {copy(r) for r in self.ranges}
         return MultiCellRange(ranges)
+
+
+    @staticmethod
+    def _ranges_of(other):
+        if isinstance(other, str):
+            other = MultiCellRange(other)
+        elif isinstance(other, CellRange):
+            other = [other]
+        return list(other)
+
+
+    @classmethod
+    def _from_bounds(cls, bounds):
+        return cls([CellRange(min_col=min_col, min_row=min_row,
+                              max_col=max_col, max_row=max_row)
+                    for min_col, min_row, max_col, max_row in bounds])
+
+
+    def coalesce(self):
+        """
+        Return the same cells as disjoint ranges with overlapping and
+        adjacent ranges merged
+        """
+        return self._from_bounds(_coalesce(self.ranges))
+
+
+    def union(self, other):
+        """
+        Return the cells in this range or in *other*, coalesced
+        """
+        ranges = list(self.ranges) + self._ranges_of(other)
+        return self._from_bounds(_coalesce(ranges))
+
+    __or__ = union
+
+
+    def difference(self, other):
+        """
+        Return the cells in this range which are not in *other*, coalesced
+        """
+        return self._from_bounds(_coalesce(self.ranges, self._ranges_of(other)))
+
+    __sub__ = difference
+
+
+class Sqref(Convertible):
+    """
+    The ranges of an object, such as a data validation. Those watching the
+    ranges are told when they are replaced.
+    """
+
+    expected_type = MultiCellRange
+
+    def __set__(self, instance, value):
+        old = instance.__dict__.get(self.name)
+        super().__set__(instance, value)
+        if old is not None and old is not instance.__dict__[self.name]:
+            _notify(old)
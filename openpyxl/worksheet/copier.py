@@ -34,6 +34,7 @@ class WorksheetCopy:
 
     def copy_worksheet(self):
         self._copy_cells()
+        self.target._shared_formulae = self.source._shared_formulae
         self._copy_dimensions()
 
         self.target.sheet_format = copy(self.source.sheet_format)
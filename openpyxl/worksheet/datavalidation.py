@@ -12,7 +12,6 @@ from openpyxl.descriptors import (
     Sequence,
     Alias,
     Integer,
-    Convertible,
 )
 from openpyxl.descriptors.nested import NestedText
 
@@ -68,14 +67,15 @@ def expand_cell_ranges(range_string):
     return set(chain(*cells))
 
 
-from .cell_range import MultiCellRange
+from .cell_range import Sqref
+from ._range_index import RangeLookup
 
 
 class DataValidation(Serialisable):
 
     tagname = "dataValidation"
 
-    sqref = Convertible(expected_type=MultiCellRange)
+    sqref = Sqref()
     cells = Alias("sqref")
     ranges = Alias("sqref")
 
@@ -176,6 +176,37 @@ class DataValidationList(Serialisable):
         self.xWindow = xWindow
         self.yWindow = yWindow
         self.dataValidation = dataValidation
+        self._changes = 0
+        self._lookup = RangeLookup()
+
+
+    def _ranges(self):
+        for dv in self.dataValidation:
+            dv.sqref._watch(self)
+        return [(dv, [r.bounds for r in dv.sqref]) for dv in self.dataValidation]
+
+
+    def _touch(self):
+        self._changes += 1
+
+
+    def _state(self):
+        dvs = self.dataValidation
+        return id(dvs), len(dvs), self._changes
+
+
+    def for_cell(self, cell):
+        """
+        Get the validations which apply to a cell or cell coordinate
+        """
+        return self._lookup.at(cell, self._ranges, self._state())
+
+
+    def for_range(self, cell_range):
+        """
+        Get the validations which apply to at least one cell of a range
+        """
+        return self._lookup.overlapping(cell_range, self._ranges, self._state())
 
 
     @property
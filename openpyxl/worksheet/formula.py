@@ -1,6 +1,8 @@
 # Copyright (c) 2010-2024 openpyxl
 
 from openpyxl.compat import safe_string
+from openpyxl.formula.translate import Translator
+from openpyxl.utils import get_column_letter
 
 class DataTableFormula:
 
@@ -49,3 +51,50 @@ class ArrayFormula:
             v = getattr(self, k)
             if v:
                 yield k, safe_string(v)
+
+
+class SharedFormula:
+
+    """
+    Formula shared by the cells of a range. Only the formula of the first
+    cell of the range is kept. The formulae of the other cells are
+    translated from it when they are read.
+
+    All the cells of the range refer to the same object. `Cell.value` and
+    `Cell.internal_value` return the formula translated for each cell.
+    """
+
+    t = "shared"
+
+
+    def __init__(self, ref, si, text, row, column):
+        self.ref = ref
+        self.si = si
+        self.text = text
+        self.row = row
+        self.column = column
+        self._translator = None
+
+
+    @property
+    def coordinate(self):
+        return f"{get_column_letter(self.column)}{self.row}"
+
+
+    def formula(self, row, column):
+        """
+        Formula of the cell at `row` and `column`
+        """
+        if row == self.row and column == self.column:
+            return self.text
+        if self._translator is None:
+            self._translator = Translator(self.text, self.coordinate)
+        return self._translator.translate_formula(
+            row_delta=row - self.row, col_delta=column - self.column)
+
+
+    def __iter__(self):
+        for k in ["t", "ref", "si"]:
+            v = getattr(self, k)
+            if v:
+                yield k, safe_string(v)
@@ -10,6 +10,7 @@ from openpyxl.descriptors import (
 
 from openpyxl.cell.cell import MergedCell
 from openpyxl.styles.borders import Border
+from openpyxl.styles.protection import Protection
 
 from .cell_range import CellRange
 
@@ -59,8 +60,10 @@ class MergedCellRange(CellRange):
     """
     MergedCellRange stores the border information of a merged cell in the top
     left cell of the merged cell.
-    The remaining cells in the merged cell are stored as MergedCell objects and
-    get their border information from the upper left cell.
+    The remaining cells in the merged cell are MergedCell objects which get
+    their border information from the upper left cell. Unless the upper left
+    cell is protected only the cells with borders are stored, the others are
+    created when they are accessed.
     """
 
     def __init__(self, worksheet, coord):
@@ -92,11 +95,8 @@ class MergedCellRange(CellRange):
 
     def format(self):
         """
-        Each cell of the merged cell is created as MergedCell if it does not
-        already exist.
-
         The MergedCells at the edge of the merged cell gets its borders from
-        the upper left cell.
+        the upper left cell. They are created if they do not already exist.
 
          - The top MergedCells get the top border from the top left cell.
          - The bottom MergedCells get the bottom border from the top left cell.
@@ -119,9 +119,11 @@ class MergedCellRange(CellRange):
                     self.ws._cells[(cell.row, cell.column)] = cell
                 cell.border += border
 
-        protected = self.start_cell.protection is not None
-        if protected:
-            protection = copy.copy(self.start_cell.protection)
+        protection = self.start_cell.protection
+        if protection == Protection():
+            # nothing to copy so the other cells are created when accessed
+            return
+        protection = copy.copy(protection)
         for coord in self.cells:
             cell = self.ws._cells.get(coord)
             if cell is None:
@@ -129,8 +131,7 @@ class MergedCellRange(CellRange):
                 cell = MergedCell(self.ws, row=row, column=col)
                 self.ws._cells[(cell.row, cell.column)] = cell
 
-            if protected:
-                cell.protection = protection
+            cell.protection = protection
 
 
     def __contains__(self, coord):
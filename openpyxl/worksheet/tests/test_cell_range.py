@@ -376,6 +376,88 @@ class TestMultiCellRange:
             cells.remove("A1")
 
 
+    def test_range_at(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:XFD1 B2:C3 D1:D1048576")
+        assert cells.range_at(1, 200) == CellRange("A1:XFD1")
+        assert cells.range_at(3, 3) == CellRange("B2:C3")
+        assert cells.range_at(5000, 4) == CellRange("D1:D1048576")
+        assert cells.range_at(4, 3) is None
+
+
+    def test_overlapping(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:XFD1 B2:C3 E5")
+        assert set(cells.overlapping("C3:F10")) == {CellRange("B2:C3"), CellRange("E5")}
+        assert cells.overlapping("A2:A10") == []
+
+
+    def test_replaced_ranges(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1")
+        assert "A1" in cells
+        cells.ranges = [CellRange("B2")]
+        assert "A1" not in cells
+        assert "B2" in cells
+        cells.remove("B2")
+        assert "B2" not in cells
+
+
+    def test_changed_ranges(self, MultiCellRange, CellRange):
+        cr = CellRange("B2:C3")
+        cells = MultiCellRange([cr])
+        assert cells.range_at(2, 2) is cr
+        cr.shift(col_shift=2)
+        assert cells.range_at(2, 2) is None
+        assert cells.range_at(2, 4) is cr
+        cr.expand(down=5)
+        assert cells.overlapping("D8") == [cr]
+        cr.shrink(bottom=5)
+        assert cells.overlapping("D8") == []
+
+
+    def test_version(self, MultiCellRange):
+        cells = MultiCellRange("A1")
+        version = cells._track()
+        MultiCellRange("B1").add("C1")
+        assert cells._track() == version
+        cells.add("D1")
+        assert cells._track() != version
+
+
+    def test_deepcopy(self, MultiCellRange):
+        from copy import deepcopy
+        cells = MultiCellRange("B2:C3")
+        assert cells.range_at(2, 2) is not None
+        cr = deepcopy(cells)
+        next(iter(cr)).shift(row_shift=2)
+        assert cr.range_at(2, 2) is None
+        assert cells.range_at(2, 2) is not None
+
+
+    @pytest.mark.parametrize("ranges, expected",
+                             [
+                                 ("A1 B1 C1 A2:C2 E5", "A1:C2 E5"),
+                                 ("A1:A5 A3:A9 B1", "A1:A9 B1"),
+                                 ("A1:C3 B2:D4", "A1:A3 B1:C4 D2:D4"),
+                                 ("", ""),
+                             ]
+                             )
+    def test_coalesce(self, MultiCellRange, ranges, expected):
+        cells = MultiCellRange(ranges)
+        assert cells.coalesce() == expected
+
+
+    def test_union(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:B2")
+        assert cells | "C1:C2" == "A1:C2"
+        assert cells.union(CellRange("A3:B3")) == "A1:B3"
+        assert cells == "A1:B2"
+
+
+    def test_difference(self, MultiCellRange):
+        cells = MultiCellRange("A1:D4")
+        assert cells - "B2:C3" == "A1:A4 B1:C1 B4:C4 D1:D4"
+        assert cells.difference(MultiCellRange("A1:D4 F6")) == ""
+
+
     def test_iter(self, MultiCellRange, CellRange):
         cells = MultiCellRange("A1")
         assert list(cells) == [CellRange("A1")]
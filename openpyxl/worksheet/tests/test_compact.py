@@ -0,0 +1,182 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell, MergedCell
+from openpyxl.comments import Comment
+from openpyxl.styles import Font
+
+
+@pytest.fixture
+def ws():
+    wb = Workbook(compact_cells=True)
+    return wb.active
+
+
+def make_store(ws, *coords):
+    store = ws._cells
+    for row, column in coords:
+        store[row, column] = Cell(ws, row=row, column=column, value=row * column)
+    return store
+
+
+class TestCompactCellStore:
+
+
+    def test_ctor(self, ws):
+        from .._compact import CompactCellStore
+        assert isinstance(ws._cells, CompactCellStore)
+        assert len(ws._cells) == 0
+
+
+    def test_mapping(self, ws):
+        store = make_store(ws, (3, 1), (1, 2), (1, 1))
+        assert len(store) == 3
+        assert (1, 2) in store
+        assert (2, 2) not in store
+        assert store[3, 1].value == 3
+        assert store.get((4, 4)) is None
+        with pytest.raises(KeyError):
+            store[4, 4]
+        assert list(store) == [(1, 1), (1, 2), (3, 1)]
+
+
+    def test_arrays(self, ws):
+        store = make_store(ws, (1, 3), (1, 1), (1, 2))
+        row = store._rows[1]
+        assert list(row.columns) == [1, 2, 3]
+        assert row.values == [1, 2, 3]
+        assert row.types == bytearray(3)
+
+
+    def test_cells_write_through(self, ws):
+        cell = ws.cell(row=2, column=3)
+        cell.value = "text"
+        cell.font = Font(bold=True)
+        del cell
+        cell = ws["C2"]
+        assert cell.value == "text"
+        assert cell.data_type == "s"
+        assert cell.font.b is True
+        assert cell == ws.cell(row=2, column=3)
+
+
+    def test_hyperlinks_and_comments(self, ws):
+        ws["A1"].hyperlink = "http://example.com"
+        ws["B1"].comment = Comment("note", "author")
+        assert ws._cells._hyperlinks[1, 1].target == "http://example.com"
+        assert ws["A1"].value == "http://example.com"
+        assert ws["B1"].comment.text == "note"
+        ws["B1"].comment = None
+        assert ws._cells._comments == {}
+
+
+    def test_unused_styles(self, ws):
+        wb = ws.parent
+        cell = ws["A1"]
+        cell.font = Font(bold=True)
+        cell.font = Font(bold=True, italic=True)
+        assert len(wb._cell_styles) == 1
+        assert cell.style_id == 1
+        assert wb._cell_styles[1].fontId == cell._style.fontId
+        assert len(wb._cell_styles) == 2
+
+
+    def test_merged_cells(self, ws):
+        ws["A1"].font = Font(bold=True)
+        ws.merge_cells("A1:B2")
+        cell = ws["B2"]
+        assert isinstance(cell, MergedCell)
+        assert ws["B2"] is cell
+
+
+    def test_delete(self, ws):
+        store = make_store(ws, (1, 1), (1, 2), (2, 2))
+        ws["B1"].hyperlink = "http://example.com"
+        del store[1, 2]
+        assert list(store) == [(1, 1), (2, 2)]
+        assert store._hyperlinks == {}
+        assert store.max_column == 2
+
+
+    def test_delete_rows(self, ws):
+        store = make_store(ws, (1, 1), (2, 1), (3, 1), (3, 2))
+        store.delete_rows(2, 3)
+        assert list(store) == [(1, 1)]
+        assert store.max_column == 1
+
+
+    def test_delete_columns(self, ws):
+        store = make_store(ws, (1, 1), (1, 2), (2, 3))
+        store.delete_columns(2, 3)
+        assert list(store) == [(1, 1)]
+        assert store.max_row == 1
+
+
+    @pytest.mark.parametrize("min_row, offset, expected",
+                             [
+                                 (2, 2, [(1, 1), (4, 1), (5, 2)]),
+                                 (2, -1, [(1, 1), (2, 2)]),
+                                 (3, -2, [(1, 1), (1, 2), (2, 1)]),
+                             ]
+                             )
+    def test_shift_rows(self, ws, min_row, offset, expected):
+        store = make_store(ws, (1, 1), (2, 1), (3, 2))
+        store.shift_rows(min_row, offset)
+        assert list(store) == expected
+        assert len(store) == len(expected)
+
+
+    @pytest.mark.parametrize("min_col, offset, expected",
+                             [
+                                 (2, 1, [(1, 1), (1, 3), (1, 4)]),
+                                 (3, -1, [(1, 1), (1, 2)]),
+                                 (3, -2, [(1, 1), (1, 2)]),
+                             ]
+                             )
+    def test_shift_columns(self, ws, min_col, offset, expected):
+        store = make_store(ws, (1, 1), (1, 2), (1, 3))
+        store.shift_columns(min_col, offset)
+        assert list(store) == expected
+        assert store[1, 3 + offset].value == 3
+        assert store.max_column == expected[-1][1]
+
+
+    def test_get_row(self, ws):
+        store = make_store(ws, (1, 2), (1, 4), (1, 6))
+        assert store.get_row(1, 2, 5, values_only=True) == (2, None, 4, None)
+        assert store.get_row(2, 1, 2) == (None, None)
+        assert store.get_row(1, 3, 4)[1] == ws["D1"]
+
+
+    def test_iter_range(self, ws):
+        store = make_store(ws, (1, 1), (2, 2), (2, 5), (3, 3))
+        cells = store.iter_range(min_row=2, min_col=2, max_col=4)
+        assert [(c.row, c.column) for c in cells] == [(2, 2), (3, 3)]
+
+
+    def test_shift_extras(self, ws):
+        ws["B2"].comment = Comment("note", "author")
+        ws.insert_rows(1)
+        ws.insert_cols(1)
+        assert ws["C3"].comment.text == "note"
+        assert ws["B2"].comment is None
+
+
+    def test_roundtrip(self, tmpdir):
+        from openpyxl import load_workbook
+
+        tmpdir.chdir()
+        wb = Workbook(compact_cells=True)
+        ws = wb.active
+        ws.append([1, 2.5, "text", True])
+        ws["A2"] = "=SUM(A1:B1)"
+        ws["A2"].font = Font(italic=True)
+        wb.save("compact.xlsx")
+
+        wb = load_workbook("compact.xlsx", compact_cells=True)
+        ws = wb.active
+        assert list(ws.values) == [(1, 2.5, "text", True), ("=SUM(A1:B1)", None, None, None)]
+        assert ws["A2"].font.i is True
+        assert ws["A2"].data_type == "f"
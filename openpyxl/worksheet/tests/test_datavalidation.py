@@ -161,6 +161,47 @@ class TestDataValidationList:
         assert diff is None, diff
 
 
+    def test_for_cell(self, DataValidationList, DataValidation):
+        dv1 = DataValidation(sqref="A1:A10 C1")
+        dv2 = DataValidation(sqref="A5:B5")
+        dvs = DataValidationList(dataValidation=[dv1, dv2])
+        assert dvs.for_cell("A5") == [dv1, dv2]
+        assert dvs.for_cell("B1") == []
+        dv2.add("B1")
+        assert dvs.for_cell("B1") == [dv2]
+        dv1.sqref.range_at(1, 1).expand(right=1)
+        assert dvs.for_cell("B1") == [dv1, dv2]
+        dv2.sqref = "C5"
+        assert dvs.for_cell("B1") == [dv1]
+
+
+    def test_lookup_cost(self, DataValidationList, DataValidation, monkeypatch):
+        from ..cell_range import MultiCellRange
+        dvs = DataValidationList()
+        for idx in range(1, 1001):
+            dvs.append(DataValidation(sqref=f"A{idx}"))
+        assert len(dvs.for_cell("A5")) == 1
+
+        calls = []
+        def counted(self):
+            calls.append(self)
+            return iter(self.ranges)
+        monkeypatch.setattr(MultiCellRange, "__iter__", counted)
+        monkeypatch.setattr(MultiCellRange, "_track", counted)
+        assert dvs.for_cell("A500") == [dvs.dataValidation[499]]
+        assert calls == []
+
+
+    def test_for_range(self, DataValidationList, DataValidation):
+        dv1 = DataValidation(sqref="A1:A10")
+        dv2 = DataValidation(sqref="D1")
+        dvs = DataValidationList()
+        dvs.append(dv1)
+        assert dvs.for_range("A5:C20") == [dv1]
+        dvs.append(dv2)
+        assert dvs.for_range("A1:D1") == [dv1, dv2]
+
+
 COLLAPSE_TEST_DATA = [
     (
         ["A1"], "A1"
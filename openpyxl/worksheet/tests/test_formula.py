@@ -45,3 +45,43 @@ class TestDataTable:
     def test_dict(self, ArrayFormula):
         af = ArrayFormula(ref="A1:B6")
         assert dict(af) == {"ref":"A1:B6", "t":"array"}
+
+
+@pytest.fixture
+def SharedFormula():
+    from ..formula import SharedFormula
+    return SharedFormula
+
+
+class TestSharedFormula:
+
+
+    def test_ctor(self, SharedFormula):
+        sf = SharedFormula(ref="C2:C5", si="0", text="=A2*$B$1", row=2, column=3)
+        assert sf.coordinate == "C2"
+
+
+    def test_dict(self, SharedFormula):
+        sf = SharedFormula(ref="C2:C5", si="0", text="=A2*$B$1", row=2, column=3)
+        assert dict(sf) == {"ref":"C2:C5", "si":"0", "t":"shared"}
+
+
+    @pytest.mark.parametrize("row, column, formula", [
+        (2, 3, "=A2*$B$1"),
+        (4, 3, "=A4*$B$1"),
+        (2, 4, "=B2*$B$1"),
+    ])
+    def test_formula(self, SharedFormula, row, column, formula):
+        sf = SharedFormula(ref="C2:D5", si="0", text="=A2*$B$1", row=2, column=3)
+        assert sf.formula(row, column) == formula
+
+
+    def test_cell_value(self, SharedFormula):
+        from openpyxl import Workbook
+        ws = Workbook().active
+        sf = SharedFormula(ref="C2:C5", si="0", text="=A2*$B$1", row=2, column=3)
+        for row in range(2, 6):
+            ws.cell(row=row, column=3)._value = sf
+        cell = ws["C4"]
+        assert cell.value == "=A4*$B$1"
+        assert cell.internal_value == "=A4*$B$1"
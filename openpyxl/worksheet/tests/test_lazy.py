@@ -0,0 +1,86 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.worksheet.worksheet import Worksheet
+
+
+@pytest.fixture
+def LazyWorksheet():
+    from .._lazy import LazyWorksheet
+    return LazyWorksheet
+
+
+class TestLazyWorksheet:
+
+
+    def test_ctor(self, LazyWorksheet):
+        calls = []
+        wb = Workbook()
+        ws = LazyWorksheet(wb, "Lazy", calls.append)
+        assert isinstance(ws, Worksheet)
+        assert calls == []
+
+
+    def test_metadata(self, LazyWorksheet):
+        calls = []
+        wb = Workbook()
+        ws = LazyWorksheet(wb, "Lazy", calls.append)
+        wb._add_sheet(ws)
+        ws.sheet_state = "hidden"
+        ws.print_title_rows = "1:2"
+        assert wb.sheetnames == ["Sheet", "Lazy"]
+        assert ws.path == "/xl/worksheets/sheetNone.xml"
+        assert repr(ws) == '<LazyWorksheet "Lazy">'
+        assert calls == []
+
+
+    def test_load_on_access(self, LazyWorksheet):
+        def loader(ws):
+            ws["A1"] = 5
+
+        ws = LazyWorksheet(Workbook(), "Lazy", loader)
+        assert ws.max_row == 1
+        assert type(ws) is Worksheet
+        assert ws["A1"].value == 5
+
+
+    def test_load_on_assignment(self, LazyWorksheet):
+        calls = []
+        ws = LazyWorksheet(Workbook(), "Lazy", calls.append)
+        ws.sheet_format = None
+        assert calls == [ws]
+        assert type(ws) is Worksheet
+
+
+    def test_copy(self, LazyWorksheet):
+        from io import BytesIO
+        from zipfile import ZipFile
+
+        source = ZipFile(BytesIO(), "w")
+        source.writestr("xl/worksheets/sheet3.xml", b"<worksheet/>")
+        ws = LazyWorksheet(Workbook(), "Lazy", None,
+                           (source, "xl/worksheets/sheet3.xml", None, []))
+        ws._id = 1
+
+        archive = ZipFile(BytesIO(), "w")
+        assert ws._lazy_copy(archive) is True
+        assert archive.read("xl/worksheets/sheet1.xml") == b"<worksheet/>"
+        assert type(ws) is LazyWorksheet
+
+
+    def test_cannot_copy(self, LazyWorksheet):
+        calls = []
+        ws = LazyWorksheet(Workbook(), "Lazy", calls.append)
+        assert ws._lazy_copy(None) is False
+        assert calls == [ws]
+
+
+def test_source_strings(LazyWorksheet):
+    from .._lazy import source_strings
+
+    wb = Workbook()
+    assert source_strings(wb) == ()
+    wb._add_sheet(LazyWorksheet(wb, "Lazy", None, (None, None, None, ["a"])))
+    assert source_strings(wb) == ["a"]
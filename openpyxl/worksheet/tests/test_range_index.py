@@ -0,0 +1,67 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+
+@pytest.fixture
+def RangeIndex():
+    from .._range_index import RangeIndex
+    return RangeIndex
+
+
+class TestRangeIndex:
+
+
+    @pytest.mark.parametrize("bounds",
+                             [
+                                 (2, 2, 3, 3), # block
+                                 (1, 5, 16384, 5), # whole row
+                                 (5, 1, 5, 1048576), # whole column
+                                 (1, 1, 16384, 1048576), # everything
+                             ]
+                             )
+    def test_at(self, RangeIndex, bounds):
+        index = RangeIndex()
+        index.add("item", bounds)
+        min_col, min_row, max_col, max_row = bounds
+        assert list(index.at(min_row, min_col)) == ["item"]
+        assert list(index.at(max_row, max_col)) == ["item"]
+        assert list(index.at(max_row + 1, max_col)) == []
+        assert list(index.at(max_row, max_col + 1)) == []
+
+
+    def test_remove(self, RangeIndex):
+        index = RangeIndex()
+        index.add("a", (1, 1, 100, 100))
+        index.add("b", (1, 1, 1, 1))
+        index.remove("a")
+        assert list(index.at(50, 50)) == []
+        assert list(index.at(1, 1)) == ["b"]
+        assert len(index) == 1
+        assert index._levels == {(3, 3): {(0, 0): {"b"}}}
+
+
+    def test_overlapping(self, RangeIndex):
+        index = RangeIndex()
+        index.add("a", (1, 1, 2, 2))
+        index.add("b", (3, 1, 16384, 1))
+        index.add("c", (1, 100, 1, 1048576))
+        assert sorted(index.overlapping((1, 1, 3, 100))) == ["a", "b", "c"]
+        assert index.overlapping((2, 3, 5, 5)) == []
+        assert sorted(index.overlapping((1, 1, 16384, 1048576))) == ["a", "b", "c"]
+
+
+class TestRangeLookup:
+
+
+    def test_lookup(self):
+        from .._range_index import RangeLookup
+        objects = [("a", [(1, 1, 2, 2), (5, 5, 5, 5)]), ("b", [(2, 2, 3, 3)])]
+        source = lambda: objects
+        lookup = RangeLookup()
+        assert lookup.at("B2", source, 0) == ["a", "b"]
+        assert lookup.at("E5", source, 0) == ["a"]
+        assert lookup.overlapping("C3:E5", source, 0) == ["a", "b"]
+        objects.append(("c", [(1, 1, 1, 1)]))
+        assert lookup.at("A1", source, 0) == ["a"]
+        assert lookup.at("A1", source, 1) == ["a", "c"]
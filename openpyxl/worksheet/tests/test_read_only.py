@@ -238,6 +238,7 @@ def test_implementation_compatbility(ReadOnlyWorksheet, DummyWorkbook):
                     '_print_cols',
                     '_print_rows',
                     '_rels',
+                    '_shared_formulae',
                     '_tables',
                     'auto_filter',
                     'col_breaks',
@@ -262,6 +263,7 @@ def test_implementation_compatbility(ReadOnlyWorksheet, DummyWorkbook):
     ro = ReadOnlyWorksheet
     ro_attrs = set(ro.__dict__)
     ro_only = set(['_worksheet_path',
+                   '_row_index',
                    'parent',
                    'title',
                    '_shared_strings']
@@ -279,3 +281,133 @@ def test_read_datetime(datadir):
     ws = wb.active
     assert type(ws["A1"].value) == datetime.timedelta
     assert type(ws["A2"].value) == datetime.datetime
+
+
+def test_row_index(tmpdir):
+    from openpyxl import Workbook
+    tmpdir.chdir()
+    wb = Workbook()
+    ws = wb.active
+    for i in range(1, 21):
+        ws.append([i, f"s{i % 3}", f"=A{i}*2"])
+    ws["E30"] = "last"
+    wb.save("indexed.xlsx")
+
+    wb = load_workbook("indexed.xlsx", read_only=True)
+    indexed = load_workbook("indexed.xlsx", read_only=True, row_index=True)
+    ws1, ws2 = wb.active, indexed.active
+    for min_row in (1, 7, 25, 30, 40):
+        rows = ws1.iter_rows(min_row=min_row, max_row=35, values_only=True)
+        assert list(ws2.iter_rows(min_row=min_row, max_row=35, values_only=True)) == list(rows)
+    assert ws2["B17"].value == "s2"
+    assert ws2.cell(30, 5).value == "last"
+    assert ws2._row_index.rows[-1] == 30
+    indexed.close()
+    assert ws2._row_index._data is None
+
+
+@pytest.mark.parametrize("num_shards", [1, 3, 40])
+def test_iter_rows_sharded(datadir, num_shards):
+    datadir.chdir()
+    wb = load_workbook("test_datetime.xlsx", read_only=True)
+    ws = wb.active
+    rows = [row for shard in range(num_shards)
+            for row in ws.iter_rows_sharded(shard, num_shards, values_only=True)]
+    assert rows == list(ws.iter_rows(values_only=True))
+    with pytest.raises(IndexError):
+        ws.iter_rows_sharded(num_shards, num_shards)
+    wb.close()
+
+
+def test_read_parallel(datadir):
+    datadir.chdir()
+    with open("test_datetime.xlsx", "rb") as src:
+        wb = load_workbook(src, read_only=True)
+        ws = wb.active
+        rows = [row for batch in wb.read_parallel(ws, workers=2, shards=3)
+                for row in batch]
+        assert rows == list(ws.iter_rows(values_only=True))
+        wb.close()
+
+
+@pytest.fixture
+def typed_workbook(tmpdir):
+    from openpyxl import Workbook
+    tmpdir.chdir()
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["id", "price", "when", "name", "mixed"])
+    for i in range(1, 4):
+        ws.append([i, i * 1.5, datetime.datetime(2020, 1, i), f"n{i}", i % 2 and i or "x"])
+    ws["B6"] = 2.5
+    wb.save("typed.xlsx")
+    return load_workbook("typed.xlsx", read_only=True)
+
+
+@pytest.mark.numpy_required
+def test_to_arrays(typed_workbook):
+    import numpy
+    ws = typed_workbook.active
+    ids, prices, when, names, mixed = ws.to_arrays(min_row=2)
+
+    assert ids.dtype == numpy.float64
+    assert numpy.isnan(ids[-1])
+    assert list(ids[:3]) == [1, 2, 3]
+    assert list(prices[[0, 1, 2, 4]]) == [1.5, 3.0, 4.5, 2.5]
+    assert numpy.isnan(prices[3])
+    assert when.dtype == numpy.dtype("datetime64[ms]")
+    assert when[0] == numpy.datetime64("2020-01-01")
+    assert numpy.isnat(when[-1])
+    assert names.dtype == object
+    assert list(names) == ["n1", "n2", "n3", None, None]
+    assert list(mixed) == [1, "x", 3, None, None]
+
+
+@pytest.mark.numpy_required
+def test_to_arrays_columns(typed_workbook):
+    import numpy
+    ws = typed_workbook.active
+    when, ids = ws.to_arrays(min_row=2, max_row=4, columns=["C", 1],
+                             dtypes={1: "int64"})
+    assert ids.dtype == numpy.int64
+    assert list(ids) == [1, 2, 3]
+    assert list(when) == [numpy.datetime64("2020-01-0%d" % i) for i in range(1, 4)]
+
+
+@pytest.mark.pandas_required
+def test_to_dataframe(typed_workbook):
+    ws = typed_workbook.active
+    df = ws.to_dataframe(max_row=4, columns=["A", "D"])
+    assert list(df.columns) == ["id", "name"]
+    assert list(df["id"]) == [1, 2, 3]
+    assert str(df["id"].dtype) == "int64"
+    assert list(df["name"]) == ["n1", "n2", "n3"]
+
+
+def test_iter_rows_columns(typed_workbook):
+    ws = typed_workbook.active
+    rows = list(ws.iter_rows(min_row=2, columns=["D", 1], values_only=True))
+    assert rows == [("n1", 1), ("n2", 2), ("n3", 3), (None, None), (None, None)]
+    cells = next(ws.iter_rows(columns=[2]))
+    assert cells[0].coordinate == "B1"
+
+
+def test_iter_rows_where(typed_workbook):
+    ws = typed_workbook.active
+    rows = ws.iter_rows(min_row=2, columns=["A", "D"], values_only=True,
+                        where={"E": lambda v: v == "x"})
+    assert list(rows) == [(2, "n2")]
+
+
+def test_iter_rows_until(typed_workbook):
+    ws = typed_workbook.active
+    rows = ws.iter_rows(min_row=2, values_only=True,
+                        until={1: lambda v: v is None or v > 2})
+    assert [row[:2] for row in rows] == [(1, 1.5), (2, 3)]
+
+
+def test_iter_rows_unsized(typed_workbook):
+    ws = typed_workbook.active
+    ws.reset_dimensions()
+    with pytest.raises(ValueError):
+        ws.iter_rows(where={1: bool})
@@ -482,6 +482,22 @@ class TestWorksheetParser:
         assert formula == "=A12*B12"
 
 
+    def test_lazy_shared_formula(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.expand_shared_formulae = False
+        src = """
+        <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="C2"><f t="shared" ref="C2:C4" si="0">A2*B2</f><v>9</v></c>
+          <c r="C4"><f t="shared" si="0"/><v>9</v></c>
+        </sheetData>
+        """
+        master, dependent = [parser.parse_formula(el) for el in fromstring(src)]
+        assert master is dependent
+        assert master.ref == "C2:C4"
+        assert master.text == "=A2*B2"
+        assert master.formula(4, 3) == "=A4*B4"
+
+
     def test_array_formula(self, WorkSheetParser, datadir):
         parser = WorkSheetParser
 
@@ -669,6 +685,92 @@ class TestWorksheetParser:
             assert expected_cell == cell
 
 
+    @pytest.mark.parametrize("data_only", [False, True])
+    def test_fast_cells(self, WorkSheetParser, data_only, recwarn):
+        parser = WorkSheetParser
+        parser.data_only = data_only
+        src = """
+        <row r="3" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A3" s="2"><v>4.5</v></c>
+          <c r="B3" t="s"><v>0</v></c>
+          <c r="C3" t="b"><v>0</v></c>
+          <c r="D3" s="29"><v>41184</v></c>
+          <c r="E3" s="30"><v>1.25</v></c>
+          <c r="F3" s="29"><v>2958466</v></c>
+          <c r="G3" t="str"><f>A3&amp;"x"</f><v>4.5x</v></c>
+          <c t="inlineStr"><is><t>ID</t></is></c>
+          <c t="d"><v>2011-12-25T14:23:55</v></c>
+          <c r="aa3" t="e"><v>#N/A</v></c>
+          <c r="AB3"/>
+        </row>
+        """
+        element = fromstring(src)
+
+        parser.fast = False
+        expected = parser.parse_row(element)
+        parser.fast = True
+        assert parser.parse_row(element) == expected
+        assert parser.col_counter == 28
+
+
+    def test_parse_projection(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.source = BytesIO(b"""
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <sheetData>
+            <row><c><v>1</v></c><c t="s"><v>0</v></c><c><v>3</v></c></row>
+            <row><c r="A2"><v>2</v></c><c r="C2"><v>6</v></c></row>
+            <row><c r="A3"><v>3</v></c><c r="C3"><v>9</v></c></row>
+            <row><c r="A4"><v>4</v></c><c r="C4"><v>12</v></c></row>
+          </sheetData>
+        </worksheet>
+        """)
+        rows = parser.parse_projection([3], where={1: lambda v: v != 2},
+                                       until={3: lambda v: v > 9})
+        assert [(idx, {c: cell and cell['value'] for c, cell in cells.items()})
+                for idx, cells in rows] == [(1, {1: 1, 3: 3}), (3, {1: 3, 3: 9})]
+
+
+    SHARED = b"""
+    <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <sheetData>
+        <row r="1"><c r="A1"><v>1</v></c><c r="B1"><f t="shared" ref="B1:B4" si="0">A1*2</f><v>2</v></c></row>
+        <row r="2"><c r="A2"><v>2</v></c><c r="B2"><f t="shared" si="0"/><v>4</v></c></row>
+        <row r="3"><c r="A3"><v>3</v></c><c r="B3"><f t="shared" si="0"/><v>6</v></c></row>
+        <row r="4"><c r="A4"><v>4</v></c><c r="B4"><f t="shared" si="0"/><v>8</v></c></row>
+      </sheetData>
+    </worksheet>
+    """
+
+
+    @pytest.mark.parametrize("columns, min_row, expected",
+                             [
+                                 ([2], 3, {2: ["=A3*2", "=A4*2"]}),
+                                 ([1, 2], 2, {1: [2, 3, 4], 2: ["=A2*2", "=A3*2", "=A4*2"]}),
+                             ]
+                             )
+    def test_parse_columns_shared_formula(self, WorkSheetParser, columns, min_row, expected):
+        parser = WorkSheetParser
+        parser.source = BytesIO(self.SHARED)
+        buffers = parser.parse_columns(columns, min_row=min_row)
+        assert {col: buf.values for col, buf in buffers.items()} == expected
+
+
+    @pytest.mark.parametrize("columns, where, min_row, expected",
+                             [
+                                 ([2], None, 3, ["=A3*2", "=A4*2"]),
+                                 ([2], {1: lambda v: v > 2}, 1, ["=A3*2", "=A4*2"]),
+                                 ([1], {1: lambda v: v > 2}, 1, [3, 4]),
+                             ]
+                             )
+    def test_parse_projection_shared_formula(self, WorkSheetParser, columns, where, min_row, expected):
+        parser = WorkSheetParser
+        parser.source = BytesIO(self.SHARED)
+        rows = parser.parse_projection(columns, where=where, min_row=min_row)
+        assert [cells[columns[0]]['value'] for idx, cells in rows] == expected
+        assert "0" in parser.shared_formulae
+
+
     def test_external_hyperlinks(self, WorkSheetParser):
         src = b"""
         <hyperlinks xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
@@ -938,6 +1040,30 @@ class TestWorksheetReader:
         assert ws['E2'].value.text == "=C2:C11*D2:D11"
 
 
+    def test_shared_formula(self, Workbook, WorksheetReader):
+        src = BytesIO(b"""
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1"><c r="B1"><f t="shared" ref="B1:B3" si="0">A1*2</f><v>2</v></c></row>
+          <row r="2"><c r="B2"><f t="shared" si="0"/><v>4</v></c></row>
+          <row r="3"><c r="B3"><f t="shared" si="0"/><v>6</v></c></row>
+        </sheetData>
+        </worksheet>
+        """)
+        ws = Workbook.create_sheet("Shared")
+        reader = WorksheetReader(ws, src, [], data_only=False, rich_text=False)
+        reader.bind_cells()
+
+        assert ws._shared_formulae is True
+        assert ws["B3"]._value is ws["B1"]._value
+        assert ws["B3"].value == "=A3*2"
+        assert list(ws.values) == [(None, "=A1*2"), (None, "=A2*2"), (None, "=A3*2")]
+
+        ws.insert_rows(1)
+        assert ws["B4"].value == "=A3*2"
+        assert ws._shared_formulae is False
+
+
     def test_formatting(self, PrimedWorksheetReader):
         reader = PrimedWorksheetReader
         reader.bind_cells()
@@ -0,0 +1,121 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.worksheet.formula import ArrayFormula
+from openpyxl.worksheet.table import Table
+
+
+@pytest.fixture(params=[False, True])
+def wb(request):
+    wb = Workbook(compact_cells=request.param)
+    ws = wb.active
+    ws.title = "Data"
+    for r in range(1, 11):
+        ws.append([r, r * 2, f"=A{r}+B{r}"])
+    ws["D1"] = "=SUM(A1:A10)"
+    other = wb.create_sheet("Other")
+    other["A1"] = "=SUM(Data!A1:A10)+Data!$B$5+B5"
+    return wb
+
+
+class TestUpdateReferences:
+
+
+    def test_formulae(self, wb):
+        ws = wb["Data"]
+        ws.insert_rows(3, 2, translate=True)
+        assert ws["C7"].value == "=A7+B7"
+        assert ws["C2"].value == "=A2+B2"
+        assert ws["D1"].value == "=SUM(A1:A12)"
+        assert wb["Other"]["A1"].value == "=SUM(Data!A1:A12)+Data!$B$7+B5"
+
+
+    def test_deleted_formulae(self, wb):
+        ws = wb["Data"]
+        ws.delete_cols(1, translate=True)
+        assert ws["B3"].value == "=#REF!+A3"
+        assert ws["C1"].value == "=SUM(#REF!)"
+        assert wb["Other"]["A1"].value == "=SUM(Data!#REF!)+Data!$A$5+B5"
+
+
+    def test_array_formula(self, wb):
+        ws = wb["Data"]
+        ws["E2"] = ArrayFormula("E2:E3", "=A2:A3*2")
+        ws.insert_rows(1, translate=True)
+        formula = ws["E3"].value
+        assert formula.ref == "E3:E4"
+        assert formula.text == "=A3:A4*2"
+
+
+    def test_without_translate(self, wb):
+        ws = wb["Data"]
+        ws.insert_rows(1)
+        assert ws["D2"].value == "=SUM(A1:A10)"
+
+
+    def test_merged_cells(self, wb):
+        ws = wb["Data"]
+        ws.merge_cells("E5:F6")
+        ws.merge_cells("E2:E3")
+        ws.delete_rows(2, 2, translate=True)
+        assert ws.merged_cells.ranges == {ws.merged_cells.range_at(3, 5)}
+        assert str(ws.merged_cells) == "E3:F4"
+
+
+    def test_conditional_formatting(self, wb):
+        ws = wb["Data"]
+        ws.conditional_formatting.add("A3:A8", FormulaRule(formula=["A3>5"]))
+        ws.insert_rows(3, 2, translate=True)
+        rules = ws.conditional_formatting["A5:A10"]
+        assert rules[0].formula == ["A5>5"]
+        assert [str(cf.sqref) for cf in ws.conditional_formatting] == ["A5:A10"]
+
+
+    def test_data_validation(self, wb):
+        ws = wb["Data"]
+        dv = DataValidation(type="list", formula1="$A$1:$A$10", sqref="B2:B9")
+        ws.add_data_validation(dv)
+        removed = DataValidation(type="list", formula1="$A$1:$A$10", sqref="C2")
+        ws.add_data_validation(removed)
+        ws.delete_rows(2, translate=True)
+        assert str(dv.sqref) == "B2:B8"
+        assert dv.formula1 == "$A$1:$A$9"
+        assert ws.data_validations.dataValidation == [dv]
+
+
+    def test_defined_names(self, wb):
+        ws = wb["Data"]
+        wb.defined_names["nums"] = DefinedName("nums", attr_text="Data!$A$1:$A$10")
+        ws.defined_names["local"] = DefinedName("local", attr_text="Data!$B$2")
+        ws.insert_cols(1, translate=True)
+        assert wb.defined_names["nums"].attr_text == "Data!$B$1:$B$10"
+        assert ws.defined_names["local"].attr_text == "Data!$C$2"
+
+
+    def test_tables_and_filters(self, wb):
+        ws = wb["Data"]
+        ws.add_table(Table(displayName="T1", ref="A1:C10"))
+        ws.add_table(Table(displayName="T2", ref="A20:C22"))
+        ws.auto_filter.ref = "A1:C10"
+        ws.delete_rows(15, 10, translate=True)
+        ws.insert_rows(5, translate=True)
+        assert ws.tables["T1"].ref == "A1:C11"
+        assert "T2" not in ws.tables
+        assert ws.auto_filter.ref == "A1:C11"
+
+
+    def test_print_settings(self, wb):
+        ws = wb["Data"]
+        ws.print_area = "A1:C10"
+        ws.print_title_rows = "1:2"
+        ws.print_title_cols = "B:C"
+        ws.insert_rows(2, translate=True)
+        ws.delete_cols(1, translate=True)
+        assert ws.print_area == "'Data'!$A$1:$B$11"
+        assert ws.print_title_rows == "$1:$3"
+        assert ws.print_title_cols == "$A:$B"
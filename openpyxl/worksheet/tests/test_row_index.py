@@ -0,0 +1,128 @@
+# Copyright (c) 2010-2024 openpyxl
+
+from io import BytesIO
+import os
+
+import pytest
+
+from .._reader import WorkSheetParser
+
+
+SRC = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<x:worksheet xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+  <x:sheetData>
+    <x:row r="2"><x:c r="A2"><x:v>1</x:v></x:c>
+      <x:c r="B2"><x:f t="shared" ref="B2:B5" si="0">A2&amp;"x"</x:f><x:v>1x</x:v></x:c></x:row>
+    <x:row><x:c r="A3"><x:v>2</x:v></x:c><x:c r="B3"><x:f t="shared" si="0"/></x:c></x:row>
+    <x:row r="5"><x:c r="A5"><x:v>3</x:v></x:c><x:c r="B5"><x:f t="shared" si="0"/></x:c></x:row>
+    <x:row r="7" spans="1:1"/>
+  </x:sheetData>
+  <x:rowBreaks count="1"><x:brk id="4" max="16383" man="1"/></x:rowBreaks>
+</x:worksheet>
+"""
+
+
+@pytest.fixture
+def RowIndex():
+    from .._row_index import RowIndex
+    return RowIndex
+
+
+def parse(index, min_row):
+    src, row, formulae = index.open(min_row)
+    with src:
+        parser = WorkSheetParser(src, [])
+        parser.row_counter = row
+        parser.shared_formulae = formulae
+        return [(idx, [c['value'] for c in cells]) for idx, cells in parser.parse()]
+
+
+class TestRowIndex:
+
+    def test_build(self, RowIndex):
+        index = RowIndex(lambda: BytesIO(SRC))
+        index.open()
+        assert list(index.rows) == [2, 3, 5, 7]
+        assert [SRC[o:o+6] for o in index.offsets] == [b"<x:row"] * 4
+        assert [(si, t.tokenizer.formula) for _, si, t in index.formulae] == [("0", '=A2&"x"')]
+        index.close()
+
+
+    @pytest.mark.parametrize("min_row, expected",
+                             [
+                                 (1, [(2, [1, '=A2&"x"']), (3, [2, '=A3&"x"']),
+                                      (5, [3, '=A5&"x"']), (7, [])]),
+                                 (3, [(3, [2, '=A3&"x"']), (5, [3, '=A5&"x"']), (7, [])]),
+                                 (4, [(5, [3, '=A5&"x"']), (7, [])]),
+                                 (8, []),
+                             ]
+                             )
+    def test_open(self, RowIndex, min_row, expected):
+        index = RowIndex(lambda: BytesIO(SRC))
+        assert parse(index, min_row) == expected
+
+
+    @pytest.mark.parametrize("num_shards, expected",
+                             [
+                                 (1, [(1, None)]),
+                                 (2, [(1, 4), (5, None)]),
+                                 (4, [(1, 2), (3, 4), (5, 6), (7, None)]),
+                                 (6, [(1, 2), None, (3, 4), (5, 6), None, (7, None)]),
+                             ]
+                             )
+    def test_shards(self, RowIndex, num_shards, expected):
+        index = RowIndex(lambda: BytesIO(SRC))
+        shards = index.shards(num_shards)
+        assert [s and s[:2] for s in shards] == expected
+        offsets = [s[2:] for s in shards if s is not None]
+        assert offsets[0][0] == index.offsets[0]
+        assert offsets[-1][1] == index.tail
+        for (_, end), (start, _) in zip(offsets, offsets[1:]):
+            assert end == start
+
+
+    def test_unordered(self, RowIndex):
+        src = SRC.replace(b'r="5"', b'r="1"').replace(b'"A5"', b'"A1"')
+        index = RowIndex(lambda: BytesIO(src))
+        assert parse(index, 3)[0][0] == 2
+        assert index.ordered is False
+
+
+    @pytest.mark.parametrize("src",
+                             [
+                                 b"",
+                                 b"<worksheet><sheetData/></worksheet>",
+                             ]
+                             )
+    def test_no_rows(self, RowIndex, src):
+        index = RowIndex(lambda: BytesIO(src))
+        stream, row, formulae = index.open(5)
+        assert row == 4
+        assert stream.read() == src
+        index.close()
+
+
+    def test_stream(self):
+        from .._row_index import RowStream
+        stream = RowStream(b"0123456789", [(0, 3), (6, 10)])
+        assert stream.read(2) == b"01"
+        assert stream.read(3) == b"267"
+        assert stream.read() == b"89"
+        assert stream.read(5) == b""
+
+
+    def test_shard_stream(self):
+        from .._row_index import RowStream
+        stream = RowStream(b"<0123456789>", [(0, 1), (4, 8), (11, 12)])
+        assert stream.read(3) == b"<34"
+        assert stream.read(4) == b"56>"
+        assert stream.read() == b""
+
+
+    def test_file(self, RowIndex):
+        index = RowIndex(lambda: BytesIO(SRC))
+        index.build()
+        with open(index.filename, "rb") as f:
+            assert f.read() == SRC
+        index.close()
+        assert not os.path.exists(index.filename)
@@ -0,0 +1,146 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+
+class DummyCell:
+
+    def __init__(self, row, column):
+        self.row = row
+        self.column = column
+
+
+@pytest.fixture
+def CellStore():
+    from .._store import CellStore
+    return CellStore
+
+
+def make_store(CellStore, *coords):
+    store = CellStore()
+    for row, column in coords:
+        store[row, column] = DummyCell(row, column)
+    return store
+
+
+class TestCellStore:
+
+
+    def test_ctor(self, CellStore):
+        store = CellStore()
+        assert len(store) == 0
+        assert not store
+        assert list(store) == []
+
+
+    def test_mapping(self, CellStore):
+        store = make_store(CellStore, (3, 1), (1, 2), (1, 1))
+        assert len(store) == 3
+        assert (1, 2) in store
+        assert (2, 2) not in store
+        assert store[3, 1].row == 3
+        assert store.get((4, 4)) is None
+        with pytest.raises(KeyError):
+            store[4, 4]
+
+
+    def test_iteration_order(self, CellStore):
+        store = make_store(CellStore, (3, 1), (1, 2), (1, 1), (2, 5))
+        assert list(store) == [(1, 1), (1, 2), (2, 5), (3, 1)]
+        assert [(c.row, c.column) for c in store.values()] == list(store)
+
+
+    def test_sort_once(self, CellStore):
+        store = make_store(CellStore, (1, 1), (1, 3), (2, 1), (2, 2))
+        assert store._unsorted == set()
+        store[1, 2] = DummyCell(1, 2)
+        assert store._unsorted == {1}
+        assert list(store) == [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2)]
+        assert store._unsorted == set()
+        assert list(store._rows[1]) == [1, 2, 3]
+
+
+    def test_bounds(self, CellStore):
+        store = make_store(CellStore, (5, 3), (2, 7), (9, 4))
+        assert (store.min_row, store.max_row) == (2, 9)
+        assert (store.min_column, store.max_column) == (3, 7)
+
+        store[1, 1] = DummyCell(1, 1)
+        assert (store.min_row, store.min_column) == (1, 1)
+
+
+    def test_bounds_after_delete(self, CellStore):
+        store = make_store(CellStore, (5, 3), (2, 7), (9, 4), (9, 7))
+        del store[9, 4]
+        assert store.max_row == 9
+        assert store.min_column == 3
+        del store[5, 3]
+        assert store.min_column == 7
+        del store[9, 7]
+        assert (store.min_row, store.max_row) == (2, 2)
+        with pytest.raises(KeyError):
+            del store[9, 7]
+
+
+    def test_iter_rows(self, CellStore):
+        store = make_store(CellStore, (3, 2), (3, 1), (1, 1), (5, 1))
+        rows = [(idx, [c.column for c in cells]) for idx, cells in store.iter_rows()]
+        assert rows == [(1, [1]), (3, [1, 2]), (5, [1])]
+        rows = [idx for idx, cells in store.iter_rows(min_row=2, max_row=4)]
+        assert rows == [3]
+
+
+    def test_keys_in_range(self, CellStore):
+        store = make_store(CellStore, (1, 1), (2, 2), (2, 5), (3, 3), (6, 2))
+        assert store.keys_in_range(2, 2, 5, 16384) == [(2, 2), (2, 5), (3, 3)]
+        assert store.keys_in_range(1, 2, 3, 2) == [(2, 2)]
+        assert store.keys_in_range(4, 1, 5, 5) == []
+
+
+    def test_delete_rows(self, CellStore):
+        store = make_store(CellStore, (1, 1), (2, 1), (3, 1), (3, 2))
+        store.delete_rows(2, 3)
+        assert list(store) == [(1, 1)]
+        assert store.max_column == 1
+
+
+    def test_delete_columns(self, CellStore):
+        store = make_store(CellStore, (1, 1), (1, 2), (2, 3))
+        store.delete_columns(2, 3)
+        assert list(store) == [(1, 1)]
+        assert store.max_row == 1
+
+
+    @pytest.mark.parametrize("min_row, offset, expected",
+                             [
+                                 (2, 2, [(1, 1), (4, 1), (5, 2)]),
+                                 (2, -1, [(1, 1), (2, 2)]),
+                                 (3, -2, [(1, 1), (1, 2), (2, 1)]),
+                             ]
+                             )
+    def test_shift_rows(self, CellStore, min_row, offset, expected):
+        store = make_store(CellStore, (1, 1), (2, 1), (3, 2))
+        store.shift_rows(min_row, offset)
+        assert list(store) == expected
+        assert all((c.row, c.column) == key for key, c in store.items())
+        assert len(store) == len(expected)
+
+
+    def test_shift_rows_merge_order(self, CellStore):
+        store = make_store(CellStore, (1, 3), (3, 1), (3, 2), (4, 2), (4, 1))
+        store.shift_rows(3, -2)
+        assert list(store) == [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2)]
+
+
+    @pytest.mark.parametrize("min_col, offset, expected",
+                             [
+                                 (2, 1, [(1, 1), (1, 3), (1, 4)]),
+                                 (3, -1, [(1, 1), (1, 2)]),
+                             ]
+                             )
+    def test_shift_columns(self, CellStore, min_col, offset, expected):
+        store = make_store(CellStore, (1, 1), (1, 2), (1, 3))
+        store.shift_columns(min_col, offset)
+        assert list(store) == expected
+        assert all((c.row, c.column) == key for key, c in store.items())
+        assert store.max_column == expected[-1][1]
@@ -260,6 +260,36 @@ class TestWorksheet:
         assert next(vals) == (4, 5, 6)
 
 
+    def test_values_do_not_create_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['A1'] = 1
+        ws['C3'] = 3
+        assert list(ws.values) == [(1, None, None), (None, None, None), (None, None, 3)]
+        assert list(ws.iter_cols(values_only=True))[0] == (1, None, None)
+        assert list(ws._cells) == [(1, 1), (3, 3)]
+
+
+    def test_iter_rows_no_create(self, Worksheet):
+        ws = Worksheet(Workbook())
+        a1 = ws['A1']
+        c2 = ws['C2']
+        rows = list(ws.iter_rows(max_row=3, create=False))
+        assert rows == [(a1, None, None), (None, None, c2), (None, None, None)]
+        cols = list(ws.iter_cols(create=False))
+        assert cols == [(a1, None), (None, None), (None, c2)]
+        assert list(ws._cells) == [(1, 1), (2, 3)]
+
+
+    def test_iter_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['A1'] = 1
+        ws['C3'] = 3
+        ws['E3'] = 5
+        assert [c.coordinate for c in ws.iter_cells()] == ['A1', 'C3', 'E3']
+        assert [c.coordinate for c in ws.iter_cells(min_row=2, max_col=4)] == ['C3']
+        assert len(ws._cells) == 3
+
+
     def test_auto_filter(self, Worksheet):
         ws = Worksheet(Workbook())
 
@@ -369,6 +399,28 @@ class TestWorksheet:
         assert (1, 1) in ws._cells
 
 
+    def test_merge_covered_cells_not_stored(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['C1'] = 3
+        ws.merge_cells("A1:XFD1")
+        assert list(ws._cells) == [(1, 1)]
+        cell = ws['B1']
+        assert cell.__class__.__name__ == "MergedCell"
+        assert ws['B1'] is cell
+        assert ws['A2'].__class__.__name__ == "Cell"
+
+
+    def test_merged_cells_dimension(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("C3:E8")
+        assert ws.calculate_dimension() == "C3:E8"
+        ws["B4"] = 1
+        ws.merge_cells("F1:G2")
+        assert (ws.min_row, ws.min_column, ws.max_row, ws.max_column) == (1, 2, 8, 7)
+        ws.unmerge_cells("C3:E8")
+        assert ws.dimensions == "B1:G4"
+
+
     def test_merge_coordinate(self, Worksheet):
         ws = Worksheet(Workbook())
         ws.merge_cells(start_row=1, start_column=1, end_row=4, end_column=4)
@@ -656,22 +708,6 @@ class TestEditableWorksheet:
         assert ws['B3'].value is None
 
 
-    @pytest.mark.parametrize("idx, offset, max_val, remainder",
-                             [
-                                 (1, 3, 6, {4}),
-                                 (2, 3, 6, {4, 5}),
-                                 (3, 3, 6, {4, 5, 6}),
-                                 (4, 3, 6, {4, 5, 6}),
-                                 (5, 3, 6, {5, 6}),
-                                 (6, 3, 6, {6}),
-                                 (6, 1, 6, {6}),
-                             ]
-                             )
-    def test_remainder(self, dummy_worksheet, idx, offset, max_val, remainder):
-        from ..worksheet import _gutter
-        assert set(_gutter(idx, offset, max_val)) == remainder
-
-
     def test_delete_last_col(self, dummy_worksheet):
         ws = dummy_worksheet
         ws.delete_cols(8)
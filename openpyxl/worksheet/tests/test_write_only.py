@@ -24,6 +24,9 @@ class DummyWorkbook:
         self.epoch = CALENDAR_WINDOWS_1900
         self.sheetnames = []
         self.iso_dates = False
+        self.inline_strings = False
+        self.max_shared_strings = None
+        self.max_buffer_size = None
 
 
 @pytest.fixture
@@ -53,8 +56,7 @@ def test_append(WriteOnlyWorksheet):
     ws.append([datetime.date(2001, 1, 1), 1])
     ws.append(i for i in [1, 2])
     ws.close()
-    with open(ws._writer.out, "rb") as src:
-        xml = src.read()
+    xml = ws._writer.read()
     expected = """
     <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
           <sheetPr>
@@ -72,8 +74,8 @@ def test_append(WriteOnlyWorksheet):
             <c t="n" r="A1">
               <v>1</v>
             </c>
-            <c t="inlineStr" r="B1">
-              <is><t>s</t></is>
+            <c t="s" r="B1">
+              <v>0</v>
             </c>
             </row>
             <row r="2">
@@ -121,8 +123,7 @@ def test_cannot_save_twice(WriteOnlyWorksheet):
 def test_close(WriteOnlyWorksheet):
     ws = WriteOnlyWorksheet
     ws.close()
-    with open(ws._writer.out, "rb") as src:
-        xml = src.read()
+    xml = ws._writer.read()
     expected = """
     <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
     <sheetPr>
@@ -146,8 +147,7 @@ def test_close(WriteOnlyWorksheet):
 def test_read_after_closing(WriteOnlyWorksheet):
     ws = WriteOnlyWorksheet
     ws.close()
-    with open(ws._writer.out, "rb") as src:
-        xml = src.read()
+    xml = ws._writer.read()
     expected = """
     <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
     <sheetPr>
@@ -173,8 +173,7 @@ def test_write_only_cell(WriteOnlyWorksheet):
     c = WriteOnlyCell(ws, value=5)
     ws.append([c])
     ws.close()
-    with open(ws._writer.out, "rb") as src:
-        xml = src.read()
+    xml = ws._writer.read()
     expected = """
     <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
     <sheetPr>
@@ -209,3 +208,148 @@ def test_hyperlink(WriteOnlyWorksheet):
     ws.append([cell])
     assert cell.hyperlink.ref == "A2"
     ws.close()
+
+
+def test_append_columns(WriteOnlyWorksheet):
+    ws = WriteOnlyWorksheet
+    ws.append(["header"])
+    assert ws._max_col == 1
+    ws.append_columns([[1, 2.5, None], ["a", None, "a"]])
+    assert ws._max_row == 4
+    assert ws._max_col == 2
+    ws.append([3])
+    assert ws._max_col == 2
+    ws.close()
+    xml = ws._writer.read()
+    expected = """
+    <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+    <sheetPr>
+      <outlinePr summaryRight="1" summaryBelow="1"/>
+      <pageSetUpPr/>
+    </sheetPr>
+    <sheetViews>
+      <sheetView workbookViewId="0">
+        <selection sqref="A1" activeCell="A1"/>
+      </sheetView>
+    </sheetViews>
+    <sheetFormatPr baseColWidth="8" defaultRowHeight="15"/>
+    <sheetData>
+      <row r="1">
+        <c t="s" r="A1"><v>0</v></c>
+      </row>
+      <row r="2">
+        <c t="n" r="A2"><v>1</v></c>
+        <c t="s" r="B2"><v>1</v></c>
+      </row>
+      <row r="3">
+        <c t="n" r="A3"><v>2.5</v></c>
+      </row>
+      <row r="4">
+        <c t="s" r="B4"><v>1</v></c>
+      </row>
+      <row r="5">
+        <c t="n" r="A5"><v>3</v></c>
+      </row>
+    </sheetData>
+    <pageMargins bottom="1" footer="0.5" header="0.5" left="0.75" right="0.75" top="1"/>
+    </worksheet>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+def test_append_columns_precision(WriteOnlyWorksheet):
+    from openpyxl.cell._columns import column_encoder
+    ws = WriteOnlyWorksheet
+    style_id, encoder = column_encoder(ws, [12345678901234567891, 0.1 + 0.2])
+    assert list(encoder) == [
+        ("n", "12345678901234567891"),
+        ("n", "0.30000000000000004"),
+    ]
+
+
+def test_append_columns_unequal(WriteOnlyWorksheet):
+    ws = WriteOnlyWorksheet
+    with pytest.raises(ValueError):
+        ws.append_columns([[1, 2], [1]])
+
+
+@pytest.mark.parametrize("columns", [
+    [["x", "y"], ["z"]],
+    [["x", "\x01"]],
+])
+def test_append_columns_error(tmpdir, columns):
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.utils.exceptions import IllegalCharacterError
+
+    tmpdir.chdir()
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["a"])
+    with pytest.raises((ValueError, IllegalCharacterError)):
+        ws.append_columns(columns)
+    ws.append(["b"])
+    ws.append(["c"])
+    wb.save("columns.xlsx")
+
+    rows = list(load_workbook("columns.xlsx").active.values)
+    expected = [("a",), ("b",), ("c",)]
+    if len(columns) == 1:
+        expected.insert(1, ("x",))
+    assert rows == expected
+
+
+@pytest.mark.numpy_required
+def test_append_arrays(tmpdir):
+    import numpy
+    from openpyxl import Workbook, load_workbook
+
+    tmpdir.chdir()
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append_columns(
+        [
+            numpy.array([1, 2]),
+            numpy.array([1.5, numpy.nan]),
+            numpy.array([True, False]),
+            numpy.array(["2018-01-01", "NaT"], dtype="datetime64[ns]"),
+            numpy.array(["a", "b"]),
+        ],
+        number_formats=[None, "0.00"],
+    )
+    wb.save("arrays.xlsx")
+
+    ws = load_workbook("arrays.xlsx").active
+    assert list(ws.values) == [
+        (1, 1.5, True, datetime.datetime(2018, 1, 1), "a"),
+        (2, None, False, None, "b"),
+    ]
+    assert ws["B1"].number_format == "0.00"
+    assert ws["D1"].number_format == "yyyy-mm-dd h:mm:ss"
+
+
+@pytest.mark.pandas_required
+def test_write_frame(tmpdir):
+    import pandas
+    from openpyxl import Workbook, load_workbook
+
+    tmpdir.chdir()
+    df = pandas.DataFrame(
+        {
+            "int": [1, 2],
+            "str": ["x", None],
+            "date": pandas.to_datetime(["2021-01-01", "2021-01-02"]),
+            "nullable": pandas.array([1, None], dtype="Int64"),
+        }
+    )
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.write_frame(df, index=True)
+    wb.save("frame.xlsx")
+
+    ws = load_workbook("frame.xlsx").active
+    assert list(ws.values) == [
+        (None, "int", "str", "date", "nullable"),
+        (0, 1, "x", datetime.datetime(2021, 1, 1), 1),
+        (1, 2, None, datetime.datetime(2021, 1, 2), None),
+    ]
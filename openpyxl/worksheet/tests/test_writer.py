@@ -8,7 +8,7 @@ from openpyxl.tests.helper import compare_xml
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.workbook import Workbook
 from openpyxl.styles import PatternFill, Font, Color
-from openpyxl.formatting.rule import CellIsRule
+from openpyxl.formatting.rule import CellIsRule, FormulaRule
 from openpyxl.comments import Comment
 
 from ..dimensions import RowDimension
@@ -260,6 +260,105 @@ class TestWorksheetWriter:
         assert diff is None, diff
 
 
+    def test_compact_formatting(self, writer):
+        ws = writer.ws
+        fill = PatternFill(patternType='solid', start_color=Color('FFEE1111'))
+        for row in range(1, 4):
+            ws.conditional_formatting.add(f'A{row}:C{row}',
+                                          CellIsRule(operator='equal', formula=['"Fail"'], fill=fill))
+            ws.conditional_formatting.add(f'D{row}',
+                                          FormulaRule(formula=[f'D{row}>1'], fill=fill))
+        writer.write_formatting()
+        xml = writer.read()
+        expected = """
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <conditionalFormatting sqref="A1:C3">
+            <cfRule operator="equal" priority="1" type="cellIs" dxfId="0">
+              <formula>"Fail"</formula>
+            </cfRule>
+          </conditionalFormatting>
+          <conditionalFormatting sqref="D1">
+            <cfRule priority="2" type="expression" dxfId="0">
+              <formula>D1&gt;1</formula>
+            </cfRule>
+          </conditionalFormatting>
+          <conditionalFormatting sqref="D2">
+            <cfRule priority="4" type="expression" dxfId="0">
+              <formula>D2&gt;1</formula>
+            </cfRule>
+          </conditionalFormatting>
+          <conditionalFormatting sqref="D3">
+            <cfRule priority="6" type="expression" dxfId="0">
+              <formula>D3&gt;1</formula>
+            </cfRule>
+          </conditionalFormatting>
+        </worksheet>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+
+    def test_compact_formatting_keeps_order(self, writer):
+        ws = writer.ws
+        red = PatternFill(patternType='solid', start_color=Color('FFEE1111'))
+        blue = PatternFill(patternType='solid', start_color=Color('FF1111EE'))
+        ws.conditional_formatting.add('A1', CellIsRule(operator='equal', formula=['1'], fill=red))
+        ws.conditional_formatting.add('A2:A3', CellIsRule(operator='equal', formula=['1'], fill=blue))
+        ws.conditional_formatting.add('A2', CellIsRule(operator='equal', formula=['1'], fill=red))
+        writer.write_formatting()
+        xml = writer.read()
+        expected = """
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <conditionalFormatting sqref="A1">
+            <cfRule operator="equal" priority="1" type="cellIs" dxfId="0">
+              <formula>1</formula>
+            </cfRule>
+          </conditionalFormatting>
+          <conditionalFormatting sqref="A2:A3">
+            <cfRule operator="equal" priority="2" type="cellIs" dxfId="1">
+              <formula>1</formula>
+            </cfRule>
+          </conditionalFormatting>
+          <conditionalFormatting sqref="A2">
+            <cfRule operator="equal" priority="3" type="cellIs" dxfId="0">
+              <formula>1</formula>
+            </cfRule>
+          </conditionalFormatting>
+        </worksheet>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+
+    def test_compact_validations(self, writer):
+        ws = writer.ws
+        for row in range(1, 4):
+            for col in "AB":
+                ws.data_validations.append(DataValidation(type="list", formula1='"Yes,No"',
+                                                          sqref=f"{col}{row}"))
+        ws.data_validations.append(DataValidation(type="custom", formula1='A1>1', sqref="D1"))
+        ws.data_validations.append(DataValidation(type="custom", formula1='A2>1', sqref="D2"))
+        writer.write_validations()
+        xml = writer.read()
+        expected = """
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+         <dataValidations count="3">
+           <dataValidation allowBlank="0" showDropDown="0" showErrorMessage="0" showInputMessage="0" sqref="A1:B3" type="list">
+             <formula1>"Yes,No"</formula1>
+           </dataValidation>
+           <dataValidation allowBlank="0" showDropDown="0" showErrorMessage="0" showInputMessage="0" sqref="D1" type="custom">
+             <formula1>A1&gt;1</formula1>
+           </dataValidation>
+           <dataValidation allowBlank="0" showDropDown="0" showErrorMessage="0" showInputMessage="0" sqref="D2" type="custom">
+             <formula1>A2&gt;1</formula1>
+           </dataValidation>
+         </dataValidations>
+        </worksheet>"""
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+        assert len(ws.data_validations.dataValidation[0].sqref.ranges) == 1
+
+
     def test_hyperlinks(self, writer):
 
         ws = writer.ws
@@ -587,7 +686,48 @@ class TestWorksheetWriter:
 
 
     def test_cleanup(self, writer):
-        assert os.path.exists(writer.out) is True
+        assert writer.out.closed is False
         writer.close()
         writer.cleanup()
-        assert os.path.exists(writer.out) is False
+        assert writer.out.closed is True
+
+
+    def test_cleanup_file(self, tmpdir):
+        from .._writer import WorksheetWriter
+
+        tmpdir.chdir()
+        writer = WorksheetWriter(Workbook().active, "sheet.xml")
+        writer.write()
+        assert os.path.exists("sheet.xml") is True
+        writer.cleanup()
+        assert os.path.exists("sheet.xml") is False
+
+
+    def test_spill_to_disk(self):
+        from .._writer import WorksheetWriter
+
+        wb = Workbook(max_buffer_size=1024)
+        ws = wb.active
+        for row in range(100):
+            ws.append([row] * 10)
+        writer = WorksheetWriter(ws)
+        writer.write()
+        assert writer.out._rolled is True
+        xml = writer.read()
+        assert xml.startswith(b"<worksheet")
+        assert b'<c r="J100" t="n"><v>99</v></c>' in xml
+
+
+    def test_in_memory(self, writer):
+        writer.write()
+        assert writer.out._rolled is False
+
+
+    def test_copy_to(self, writer):
+        from io import BytesIO
+        from zipfile import ZipFile
+
+        writer.write()
+        archive = ZipFile(BytesIO(), "w")
+        writer.copy_to(archive, "xl/worksheets/sheet1.xml")
+        assert archive.read("xl/worksheets/sheet1.xml") == writer.read()
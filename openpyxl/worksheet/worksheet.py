@@ -4,8 +4,8 @@
 
 
 # Python stdlib imports
+from copy import copy
 from itertools import chain
-from operator import itemgetter
 from inspect import isgenerator
 from warnings import warn
 
@@ -50,13 +50,16 @@ from .views import (
     Selection,
     SheetViewList,
 )
+from ._store import CellStore
+from ._compact import CompactCellStore
+from ._references import update_references
 from .cell_range import MultiCellRange, CellRange
 from .merge import MergedCellRange
 from .properties import WorksheetProperties
 from .pagebreak import RowBreak, ColBreak
 from .scenario import ScenarioList
 from .table import TableList
-from .formula import ArrayFormula
+from .formula import ArrayFormula, SharedFormula
 from .print_settings import (
     PrintTitles,
     ColRange,
@@ -76,6 +79,7 @@ class Worksheet(_WorkbookChild):
     _rel_type = "worksheet"
     _path = "/xl/worksheets/sheet{0}.xml"
     mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+    _raw_parts = () # related parts which were not read
 
     BREAK_NONE = 0
     BREAK_ROW = 1
@@ -113,7 +117,11 @@ class Worksheet(_WorkbookChild):
                                                  default_factory=self._add_column)
         self.row_breaks = RowBreak()
         self.col_breaks = ColBreak()
-        self._cells = {}
+        if getattr(self.parent, "compact_cells", False):
+            self._cells = CompactCellStore(self)
+        else:
+            self._cells = CellStore()
+        self._shared_formulae = False
         self._charts = []
         self._images = []
         self._rels = RelationshipList()
@@ -255,21 +263,39 @@ class Worksheet(_WorkbookChild):
         """
         if not 0 < row < 1048577:
             raise ValueError(f"Row numbers must be between 1 and 1048576. Row number supplied was {row}")
-        coordinate = (row, column)
-        if not coordinate in self._cells:
-            cell = Cell(self, row=row, column=column)
-            self._add_cell(cell)
-        return self._cells[coordinate]
+        cell = self._cells.get((row, column))
+        if cell is None:
+            cell = self._merged_cell(row, column)
+            if cell is None:
+                cell = Cell(self, row=row, column=column)
+            cell = self._add_cell(cell)
+        return cell
+
+
+    def _merged_cell(self, row, column):
+        """
+        Cells covered by a merged range are only created when they are
+        accessed. Return a new MergedCell if the cell is covered.
+        """
+        if not self.merged_cells:
+            return
+        mcr = self.merged_cells.range_at(row, column)
+        if mcr is None or (row, column) == (mcr.min_row, mcr.min_col):
+            return
+        cell = MergedCell(self, row, column)
+        start = self._cells.get((mcr.min_row, mcr.min_col))
+        if start is not None and start.has_style:
+            cell.protection = copy(start.protection)
+        return cell
 
 
     def _add_cell(self, cell):
         """
-        Internal method for adding cell objects.
+        Internal method for adding cell objects. Returns the cell which is
+        stored.
         """
-        column = cell.col_idx
-        row = cell.row
-        self._current_row = max(row, self._current_row)
-        self._cells[(row, column)] = cell
+        self._current_row = max(cell.row, self._current_row)
+        return self._cells.add(cell)
 
 
     def __getitem__(self, key):
@@ -323,8 +349,7 @@ class Worksheet(_WorkbookChild):
 
     def __delitem__(self, key):
         row, column = coordinate_to_tuple(key)
-        if (row, column) in self._cells:
-            del self._cells[(row, column)]
+        self._cells.pop((row, column), None)
 
 
     @property
@@ -333,10 +358,7 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        min_row = 1
-        if self._cells:
-            min_row = min(self._cells)[0]
-        return min_row
+        return self._bounds()[1]
 
 
     @property
@@ -345,10 +367,7 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        max_row = 1
-        if self._cells:
-            max_row = max(self._cells)[0]
-        return max_row
+        return self._bounds()[3]
 
 
     @property
@@ -357,10 +376,7 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        min_col = 1
-        if self._cells:
-            min_col = min(c[1] for c in self._cells)
-        return min_col
+        return self._bounds()[0]
 
 
     @property
@@ -369,10 +385,25 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        max_col = 1
+        return self._bounds()[2]
+
+
+    def _bounds(self):
+        """
+        Bounds of the cells and of the merged cells, which are only created
+        when they are used. (1, 1, 1, 1) if there are neither.
+        """
+        bounds = None
         if self._cells:
-            max_col = max(c[1] for c in self._cells)
-        return max_col
+            cells = self._cells
+            bounds = (cells.min_column, cells.min_row, cells.max_column, cells.max_row)
+        merged = self.merged_cells._bounds()
+        if merged is None:
+            return bounds or (1, 1, 1, 1)
+        if bounds is None:
+            return merged
+        return (min(bounds[0], merged[0]), min(bounds[1], merged[1]),
+                max(bounds[2], merged[2]), max(bounds[3], merged[3]))
 
 
     def calculate_dimension(self):
@@ -380,19 +411,7 @@ class Worksheet(_WorkbookChild):
 
         :rtype: string
         """
-        if self._cells:
-            rows = set()
-            cols = set()
-            for row, col in self._cells:
-                rows.add(row)
-                cols.add(col)
-            max_row = max(rows)
-            max_col = max(cols)
-            min_col = min(cols)
-            min_row = min(rows)
-        else:
-            return "A1:A1"
-
+        min_col, min_row, max_col, max_row = self._bounds()
         return f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
 
 
@@ -402,7 +421,8 @@ class Worksheet(_WorkbookChild):
         return self.calculate_dimension()
 
 
-    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False):
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False,
+                  create=True):
         """
         Produces cells from the worksheet, by row. Specify the iteration range
         using indices of rows and columns.
@@ -411,6 +431,10 @@ class Worksheet(_WorkbookChild):
 
         If no cells are in the worksheet an empty tuple will be returned.
 
+        Cells which do not exist are created unless `create` is False, in
+        which case None is returned in their place. No cells are created
+        when only values are returned.
+
         :param min_col: smallest column index (1-based index)
         :type min_col: int
 
@@ -426,6 +450,9 @@ class Worksheet(_WorkbookChild):
         :param values_only: whether only cell values should be returned
         :type values_only: bool
 
+        :param create: whether cells which do not exist should be created
+        :type create: bool
+
         :rtype: generator
         """
 
@@ -438,16 +465,26 @@ class Worksheet(_WorkbookChild):
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
 
+        if not create:
+            return self._existing_by_row(min_col, min_row, max_col, max_row, values_only)
         return self._cells_by_row(min_col, min_row, max_col, max_row, values_only)
 
 
     def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
+        if values_only:
+            yield from self._existing_by_row(min_col, min_row, max_col, max_row, True)
+            return
         for row in range(min_row, max_row + 1):
-            cells = (self.cell(row=row, column=column) for column in range(min_col, max_col + 1))
-            if values_only:
-                yield tuple(cell.value for cell in cells)
-            else:
-                yield tuple(cells)
+            yield tuple(self.cell(row=row, column=column) for column in range(min_col, max_col + 1))
+
+
+    def _existing_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
+        """
+        Get cells, or values, by row without creating cells
+        """
+        get_row = self._cells.get_row
+        for row in range(min_row, max_row + 1):
+            yield get_row(row, min_col, max_col, values_only)
 
 
     @property
@@ -469,7 +506,8 @@ class Worksheet(_WorkbookChild):
             yield row
 
 
-    def iter_cols(self, min_col=None, max_col=None, min_row=None, max_row=None, values_only=False):
+    def iter_cols(self, min_col=None, max_col=None, min_row=None, max_row=None, values_only=False,
+                  create=True):
         """
         Produces cells from the worksheet, by column. Specify the iteration range
         using indices of rows and columns.
@@ -478,6 +516,10 @@ class Worksheet(_WorkbookChild):
 
         If no cells are in the worksheet an empty tuple will be returned.
 
+        Cells which do not exist are created unless `create` is False, in
+        which case None is returned in their place. No cells are created
+        when only values are returned.
+
         :param min_col: smallest column index (1-based index)
         :type min_col: int
 
@@ -493,6 +535,9 @@ class Worksheet(_WorkbookChild):
         :param values_only: whether only cell values should be returned
         :type values_only: bool
 
+        :param create: whether cells which do not exist should be created
+        :type create: bool
+
         :rtype: generator
         """
 
@@ -504,6 +549,8 @@ class Worksheet(_WorkbookChild):
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
 
+        if not create:
+            return self._existing_by_col(min_col, min_row, max_col, max_row, values_only)
         return self._cells_by_col(min_col, min_row, max_col, max_row, values_only)
 
 
@@ -511,15 +558,50 @@ class Worksheet(_WorkbookChild):
         """
         Get cells by column
         """
+        if values_only:
+            yield from self._existing_by_col(min_col, min_row, max_col, max_row, True)
+            return
         for column in range(min_col, max_col+1):
-            cells = (self.cell(row=row, column=column)
+            yield tuple(self.cell(row=row, column=column)
                         for row in range(min_row, max_row+1))
+
+
+    def _existing_by_col(self, min_col, min_row, max_col, max_row, values_only=False):
+        """
+        Get cells, or values, by column without creating cells
+        """
+        get = self._cells.get
+        for column in range(min_col, max_col+1):
+            cells = (get((row, column)) for row in range(min_row, max_row+1))
             if values_only:
-                yield tuple(cell.value for cell in cells)
+                yield tuple(None if cell is None else cell.value for cell in cells)
             else:
                 yield tuple(cells)
 
 
+    def iter_cells(self, min_row=None, max_row=None, min_col=None, max_col=None):
+        """
+        Produces only the cells which exist in the worksheet, by row. Specify
+        the iteration range using indices of rows and columns. Cells are not
+        created and empty positions are skipped.
+
+        :param min_col: smallest column index (1-based index)
+        :type min_col: int
+
+        :param min_row: smallest row index (1-based index)
+        :type min_row: int
+
+        :param max_col: largest column index (1-based index)
+        :type max_col: int
+
+        :param max_row: largest row index (1-based index)
+        :type max_row: int
+
+        :rtype: generator
+        """
+        return self._cells.iter_range(min_row, min_col, max_row, max_col)
+
+
     @property
     def columns(self):
         """Produces all cells in the worksheet, by column  (see :func:`iter_cols`)"""
@@ -608,10 +690,11 @@ class Worksheet(_WorkbookChild):
         and recreate the lost border information.
         Borders are then applied
         """
-        cells = mcr.cells
-        next(cells) # skip first cell
-        for row, col in cells:
-            self._cells[row, col] = MergedCell(self, row, col)
+        start = (mcr.min_row, mcr.min_col)
+        for key in self._cells.keys_in_range(mcr.min_row, mcr.min_col,
+                                             mcr.max_row, mcr.max_col):
+            if key != start:
+                del self._cells[key]
         mcr.format()
 
 
@@ -632,10 +715,11 @@ class Worksheet(_WorkbookChild):
 
         self.merged_cells.remove(cr)
 
-        cells = cr.cells
-        next(cells) # skip first cell
-        for row, col in cells:
-            del self._cells[(row, col)]
+        start = (cr.min_row, cr.min_col)
+        for key in self._cells.keys_in_range(cr.min_row, cr.min_col,
+                                             cr.max_row, cr.max_col):
+            if key != start:
+                del self._cells[key]
 
 
     def append(self, iterable):
@@ -686,86 +770,88 @@ class Worksheet(_WorkbookChild):
         self._current_row = row_idx
 
 
+    def _expand_shared_formulae(self):
+        """
+        Give the cells which share formulae their own formula before they
+        are moved
+        """
+        if not self._shared_formulae:
+            return
+        for cell in self._cells.formulae():
+            value = cell._value
+            if isinstance(value, SharedFormula):
+                cell._value = value.formula(cell.row, cell.column)
+        self._shared_formulae = False
+
+
     def _move_cells(self, min_row=None, min_col=None, offset=0, row_or_col="row"):
         """
         Move either rows or columns around by the offset
         """
-        reverse = offset > 0 # start at the end if inserting
-        row_offset = 0
-        col_offset = 0
-
-        # need to make affected ranges contiguous
+        self._expand_shared_formulae()
         if row_or_col == 'row':
-            cells = self.iter_rows(min_row=min_row)
-            row_offset = offset
-            key = 0
+            self._cells.shift_rows(min_row, offset)
         else:
-            cells = self.iter_cols(min_col=min_col)
-            col_offset = offset
-            key = 1
-        cells = list(cells)
+            self._cells.shift_columns(min_col, offset)
 
-        for row, column in sorted(self._cells, key=itemgetter(key), reverse=reverse):
-            if min_row and row < min_row:
-                continue
-            elif min_col and column < min_col:
-                continue
 
-            self._move_cell(row, column, row_offset, col_offset)
-
-
-    def insert_rows(self, idx, amount=1):
+    def insert_rows(self, idx, amount=1, translate=False):
         """
         Insert row or rows before row==idx
+
+        If `translate` is True references to the worksheet in formulae,
+        defined names, merged cells, conditional formats, data validations,
+        tables, filters and print settings are updated.
         """
         self._move_cells(min_row=idx, offset=amount, row_or_col="row")
         self._current_row = self.max_row
+        if translate:
+            update_references(self, "row", idx, amount)
 
 
-    def insert_cols(self, idx, amount=1):
+    def insert_cols(self, idx, amount=1, translate=False):
         """
         Insert column or columns before col==idx
+
+        If `translate` is True references to the worksheet are updated as
+        for :meth:`insert_rows`.
         """
         self._move_cells(min_col=idx, offset=amount, row_or_col="column")
+        if translate:
+            update_references(self, "column", idx, amount)
 
 
-    def delete_rows(self, idx, amount=1):
+    def delete_rows(self, idx, amount=1, translate=False):
         """
         Delete row or rows from row==idx
-        """
 
-        remainder = _gutter(idx, amount, self.max_row)
+        If `translate` is True references to the worksheet are updated as
+        for :meth:`insert_rows`. References to deleted cells become #REF!
+        and merged cells, formats, validations and tables which only
+        contained deleted cells are removed.
+        """
 
+        self._cells.delete_rows(idx, idx + amount - 1)
         self._move_cells(min_row=idx+amount, offset=-amount, row_or_col="row")
-
-        # calculating min and max col is an expensive operation, do it only once
-        min_col = self.min_column
-        max_col = self.max_column + 1
-        for row in remainder:
-            for col in range(min_col, max_col):
-                if (row, col) in self._cells:
-                    del self._cells[row, col]
         self._current_row = self.max_row
         if not self._cells:
             self._current_row = 0
+        if translate:
+            update_references(self, "row", idx, -amount)
 
 
-    def delete_cols(self, idx, amount=1):
+    def delete_cols(self, idx, amount=1, translate=False):
         """
         Delete column or columns from col==idx
-        """
 
-        remainder = _gutter(idx, amount, self.max_column)
+        If `translate` is True references to the worksheet are updated as
+        for :meth:`delete_rows`.
+        """
 
+        self._cells.delete_columns(idx, idx + amount - 1)
         self._move_cells(min_col=idx+amount, offset=-amount, row_or_col="column")
-
-        # calculating min and max row is an expensive operation, do it only once
-        min_row = self.min_row
-        max_row = self.max_row + 1
-        for col in remainder:
-            for row in range(min_row, max_row):
-                if (row, col) in self._cells:
-                    del self._cells[row, col]
+        if translate:
+            update_references(self, "column", idx, -amount)
 
 
     def move_range(self, cell_range, rows=0, cols=0, translate=False):
@@ -791,6 +877,7 @@ class Worksheet(_WorkbookChild):
         else:
             cells = sorted(cell_range.cols, reverse=right)
 
+        self._expand_shared_formulae()
         for row, col in chain.from_iterable(cells):
             self._move_cell(row, col, rows, cols, translate)
 
@@ -895,13 +982,3 @@ class Worksheet(_WorkbookChild):
             self._print_area = PrintArea.from_string(value)
         elif hasattr(value, "__iter__"):
             self._print_area = PrintArea.from_string(",".join(value))
-
-
-def _gutter(idx, offset, max_val):
-    """
-    When deleting rows and columns are deleted we rely on overwriting.
-    This may not be the case for a large offset on small set of cells:
-    range(cells_to_delete) > range(cell_to_be_moved)
-    """
-    gutter = range(max(max_val+1-offset, idx), min(idx+offset, max_val)+1)
-    return gutter
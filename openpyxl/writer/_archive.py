@@ -0,0 +1,249 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Write compressed members to archives.
+
+Members can be copied from one archive to another without being
+decompressed. They can also be compressed in a pool of threads: members are
+compressed concurrently but added to the archive in the order in which they
+were written so that the file is the same as when writing to the archive
+directly.
+
+Reading and adding compressed members relies on the internals of
+`zipfile.ZipFile`. They are only used if a trial run when this module is
+imported succeeds: otherwise members are decompressed and added with
+`writestr()`, or read and compressed again.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+import os
+import struct
+import time
+import zipfile
+import zlib
+from zipfile import (
+    BadZipFile,
+    ZipFile,
+    ZipInfo,
+    ZIP_DEFLATED,
+    ZIP_STORED,
+    ZIP64_LIMIT,
+    LargeZipFile,
+)
+
+
+def compress(data, compress_type=ZIP_DEFLATED, level=None):
+    """
+    Return the checksum, the size and the raw compressed data of a member
+    """
+    crc = zlib.crc32(data)
+    size = len(data)
+    if compress_type == ZIP_DEFLATED:
+        if level is None:
+            level = zlib.Z_DEFAULT_COMPRESSION
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    return crc, size, data
+
+
+def write_compressed(archive, zinfo, crc, size, data):
+    """
+    Add a member that has already been compressed to the archive
+    """
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = len(data)
+    zinfo.flag_bits = 0x00
+    if not zinfo.external_attr:
+        zinfo.external_attr = 0o600 << 16 # ?rw-------
+
+    if not (RAW_MEMBERS and isinstance(archive, ZipFile)):
+        if zinfo.compress_type == ZIP_DEFLATED:
+            data = zlib.decompress(data, -15)
+        archive.writestr(zinfo, data)
+        return
+    _write_raw(archive, zinfo, data)
+
+
+def _write_raw(archive, zinfo, data):
+    zip64 = zinfo.file_size > ZIP64_LIMIT or zinfo.compress_size > ZIP64_LIMIT
+    if zip64 and not archive._allowZip64:
+        raise LargeZipFile("Filesize would require ZIP64 extensions")
+
+    with archive._lock:
+        if archive._writing:
+            raise ValueError("Can't write to ZIP archive while an open writing handle exists.")
+        if archive._seekable:
+            archive.fp.seek(archive.start_dir)
+        zinfo.header_offset = archive.fp.tell()
+        archive._writecheck(zinfo)
+        archive._didModify = True
+        archive.fp.write(zinfo.FileHeader(zip64))
+        archive.fp.write(data)
+        archive.filelist.append(zinfo)
+        archive.NameToInfo[zinfo.filename] = zinfo
+        archive.start_dir = archive.fp.tell()
+
+
+def read_compressed(archive, name):
+    """
+    Return the information and the raw compressed data of a member
+    """
+    zinfo = archive.getinfo(name)
+    if not (RAW_MEMBERS and isinstance(archive, ZipFile)):
+        crc, size, data = compress(archive.read(name), zinfo.compress_type)
+        return zinfo, data
+    return zinfo, _read_raw(archive, zinfo)
+
+
+def _read_raw(archive, zinfo):
+    with archive._lock:
+        fp = archive.fp
+        fp.seek(zinfo.header_offset)
+        header = struct.unpack(zipfile.structFileHeader,
+                               fp.read(zipfile.sizeFileHeader))
+        if header[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+            raise BadZipFile(f"Bad magic number for file header of {zinfo.filename}")
+        fp.seek(header[zipfile._FH_FILENAME_LENGTH]
+                + header[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+        return fp.read(zinfo.compress_size)
+
+
+def _raw_members():
+    """
+    Check that compressed members can be added to and read from archives
+    directly
+    """
+    data = b"<worksheet/>" * 10
+    out = BytesIO()
+    try:
+        with ZipFile(out, "w") as archive:
+            zinfo = ZipInfo("sheet1.xml")
+            zinfo.compress_type = ZIP_DEFLATED
+            zinfo.CRC, zinfo.file_size, compressed = compress(data)
+            zinfo.compress_size = len(compressed)
+            _write_raw(archive, zinfo, compressed)
+        with ZipFile(out) as archive:
+            return (archive.read("sheet1.xml") == data
+                    and _read_raw(archive, archive.getinfo("sheet1.xml")) == compressed)
+    except Exception:
+        return False
+
+
+RAW_MEMBERS = _raw_members()
+
+
+def copy_member(source, name, archive, arcname=None):
+    """
+    Copy a member from one archive to another without decompressing and
+    compressing it again
+    """
+    if arcname is None:
+        arcname = name
+    zinfo = source.getinfo(name)
+    if zinfo.flag_bits & 0x1 or zinfo.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+        # encrypted or unusual compression
+        archive.writestr(arcname, source.read(name))
+        return
+
+    zinfo, data = read_compressed(source, name)
+    add_compressed(archive, arcname, zinfo, data)
+
+
+def add_compressed(archive, arcname, zinfo, data):
+    """
+    Add a member returned by `read_compressed` to an archive
+    """
+    target = ZipInfo(arcname, zinfo.date_time)
+    target.compress_type = zinfo.compress_type
+    if isinstance(archive, ParallelArchive):
+        archive.write_compressed(target, zinfo.CRC, zinfo.file_size, data)
+    else:
+        write_compressed(archive, target, zinfo.CRC, zinfo.file_size, data)
+
+
+class ParallelArchive:
+    """
+    Wrap a ZipFile so that members are compressed by a pool of threads.
+    The number of members waiting to be added is limited to keep memory use
+    down.
+    """
+
+    def __init__(self, archive, workers):
+        if archive.compression not in (ZIP_STORED, ZIP_DEFLATED):
+            raise ValueError("Only stored or deflated archives can be compressed in parallel")
+        self.archive = archive
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.pending = deque()
+        self.max_pending = 2 * workers
+
+
+    def writestr(self, arcname, data, compress_type=None):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        zinfo = ZipInfo(arcname, time.localtime(time.time())[:6])
+        if compress_type is None:
+            compress_type = self.archive.compression
+        zinfo.compress_type = compress_type
+        future = self.executor.submit(compress, data, zinfo.compress_type,
+                                      self.archive.compresslevel)
+        self.pending.append((zinfo, future))
+        while len(self.pending) > self.max_pending:
+            self._add_next()
+
+
+    def write(self, filename, arcname):
+        with open(filename, "rb") as src:
+            self.writestr(arcname, src.read())
+
+
+    def write_compressed(self, zinfo, crc, size, data):
+        """
+        Add a member which has already been compressed in turn
+        """
+        future = Future()
+        future.set_result((crc, size, data))
+        self.pending.append((zinfo, future))
+
+
+    def open(self, arcname, mode="w", force_zip64=False):
+        """
+        Return a buffer which is added to the archive when it is closed
+        """
+        if mode != "w":
+            raise ValueError("Members can only be opened for writing")
+        return _Member(self, arcname)
+
+
+    def namelist(self):
+        return self.archive.namelist() + [zinfo.filename for zinfo, _ in self.pending]
+
+
+    def _add_next(self):
+        zinfo, future = self.pending.popleft()
+        write_compressed(self.archive, zinfo, *future.result())
+
+
+    def close(self):
+        try:
+            while self.pending:
+                self._add_next()
+        finally:
+            self.executor.shutdown()
+        self.archive.close()
+
+
+class _Member(BytesIO):
+
+    def __init__(self, archive, arcname):
+        super().__init__()
+        self.archive = archive
+        self.arcname = arcname
+
+
+    def close(self):
+        if not self.closed:
+            self.archive.writestr(self.arcname, self.getvalue())
+        super().close()
@@ -3,8 +3,9 @@
 
 # Python stdlib imports
 import datetime
+import hashlib
 import re
-from zipfile import ZipFile, ZIP_DEFLATED
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 
 # package imports
 from openpyxl.utils.exceptions import InvalidFileException
@@ -18,22 +19,40 @@ from openpyxl.xml.constants import (
     ARC_THEME,
     ARC_STYLE,
     ARC_WORKBOOK,
+    ARC_SHARED_STRINGS,
+    SHARED_STRINGS,
     )
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxl.xml.functions import tostring, fromstring
-from openpyxl.packaging.manifest import Manifest
+from openpyxl.packaging.manifest import Manifest, Override
 from openpyxl.packaging.relationship import (
     get_rels_path,
     RelationshipList,
     Relationship,
 )
+from openpyxl.packaging._raw import RawCopier
 from openpyxl.comments.comment_sheet import CommentSheet
 from openpyxl.styles.stylesheet import write_stylesheet
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.worksheet._lazy import LazyWorksheet, source_strings
 from openpyxl.worksheet._writer import WorksheetWriter
 from openpyxl.workbook._writer import WorkbookWriter
+from ._archive import ParallelArchive, copy_member
+from .strings import write_string_table
 from .theme import theme_xml
 
 
+# parts which are kept when preserving VBA
+ARC_VBA = re.compile("|".join(
+    ('xl/vba', r'xl/drawings/.*vmlDrawing\d+\.vml',
+     'xl/ctrlProps', 'customUI', 'xl/activeX', r'xl/media/.*\.emf')
+))
+
+
+# image formats which are already compressed
+COMPRESSED_IMAGES = frozenset(['gif', 'jpeg', 'png'])
+
+
 class ExcelWriter:
     """Write a workbook object to an Excel file."""
 
@@ -45,9 +64,12 @@ class ExcelWriter:
         self._tables = []
         self._charts = []
         self._images = []
+        self._media = {} # images keyed by format and content
+        self._image_data = {}
         self._drawings = []
         self._comments = []
         self._pivots = []
+        self._raw = RawCopier(archive, self.manifest)
 
 
     def write_data(self):
@@ -74,17 +96,22 @@ class ExcelWriter:
             custom_override = CustomOverride()
             self.manifest.append(custom_override)
 
+        if not self.workbook.write_only:
+            # rows of write-only worksheets have already been streamed
+            self.workbook.shared_strings = IndexedList(source_strings(self.workbook))
+
         self._write_worksheets()
         self._write_chartsheets()
         self._write_images()
         self._write_charts()
 
+        self._write_strings()
         self._write_external_links()
 
         stylesheet = write_stylesheet(self.workbook)
         archive.writestr(ARC_STYLE, tostring(stylesheet))
 
-        writer = WorkbookWriter(self.workbook)
+        writer = WorkbookWriter(self.workbook, self._raw.pivot_caches)
         archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
         archive.writestr(ARC_WORKBOOK, writer.write())
         archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
@@ -95,25 +122,49 @@ class ExcelWriter:
 
     def _merge_vba(self):
         """
-        If workbook contains macros then extract associated files from cache
-        of old file and add to archive
+        If workbook contains macros then copy associated files from cache
+        of old file to the archive without recompressing them
         """
-        ARC_VBA = re.compile("|".join(
-            ('xl/vba', r'xl/drawings/.*vmlDrawing\d\.vml',
-             'xl/ctrlProps', 'customUI', 'xl/activeX', r'xl/media/.*\.emf')
-        )
-                             )
+        vba_archive = self.workbook.vba_archive
+        if vba_archive:
+            for name in vba_archive.namelist():
+                if name not in self.vba_modified and ARC_VBA.match(name):
+                    copy_member(vba_archive, name, self._archive)
+
 
-        if self.workbook.vba_archive:
-            for name in set(self.workbook.vba_archive.namelist()) - self.vba_modified:
-                if ARC_VBA.match(name):
-                    self._archive.writestr(name, self.workbook.vba_archive.read(name))
+    def _write_strings(self):
+        strings = self.workbook.shared_strings
+        if strings:
+            self._archive.writestr(ARC_SHARED_STRINGS, write_string_table(strings))
+            self.manifest.Override.append(Override("/" + ARC_SHARED_STRINGS, SHARED_STRINGS))
 
 
     def _write_images(self):
         # delegate to object
         for img in self._images:
-            self._archive.writestr(img.path[1:], img._data())
+            compress_type = None
+            if img.format in COMPRESSED_IMAGES:
+                compress_type = ZIP_STORED
+            data = self._image_data.pop(img, None)
+            if data is None:
+                data = img._data()
+            self._archive.writestr(img.path[1:], data, compress_type=compress_type)
+
+
+    def _add_image(self, img):
+        """
+        Identical images are only stored once
+        """
+        data = img._data()
+        key = (img.format, hashlib.sha256(data).digest())
+        known = self._media.get(key)
+        if known is not None:
+            img._id = known._id
+            return
+        self._images.append(img)
+        img._id = len(self._images)
+        self._media[key] = img
+        self._image_data[img] = data
 
 
     def _write_charts(self):
@@ -135,8 +186,7 @@ class ExcelWriter:
             self._charts.append(chart)
             chart._id = len(self._charts)
         for img in drawing.images:
-            self._images.append(img)
-            img._id = len(self._images)
+            self._add_image(img)
         rels_path = get_rels_path(drawing.path)[1:]
         self._archive.writestr(drawing.path[1:], tostring(drawing._write()))
         self._archive.writestr(rels_path, tostring(drawing._write_rels()))
@@ -195,14 +245,19 @@ class ExcelWriter:
             if not ws.closed:
                 ws.close()
             writer = ws._writer
+            writer.copy_to(self._archive, ws.path[1:])
+            writer.cleanup()
         else:
-            writer = WorksheetWriter(ws)
-            writer.write()
+            # stream directly into the archive, the size is not known
+            with self._archive.open(ws.path[1:], "w", force_zip64=True) as out:
+                writer = WorksheetWriter(ws, out)
+                writer.write()
 
         ws._rels = writer._rels
-        self._archive.write(writer.out, ws.path[1:])
+        for rel, part in writer._raw:
+            rel.Target = "/" + self._raw.copy(part)
+        self.vba_modified.update(self._raw.names)
         self.manifest.append(ws)
-        writer.cleanup()
 
 
     def _write_worksheets(self):
@@ -212,6 +267,9 @@ class ExcelWriter:
         for idx, ws in enumerate(self.workbook.worksheets, 1):
 
             ws._id = idx
+            if isinstance(ws, LazyWorksheet) and ws._lazy_copy(self._archive):
+                self.manifest.append(ws)
+                continue
             self.write_worksheet(ws)
 
             if ws._drawing:
@@ -276,7 +334,22 @@ class ExcelWriter:
         self._archive.close()
 
 
-def save_workbook(workbook, filename):
+def _open_archive(filename, compression=None):
+    """
+    Open the archive using the compression requested: 0 to store the parts
+    without compression or 1 to 9 for the level of deflate compression.
+    """
+    if compression is None:
+        return ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
+    if compression not in range(10):
+        raise ValueError("Compression must be between 0 (stored) and 9")
+    if compression == 0:
+        return ZipFile(filename, 'w', ZIP_STORED, allowZip64=True)
+    return ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True,
+                   compresslevel=compression)
+
+
+def save_workbook(workbook, filename, workers=None, compression=None):
     """Save the given workbook on the filesystem under the name filename.
 
     :param workbook: the workbook to save
@@ -285,10 +358,22 @@ def save_workbook(workbook, filename):
     :param filename: the path to which save the workbook
     :type filename: string
 
+    :param workers: number of threads used to compress the parts of the workbook
+    :type workers: int
+
+    :param compression: 0 to store the parts without compression or 1 (fastest) to 9 (smallest) for the level of compression
+    :type compression: int
+
     :rtype: bool
 
     """
-    archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
+    source = getattr(workbook, "_source", None)
+    if source is not None:
+        # the workbook may still need to read the file it is saved to
+        source.detach(filename)
+    archive = _open_archive(filename, compression)
+    if workers is not None and workers > 1:
+        archive = ParallelArchive(archive, workers)
     workbook.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
     writer = ExcelWriter(workbook, archive)
     writer.save()
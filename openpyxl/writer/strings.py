@@ -0,0 +1,23 @@
+# Copyright (c) 2010-2024 openpyxl
+
+from io import BytesIO
+
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import Element, SubElement, whitespace, xmlfile
+
+
+def write_string_table(string_table):
+    """Write the string table xml."""
+    out = BytesIO()
+
+    with xmlfile(out) as xf:
+        with xf.element("sst", xmlns=SHEET_MAIN_NS, uniqueCount=f"{len(string_table)}"):
+
+            for key in string_table:
+                el = Element('si')
+                text = SubElement(el, 't')
+                text.text = key
+                whitespace(text)
+                xf.write(el)
+
+    return out.getvalue()
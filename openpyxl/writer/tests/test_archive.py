@@ -0,0 +1,190 @@
+# Copyright (c) 2010-2024 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED, ZIP_BZIP2
+
+import pytest
+
+
+@pytest.fixture
+def ParallelArchive():
+    from .._archive import ParallelArchive
+    return ParallelArchive
+
+
+@pytest.fixture(params=[True, False], ids=["raw", "recompressed"])
+def raw_members(request, monkeypatch):
+    from .. import _archive
+    monkeypatch.setattr(_archive, "RAW_MEMBERS", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("compression", [ZIP_DEFLATED, ZIP_STORED])
+def test_write(ParallelArchive, tmpdir, compression):
+    tmpdir.chdir()
+    with open("data.xml", "wb") as f:
+        f.write(b"<data/>" * 1000)
+
+    out = BytesIO()
+    archive = ParallelArchive(ZipFile(out, "w", compression), workers=2)
+    for idx in range(10):
+        archive.writestr(f"part{idx}.xml", f"<part{idx}/>" * idx)
+    archive.write("data.xml", "data.xml")
+    assert archive.namelist()[-1] == "data.xml"
+    archive.close()
+
+    archive = ZipFile(out)
+    assert archive.testzip() is None
+    assert archive.namelist() == [f"part{idx}.xml" for idx in range(10)] + ["data.xml"]
+    assert archive.read("part3.xml") == b"<part3/>" * 3
+    assert archive.read("data.xml") == b"<data/>" * 1000
+    assert {info.compress_type for info in archive.infolist()} == {compression}
+
+
+def test_unsupported_compression(ParallelArchive):
+    with pytest.raises(ValueError):
+        ParallelArchive(ZipFile(BytesIO(), "w", ZIP_BZIP2), workers=2)
+
+
+def test_write_stored(ParallelArchive):
+    out = BytesIO()
+    archive = ParallelArchive(ZipFile(out, "w", ZIP_DEFLATED), workers=2)
+    archive.writestr("image.png", b"\x89PNG" * 100, compress_type=ZIP_STORED)
+    archive.close()
+
+    archive = ZipFile(out)
+    info = archive.getinfo("image.png")
+    assert info.compress_type == ZIP_STORED
+    assert archive.read("image.png") == b"\x89PNG" * 100
+
+
+def test_open(ParallelArchive):
+    out = BytesIO()
+    archive = ParallelArchive(ZipFile(out, "w", ZIP_DEFLATED), workers=2)
+    with archive.open("sheet1.xml", "w") as dest:
+        dest.write(b"<worksheet/>")
+    assert archive.namelist() == ["sheet1.xml"]
+    archive.close()
+
+    archive = ZipFile(out)
+    assert archive.read("sheet1.xml") == b"<worksheet/>"
+
+
+@pytest.mark.parametrize("compression", [ZIP_DEFLATED, ZIP_STORED])
+def test_copy_member(compression, raw_members):
+    from .._archive import copy_member
+
+    source = ZipFile(BytesIO(), "w", compression)
+    source.writestr("sheet1.xml", b"<worksheet/>" * 100)
+
+    out = BytesIO()
+    archive = ZipFile(out, "w")
+    copy_member(source, "sheet1.xml", archive, "sheet2.xml")
+    archive.close()
+
+    archive = ZipFile(out)
+    assert archive.testzip() is None
+    assert archive.read("sheet2.xml") == b"<worksheet/>" * 100
+    assert archive.getinfo("sheet2.xml").compress_type == compression
+
+
+def test_copy_member_parallel(ParallelArchive, raw_members):
+    from .._archive import copy_member
+
+    source = ZipFile(BytesIO(), "w", ZIP_DEFLATED)
+    source.writestr("sheet1.xml", b"<worksheet/>")
+
+    out = BytesIO()
+    archive = ParallelArchive(ZipFile(out, "w"), workers=2)
+    archive.writestr("first.xml", b"<first/>")
+    copy_member(source, "sheet1.xml", archive)
+    archive.close()
+
+    archive = ZipFile(out)
+    assert archive.namelist() == ["first.xml", "sheet1.xml"]
+    assert archive.read("sheet1.xml") == b"<worksheet/>"
+
+
+class PublicZipFile:
+    """
+    Only the public interface of a ZipFile
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+
+
+    def getinfo(self, name):
+        return self.archive.getinfo(name)
+
+
+    def read(self, name):
+        return self.archive.read(name)
+
+
+    def writestr(self, zinfo, data):
+        self.archive.writestr(zinfo, data)
+
+
+@pytest.mark.parametrize("compression", [ZIP_DEFLATED, ZIP_STORED])
+@pytest.mark.parametrize("public", [False, True])
+def test_write_compressed(tmpdir, compression, public, raw_members):
+    from zipfile import ZipInfo
+    from .._archive import compress, write_compressed, read_compressed
+
+    tmpdir.chdir()
+    archive = ZipFile("compressed.zip", "w")
+    archive.writestr("first.xml", b"<first/>")
+    dest = archive
+    if public:
+        dest = PublicZipFile(archive)
+    zinfo = ZipInfo("sheet1.xml")
+    zinfo.compress_type = compression
+    write_compressed(dest, zinfo, *compress(b"<worksheet/>" * 100, compression))
+    archive.writestr("last.xml", b"<last/>")
+    archive.close()
+
+    archive = ZipFile("compressed.zip")
+    assert archive.testzip() is None
+    assert archive.namelist() == ["first.xml", "sheet1.xml", "last.xml"]
+    assert archive.read("sheet1.xml") == b"<worksheet/>" * 100
+    source = archive
+    if public:
+        source = PublicZipFile(archive)
+    zinfo, data = read_compressed(source, "sheet1.xml")
+    assert zinfo.compress_type == compression
+    assert data == compress(b"<worksheet/>" * 100, compression)[2]
+
+
+def test_raw_members():
+    from .._archive import _raw_members
+    assert _raw_members() is True
+
+
+def test_raw_members_unavailable(monkeypatch):
+    import zipfile
+    from .._archive import _raw_members
+    monkeypatch.delattr(zipfile, "structFileHeader")
+    assert _raw_members() is False
+
+
+def test_copy_member_unchanged(raw_members):
+    """
+    Only raw copies keep the compressed data of the source
+    """
+    from .._archive import copy_member
+
+    data = b"<worksheet/>" * 100
+    source = ZipFile(BytesIO(), "w", ZIP_DEFLATED, compresslevel=1)
+    source.writestr("sheet1.xml", data)
+    compressed = source.getinfo("sheet1.xml").compress_size
+
+    out = BytesIO()
+    archive = ZipFile(out, "w")
+    copy_member(source, "sheet1.xml", archive)
+    archive.close()
+
+    archive = ZipFile(out)
+    assert archive.read("sheet1.xml") == data
+    size = archive.getinfo("sheet1.xml").compress_size
+    assert (size == compressed) is raw_members
@@ -5,7 +5,7 @@ from io import BytesIO
 import os
 from string import ascii_letters
 import datetime
-from zipfile import ZipFile
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 
 import pytest
 
@@ -39,6 +39,16 @@ def test_worksheet(ExcelWriter, archive):
     assert ws.path in writer.manifest.filenames
 
 
+def test_worksheet_zip64(ExcelWriter, archive):
+    # worksheets are streamed into the archive before their size is known
+    wb = Workbook()
+    ws = wb.active
+    writer = ExcelWriter(wb, archive)
+    writer._write_worksheets()
+
+    assert archive.getinfo(ws.path[1:]).extract_version >= 45
+
+
 def test_tables(ExcelWriter, archive):
     wb = Workbook()
     ws = wb.active
@@ -98,8 +108,35 @@ def test_write_images(datadir, ExcelWriter, archive):
     writer._write_images()
     archive.close()
 
-    zipinfo = archive.infolist()
-    assert 'xl/media/image1.png' in archive.namelist()
+    zipinfo = archive.getinfo('xl/media/image1.png')
+    assert zipinfo.compress_type == ZIP_STORED
+
+
+@pytest.mark.pil_required
+def test_duplicate_images(datadir, ExcelWriter, archive):
+    from openpyxl.drawing.image import Image, PILImage
+    datadir.chdir()
+
+    wb = Workbook()
+    with open("plain.png", "rb") as src:
+        data = src.read()
+    other = BytesIO()
+    PILImage.new("RGB", (4, 3)).save(other, format="GIF")
+    images = [Image(data), Image("plain.png"), Image(other.getvalue())]
+    for img in images:
+        ws = wb.create_sheet()
+        ws.add_image(img)
+
+    writer = ExcelWriter(wb, archive)
+    writer._write_worksheets()
+    writer._write_images()
+    archive.close()
+
+    assert [img.path for img in images] == ['/xl/media/image1.png',
+                                            '/xl/media/image1.png',
+                                            '/xl/media/image2.gif']
+    media = [n for n in archive.namelist() if n.startswith("xl/media")]
+    assert media == ['xl/media/image1.png', 'xl/media/image2.gif']
 
 
 def test_chartsheet(ExcelWriter, archive):
@@ -174,6 +211,33 @@ def test_duplicate_chart(ExcelWriter, archive):
         writer._write_charts()
 
 
+def test_shared_strings(ExcelWriter, archive):
+    from openpyxl.reader.strings import read_string_table
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["open", "closed", "open"])
+
+    writer = ExcelWriter(wb, archive)
+    writer.write_data()
+
+    assert "xl/sharedStrings.xml" in archive.namelist()
+    assert "/xl/sharedStrings.xml" in writer.manifest.filenames
+    with archive.open("xl/sharedStrings.xml") as src:
+        assert read_string_table(src) == ["open", "closed"]
+
+
+def test_inline_strings(ExcelWriter, archive):
+    wb = Workbook(inline_strings=True)
+    ws = wb.active
+    ws.append(["open", "closed", "open"])
+
+    writer = ExcelWriter(wb, archive)
+    writer.write_data()
+
+    assert "xl/sharedStrings.xml" not in archive.namelist()
+
+
 def test_write_empty_workbook(tmpdir):
     tmpdir.chdir()
     wb = Workbook()
@@ -194,3 +258,53 @@ def test_modified(tmpdir):
     dest_filename = 'empty_book.xlsx'
     save_workbook(wb, dest_filename)
     assert wb.properties.modified > modified
+
+
+def test_save_workers(tmpdir):
+    from ..excel import save_workbook
+
+    tmpdir.chdir()
+    wb = Workbook()
+    for idx in range(4):
+        ws = wb.create_sheet()
+        for row in range(100):
+            ws.append([row, f"{row % 7}", "=A1"])
+        chart = BarChart()
+        ws.add_chart(chart)
+
+    save_workbook(wb, "serial.xlsx")
+    save_workbook(wb, "parallel.xlsx", workers=3)
+
+    serial = ZipFile("serial.xlsx")
+    parallel = ZipFile("parallel.xlsx")
+    assert parallel.testzip() is None
+    assert serial.namelist() == parallel.namelist()
+    for name in serial.namelist():
+        if name == "docProps/core.xml": # modification time
+            continue
+        assert serial.read(name) == parallel.read(name), name
+
+
+@pytest.mark.parametrize("compression, compress_type",
+                         [(None, ZIP_DEFLATED), (0, ZIP_STORED), (1, ZIP_DEFLATED), (9, ZIP_DEFLATED)]
+                         )
+def test_save_compression(tmpdir, compression, compress_type):
+    from ..excel import save_workbook
+
+    tmpdir.chdir()
+    wb = Workbook()
+    wb.active.append(["compressed"])
+    save_workbook(wb, "compression.xlsx", compression=compression)
+
+    archive = ZipFile("compression.xlsx")
+    assert archive.testzip() is None
+    assert {info.compress_type for info in archive.infolist()} == {compress_type}
+
+
+@pytest.mark.parametrize("compression", [-1, 10, "fast"])
+def test_invalid_compression(tmpdir, compression):
+    from ..excel import save_workbook
+
+    tmpdir.chdir()
+    with pytest.raises(ValueError):
+        save_workbook(Workbook(), "compression.xlsx", compression=compression)
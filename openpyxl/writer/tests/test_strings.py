@@ -0,0 +1,29 @@
+# Copyright (c) 2010-2024 openpyxl
+
+from openpyxl.tests.helper import compare_xml
+
+
+def test_write_string_table(datadir):
+    from ..strings import write_string_table
+
+    datadir.chdir()
+    table = ['This is cell A1 in Sheet 1', 'This is cell G5']
+    content = write_string_table(table)
+    with open('sharedStrings.xml') as expected:
+        diff = compare_xml(content, expected.read())
+        assert diff is None, diff
+
+
+def test_preserve_space():
+    from ..strings import write_string_table
+
+    content = write_string_table([' padded '])
+    expected = """
+    <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" uniqueCount="1">
+      <si>
+        <t xml:space="preserve"> padded </t>
+      </si>
+    </sst>
+    """
+    diff = compare_xml(content, expected)
+    assert diff is None, diff